@@ -0,0 +1,108 @@
+"""Measure polster CLI startup time against a budget.
+
+Runs each command in a fresh interpreter several times and reports the
+median wall time next to the time spent importing ``polster.cli``
+(from ``python -X importtime``). Exits with status 1 when a median exceeds
+its budget, so it can run in CI.
+
+Usage:
+    python scripts/bench_startup.py [--runs 15] [--budget-scale 1.0]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+# Median wall time budgets in milliseconds, including interpreter startup
+BUDGETS_MS = {
+    "polster --version": 50,
+    "polster --help": 250,
+    "import polster.cli": 120,
+}
+
+COMMANDS = {
+    "polster --version": ["-m", "polster.launcher", "--version"],
+    "polster --help": ["-m", "polster.launcher", "--help"],
+    "import polster.cli": ["-c", "import polster.cli"],
+}
+
+
+def bench_env() -> dict[str, str]:
+    """Environment that imports polster from this checkout."""
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(SRC_DIR) + os.pathsep + env.get("PYTHONPATH", "")
+    return env
+
+
+def time_command(args: list[str], runs: int) -> list[float]:
+    """Wall times in milliseconds of running the interpreter with args."""
+    env = bench_env()
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, *args],
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def import_breakdown(module: str, top: int = 8) -> list[tuple[int, str]]:
+    """Slowest cumulative imports (microseconds, module) for a module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=bench_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        rows.append((int(cumulative), name.rstrip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark polster CLI startup")
+    parser.add_argument("--runs", type=int, default=15, help="Runs per command")
+    parser.add_argument(
+        "--budget-scale",
+        type=float,
+        default=1.0,
+        help="Multiply budgets, e.g. 2.0 on slow CI machines",
+    )
+    args = parser.parse_args()
+
+    baseline = statistics.median(time_command(["-c", "pass"], args.runs))
+    print(f"{'interpreter startup':<22} {baseline:7.1f} ms")
+
+    over_budget = False
+    for label, command in COMMANDS.items():
+        median = statistics.median(time_command(command, args.runs))
+        budget = BUDGETS_MS[label] * args.budget_scale
+        verdict = "ok" if median <= budget else "OVER BUDGET"
+        over_budget = over_budget or median > budget
+        print(f"{label:<22} {median:7.1f} ms  (budget {budget:.0f} ms) {verdict}")
+
+    print("\nSlowest imports of polster.cli (cumulative):")
+    for cumulative, name in import_breakdown("polster.cli"):
+        print(f"  {cumulative / 1000:7.1f} ms  {name}")
+
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
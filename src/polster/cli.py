@@ -1,16 +1,27 @@
-"""CLI entry point for Polster."""
+"""CLI entry point for Polster.
 
+Heavier modules (rich prompts and tables, the asset index, graph and status
+code) are imported inside the commands that use them, so ``polster --help``
+and quick commands stay fast.
+"""
+
+import json
 import os
 import platform
 import re
 import shutil
 import subprocess
 import sys
+import time
+from contextlib import contextmanager
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 from rich import print as rprint
-from rich.prompt import Confirm, Prompt
+
+if TYPE_CHECKING:
+    from polster.graph import AssetGraph
 
 app = typer.Typer(help="Polster CLI - Generate data orchestration projects and assets")
 
@@ -56,6 +67,15 @@ def validate_asset_name(name: str) -> str:
     return name
 
 
+def validate_pool_name(pool: str) -> str:
+    """Validate resource pool name (snake_case)."""
+    if not re.match(r"^[a-z][a-z0-9_]*$", pool):
+        raise typer.BadParameter(
+            "Pool name must be lowercase snake_case (e.g. adls, mysql, cpu)."
+        )
+    return pool
+
+
 def copy_template_file(
     src: Path, dest: Path, replacements: dict[str, str] | None = None
 ) -> None:
@@ -66,10 +86,44 @@ def copy_template_file(
         shutil.copy2(src, dest)
         return
 
-    content = src.read_text(encoding='utf-8')
+    dest.write_text(render_template(src, replacements), encoding='utf-8')
+
+
+def render_template(src: Path, replacements: dict[str, str]) -> str:
+    """Render a template file with string replacements."""
+    content = src.read_text(encoding="utf-8")
     for key, value in replacements.items():
         content = content.replace(key, value)
-    dest.write_text(content, encoding='utf-8')
+    return content
+
+
+def write_files_atomically(files: dict[Path, str]) -> None:
+    """Write all files or none of them.
+
+    Every file is first staged next to its destination. Only when all files are
+    staged are they moved into place; on failure the staged files are removed
+    and files that were already replaced are restored.
+    """
+    staged: dict[Path, Path] = {}
+    originals: dict[Path, str | None] = {}
+    try:
+        for dest, content in files.items():
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            tmp = dest.with_name(f".{dest.name}.polster-tmp")
+            tmp.write_text(content, encoding="utf-8")
+            staged[dest] = tmp
+        for dest, tmp in staged.items():
+            originals[dest] = dest.read_text(encoding="utf-8") if dest.exists() else None
+            os.replace(tmp, dest)
+    except BaseException:
+        for tmp in staged.values():
+            tmp.unlink(missing_ok=True)
+        for dest, original in originals.items():
+            if original is None:
+                dest.unlink(missing_ok=True)
+            else:
+                dest.write_text(original, encoding="utf-8")
+        raise
 
 
 def ensure_polster_project() -> Path:
@@ -88,87 +142,47 @@ def ensure_polster_project() -> Path:
     return cwd
 
 
+def project_python(project_path: Path) -> Path:
+    """Interpreter of the project's .venv, or the current one without a venv."""
+    if os.name == "nt":
+        venv_python = project_path / ".venv" / "Scripts" / "python.exe"
+    else:
+        venv_python = project_path / ".venv" / "bin" / "python"
+    return venv_python if venv_python.exists() else Path(sys.executable)
+
+
 def get_existing_assets(layer: str, project_path: Path) -> list[str]:
     """Get existing asset names from upstream layers."""
-    assets = []
+    from polster.index import load_index
+
     upstream_layers = []
     if layer == "silver":
         upstream_layers = ["bronze"]
     elif layer == "gold":
         upstream_layers = ["silver"]
 
-    for up_layer in upstream_layers:
-        init_file = (
-            project_path / "src" / "orchestration" / "assets" / up_layer / "__init__.py"
-        )
-        if init_file.exists():
-            content = init_file.read_text()
-            # Extract asset function names from imports
-            for line in content.splitlines():
-                line = line.strip()
-                if line.startswith("from orchestration.assets.") and "import" in line:
-                    # from orchestration.assets.bronze.run_bronze_customers import run_bronze_customers
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        asset_name = parts[-1]  # run_bronze_customers
-                        if asset_name.startswith(f"run_{up_layer}_"):
-                            assets.append(asset_name)
-    return sorted(assets)
+    index = load_index(project_path)
+    return sorted(
+        asset.function
+        for up_layer in upstream_layers
+        for asset in index.assets(up_layer)
+    )
 
 
 def get_assets_in_layer(layer: str, project_path: Path) -> list[dict]:
     """Get existing assets in a specific layer with metadata."""
-    assets = []
-    assets_dir = project_path / "src" / "orchestration" / "assets" / layer
-
-    if not assets_dir.exists():
-        return assets
-
-    # Get all asset files in the layer
-    for asset_file in assets_dir.glob("*.py"):
-        if asset_file.name.startswith(f"run_{layer}_") and asset_file.name.endswith(
-            ".py"
-        ):
-            asset_name = asset_file.name[
-                len(f"run_{layer}_") : -3
-            ]  # Remove prefix and .py
-
-            # Try to get description from the asset file
-            description = f"{layer.title()} asset for {asset_name}"
-            try:
-                content = asset_file.read_text()
-                # Look for description in the @asset decorator
-                for line in content.splitlines():
-                    if 'description="' in line or "description='" in line:
-                        # Extract description from the line
-                        desc_match = re.search(r'description=["\']([^"\']+)["\']', line)
-                        if desc_match:
-                            description = desc_match.group(1)
-                            break
-            except Exception:
-                pass
-
-            # Count dependencies by checking the deps parameter
-            dep_count = 0
-            try:
-                content = asset_file.read_text()
-                if "deps=[" in content or "deps=" in content:
-                    # Simple count - could be improved with proper parsing
-                    dep_count = content.count("run_")
-            except Exception:
-                pass
-
-            assets.append(
-                {
-                    "name": asset_name,
-                    "full_name": f"run_{layer}_{asset_name}",
-                    "description": description,
-                    "dep_count": dep_count,
-                    "file_path": asset_file,
-                }
-            )
-
-    return sorted(assets, key=lambda x: x["name"])
+    from polster.index import load_index
+
+    return [
+        {
+            "name": asset.name,
+            "full_name": asset.function,
+            "description": asset.description,
+            "dep_count": len(asset.deps),
+            "file_path": project_path / asset.file,
+        }
+        for asset in load_index(project_path).assets(layer)
+    ]
 
 
 def parse_asset_selection(choice: str, max_index: int) -> list[int]:
@@ -200,44 +214,431 @@ def parse_asset_selection(choice: str, max_index: int) -> list[int]:
 def check_asset_dependencies(
     asset_name: str, layer: str, project_path: Path
 ) -> list[str]:
-    """Check which assets depend on the given asset."""
-    dependent_assets = []
-    all_layers = ["bronze", "silver", "gold"]
+    """Check which assets depend on the given asset, directly or transitively."""
+    from polster.graph import AssetGraph
+    from polster.index import load_index
+
+    graph = AssetGraph.from_index(load_index(project_path))
+    try:
+        dependents = graph.downstream_of(f"run_{layer}_{asset_name}")
+    except KeyError:
+        return []
+    return [
+        f"{graph.assets[name].layer}_{graph.assets[name].name}"
+        for name in dependents
+        if name in graph.assets
+    ]
+
+
+def resolve_asset_ref(ref: str, graph: "AssetGraph") -> str:
+    """Resolve 'run_silver_orders', 'silver.orders' or 'orders' to a graph node."""
+    if ref in graph.upstream:
+        return ref
+    if "." in ref:
+        layer, name = ref.split(".", 1)
+        candidate = f"run_{layer}_{name}"
+        if candidate in graph.upstream:
+            return candidate
+    matches = [a.function for a in graph.assets.values() if a.name == ref]
+    if len(matches) == 1:
+        return matches[0]
+    if matches:
+        raise typer.BadParameter(
+            f"'{ref}' is ambiguous ({', '.join(sorted(matches))}); use layer.name"
+        )
+    raise typer.BadParameter(f"Asset '{ref}' not found")
+
+
+def asset_file_paths(layer: str, asset_name: str, project_path: Path) -> tuple[Path, Path]:
+    """Return the core and orchestration file paths for an asset."""
+    core_file = project_path / "src" / "core" / f"{layer}_{asset_name}.py"
+    orch_file = (
+        project_path
+        / "src"
+        / "orchestration"
+        / "assets"
+        / layer
+        / f"run_{layer}_{asset_name}.py"
+    )
+    return core_file, orch_file
 
-    for check_layer in all_layers:
-        if check_layer == layer:
-            continue  # Don't check within the same layer
 
-        assets_dir = project_path / "src" / "orchestration" / "assets" / check_layer
-        if not assets_dir.exists():
+def layer_init_file(layer: str, project_path: Path) -> Path:
+    """Return the __init__.py that registers the assets of a layer."""
+    return project_path / "src" / "orchestration" / "assets" / layer / "__init__.py"
+
+
+def read_sample_schema(sample: Path, project_path: Path) -> list[tuple[str, str]]:
+    """Columns of a sample file as (name, polars dtype source) pairs.
+
+    Read with the project's Python, which has polars installed.
+    """
+    result = subprocess.run(
+        [
+            str(project_python(project_path)),
+            str(Path(__file__).parent / "sample_schema.py"),
+            str(sample.resolve()),
+        ],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        rprint(f"[red]Could not read schema from {sample}:[/red]")
+        rprint(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "")
+        raise typer.Exit(1)
+    return [(name, dtype) for name, dtype in json.loads(result.stdout)]
+
+
+def render_schema(columns: list[tuple[str, str]] | None) -> str:
+    """Python source of a ``pl.Schema`` constant (``None`` without columns)."""
+    if not columns:
+        return "None"
+    lines = [f"        {json.dumps(name)}: {dtype}," for name, dtype in columns]
+    return "pl.Schema(\n    {\n" + "\n".join(lines) + "\n    }\n)"
+
+
+def render_asset_files(
+    layer: str,
+    asset_name: str,
+    deps: list[str],
+    pool: str,
+    project_path: Path,
+    schema: str = "None",
+) -> dict[Path, str]:
+    """Render the core and orchestration files for a new asset."""
+    template_dir = Path(__file__).parent / "templates" / "assets"
+    core_template = template_dir / f"core_{layer}.py"
+    orch_template = template_dir / f"orch_{layer}.py"
+
+    if not core_template.exists() or not orch_template.exists():
+        rprint(f"[red]Template files not found for layer: {layer}[/red]")
+        raise typer.Exit(1)
+
+    replacements = {
+        "{{ASSET_NAME}}": asset_name,
+        "{{DEPS}}": str(deps),
+        "{{POOL}}": pool,
+        "{{SCHEMA}}": schema,
+    }
+    core_file, orch_file = asset_file_paths(layer, asset_name, project_path)
+    return {
+        core_file: render_template(core_template, replacements),
+        orch_file: render_template(orch_template, replacements),
+    }
+
+
+def _format_all(names: list[str]) -> str:
+    """Format an __all__ assignment, wrapping it when it gets long."""
+    line = "__all__ = [" + ", ".join(f'"{name}"' for name in names) + "]"
+    if len(line) <= 88:
+        return line
+    return "__all__ = [\n" + "".join(f'    "{name}",\n' for name in names) + "]"
+
+
+def register_assets_in_init(content: str, layer: str, function_names: list[str]) -> str:
+    """Add asset imports and __all__ entries to a layer's __init__.py content."""
+    import ast
+
+    new_imports = [
+        f"from orchestration.assets.{layer}.{name} import {name}"
+        for name in function_names
+    ]
+    new_imports = [line for line in new_imports if line not in content]
+
+    match = re.search(r"^__all__\s*=\s*\[(.*?)\]", content, re.MULTILINE | re.DOTALL)
+    if match is None:
+        if new_imports:
+            content = content.rstrip("\n") + "\n\n" + "\n".join(new_imports) + "\n"
+        return content
+
+    exported = list(ast.literal_eval(f"[{match.group(1)}]"))
+    exported += [name for name in function_names if name not in exported]
+
+    head = content[: match.start()].rstrip("\n")
+    if new_imports:
+        head += "\n" + "\n".join(new_imports)
+    return head + "\n\n" + _format_all(exported) + content[match.end() :]
+
+
+def load_asset_spec(spec_file: Path) -> list[dict]:
+    """Load asset definitions from a YAML, JSON or CSV spec file.
+
+    YAML and JSON specs hold a list of assets (or a mapping with an ``assets``
+    list); CSV specs have ``layer``, ``name``, ``deps``, ``pool`` and optional
+    ``schema_from`` columns with dependencies separated by semicolons. Sample
+    paths in ``schema_from`` are relative to the spec file.
+    """
+    suffix = spec_file.suffix.lower()
+    text = spec_file.read_text(encoding="utf-8")
+
+    if suffix == ".csv":
+        import csv
+        import io
+
+        return [
+            {key.strip(): (value or "").strip() for key, value in row.items() if key}
+            for row in csv.DictReader(io.StringIO(text))
+        ]
+
+    if suffix in {".yaml", ".yml"}:
+        try:
+            import yaml
+        except ModuleNotFoundError:
+            raise typer.BadParameter(
+                "Reading YAML specs requires PyYAML: pip install pyyaml"
+            ) from None
+        data = yaml.safe_load(text)
+    elif suffix == ".json":
+        data = json.loads(text)
+    else:
+        raise typer.BadParameter("Spec file must be .yaml, .yml, .json or .csv")
+
+    if isinstance(data, dict):
+        data = data.get("assets")
+    if not isinstance(data, list) or not all(isinstance(e, dict) for e in data):
+        raise typer.BadParameter("Spec file must contain a list of assets")
+    return data
+
+
+def _normalize_dep(dep: str, layer: str) -> str:
+    """Turn 'run_bronze_x', 'bronze.x' or a bare 'x' into an asset function name."""
+    dep = dep.strip()
+    if dep.startswith("run_"):
+        return dep
+    if "." in dep:
+        dep_layer, dep_name = dep.split(".", 1)
+        return f"run_{dep_layer}_{dep_name}"
+    upstream = "bronze" if layer == "silver" else "silver"
+    return f"run_{upstream}_{dep}"
+
+
+def plan_asset_batch(
+    entries: list[dict], project_path: Path
+) -> tuple[list[dict], list[str]]:
+    """Validate a batch of asset definitions as a whole.
+
+    Returns the normalized assets and a list of errors. Dependencies may point
+    at assets that already exist in the project or at other assets in the
+    batch, and must follow the medallion rules (silver -> bronze, gold -> silver).
+    """
+    errors: list[str] = []
+    planned: list[dict] = []
+    seen: set[str] = set()
+
+    for number, entry in enumerate(entries, 1):
+        label = f"Asset #{number}"
+        layer = str(entry.get("layer") or "").lower()
+        name = str(entry.get("name") or "")
+        if layer not in ["bronze", "silver", "gold"]:
+            errors.append(f"{label}: layer must be one of: bronze, silver, gold")
+            continue
+        try:
+            name = validate_asset_name(name)
+            pool = validate_pool_name(str(entry.get("pool") or "cpu").lower())
+        except typer.BadParameter as e:
+            errors.append(f"{label} ({layer}.{name}): {e.message}")
             continue
 
-        for asset_file in assets_dir.glob("*.py"):
-            try:
-                content = asset_file.read_text()
-                # Look for the asset name in deps
-                if f"run_{layer}_{asset_name}" in content:
-                    # Extract the asset name from filename
-                    file_asset_name = asset_file.name[len(f"run_{check_layer}_") : -3]
-                    dependent_assets.append(f"{check_layer}_{file_asset_name}")
-            except Exception:
-                continue
+        function_name = f"run_{layer}_{name}"
+        if function_name in seen:
+            errors.append(f"{label}: {layer}.{name} is defined more than once")
+            continue
+        seen.add(function_name)
+
+        core_file, orch_file = asset_file_paths(layer, name, project_path)
+        if core_file.exists() or orch_file.exists():
+            errors.append(f"{label}: files for {layer}.{name} already exist")
+
+        raw_deps = entry.get("deps")
+        if isinstance(raw_deps, str):
+            raw_deps = [d for d in re.split(r"[;,|\s]+", raw_deps) if d]
+            if raw_deps == ["none"]:
+                raw_deps = []
+            elif not raw_deps:
+                raw_deps = None
+        if raw_deps is None:
+            # Same default as the interactive flow: depend on the upstream namesake
+            raw_deps = [] if layer == "bronze" else [name]
+        elif layer == "bronze" and raw_deps:
+            errors.append(f"{label}: bronze assets cannot have dependencies")
+            raw_deps = []
+
+        planned.append(
+            {
+                "layer": layer,
+                "name": name,
+                "function": function_name,
+                "pool": pool,
+                "deps": [_normalize_dep(str(dep), layer) for dep in raw_deps],
+                "schema_from": str(entry.get("schema_from") or "") or None,
+            }
+        )
+
+    # Resolve dependencies against the project and the rest of the batch
+    for asset in planned:
+        if asset["layer"] == "bronze":
+            continue
+        upstream = "bronze" if asset["layer"] == "silver" else "silver"
+        available = set(get_existing_assets(asset["layer"], project_path))
+        available |= {a["function"] for a in planned if a["layer"] == upstream}
+        for dep in asset["deps"]:
+            if not dep.startswith(f"run_{upstream}_"):
+                errors.append(
+                    f"{asset['layer']}.{asset['name']}: {asset['layer']} assets can "
+                    f"only depend on {upstream} assets (got {dep})"
+                )
+            elif dep not in available:
+                errors.append(
+                    f"{asset['layer']}.{asset['name']}: unknown dependency {dep}"
+                )
+
+    return planned, errors
 
-    return dependent_assets
 
+def run_command(
+    cmd: list[str], cwd: Path | None = None, quiet: bool = False
+) -> bool:
+    """Run a command and return success status.
 
-def run_command(cmd: list[str], cwd: Path | None = None) -> bool:
-    """Run a command and return success status."""
+    With ``quiet`` failures are not printed, for callers that report them
+    later (e.g. from a background thread).
+    """
     try:
         subprocess.run(cmd, cwd=cwd, capture_output=True, text=True, check=True)
         return True
-    except subprocess.CalledProcessError as e:
-        rprint(f"[red]Command failed: {' '.join(cmd)}[/red]")
-        if e.stderr:
-            rprint(f"[red]{e.stderr}[/red]")
+    except (subprocess.CalledProcessError, FileNotFoundError) as e:
+        if not quiet:
+            rprint(f"[red]Command failed: {' '.join(cmd)}[/red]")
+            if getattr(e, "stderr", None):
+                rprint(f"[red]{e.stderr}[/red]")
         return False
 
 
+# Template files that dependency installation needs; rendered first
+INSTALL_FILES = {"pyproject.toml", "README.md"}
+
+
+@contextmanager
+def timed_phase(timings: list[tuple[str, float]], name: str):
+    """Record the wall time of a block under ``name``."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.append((name, time.perf_counter() - start))
+
+
+def print_timings(timings: list[tuple[str, float]], total: float) -> None:
+    """Print per-phase timings; venv and dependencies ran in the background."""
+    rprint("\n[bold]Timings[/bold]")
+    for name, seconds in timings:
+        background = " (background)" if name in {"venv", "dependencies"} else ""
+        rprint(f"  {name:<24} {seconds:7.2f}s{background}")
+    rprint(f"  {'total':<24} {total:7.2f}s")
+
+
+def installer_flags(
+    installer: str, offline: bool, cache_dir: Path | None, wheelhouse: Path | None
+) -> list[str]:
+    """Cache and index flags for ``uv`` or ``pip`` install commands."""
+    flags = []
+    if installer == "uv":
+        if offline:
+            flags.append("--offline")
+        if cache_dir:
+            flags += ["--cache-dir", str(cache_dir)]
+    else:
+        if offline:
+            flags.append("--no-index")
+        if cache_dir:
+            flags += ["--cache-dir", str(cache_dir)]
+    if wheelhouse:
+        flags += ["--find-links", str(wheelhouse)]
+    return flags
+
+
+def install_dependencies(
+    project_path: Path,
+    installer: str,
+    flags: list[str],
+    timings: list[tuple[str, float]],
+) -> list[str]:
+    """Create the venv and install the project's dependencies (not the project).
+
+    Only needs pyproject.toml, so it can run while the remaining templates are
+    rendered. Returns status lines to print once it finishes.
+    """
+    messages = []
+    if installer == "uv":
+        with timed_phase(timings, "venv"):
+            created = run_command(["uv", "venv", *flags], cwd=project_path, quiet=True)
+        if not created:
+            return ["[yellow][WARN][/yellow] Failed to create virtual environment"]
+        messages.append("[green][OK][/green] Created virtual environment with uv")
+        with timed_phase(timings, "dependencies"):
+            installed = run_command(
+                ["uv", "sync", "--extra", "dev", "--no-install-project", *flags],
+                cwd=project_path,
+                quiet=True,
+            )
+    else:
+        from polster.envcache import project_requirements
+
+        with timed_phase(timings, "venv"):
+            created = run_command(
+                [sys.executable, "-m", "venv", ".venv"], cwd=project_path, quiet=True
+            )
+        if not created:
+            return ["[yellow][WARN][/yellow] Failed to create virtual environment"]
+        messages.append("[green][OK][/green] Created virtual environment")
+        with timed_phase(timings, "dependencies"):
+            installed = run_command(
+                [
+                    str(venv_pip(project_path)),
+                    "install",
+                    *flags,
+                    *project_requirements(project_path / "pyproject.toml"),
+                ],
+                cwd=project_path,
+                quiet=True,
+            )
+    if installed:
+        messages.append("[green][OK][/green] Installed dependencies")
+    else:
+        messages.append("[yellow][WARN][/yellow] Failed to pre-install dependencies")
+    return messages
+
+
+def install_project(project_path: Path, installer: str, flags: list[str]) -> bool:
+    """Install the rendered project itself into its venv (editable)."""
+    if installer == "uv":
+        # Dependencies are already in place, so this only adds the project;
+        # fall back to uv pip when the project has no usable lock resolution
+        return run_command(
+            ["uv", "sync", "--extra", "dev", *flags], cwd=project_path, quiet=True
+        ) or run_command(
+            ["uv", "pip", "install", *flags, "-e", ".[dev]"], cwd=project_path
+        )
+    return run_command(
+        [
+            str(venv_pip(project_path)),
+            "install",
+            *flags,
+            "--no-build-isolation",
+            "-e",
+            ".[dev]",
+        ],
+        cwd=project_path,
+    )
+
+
+def venv_pip(project_path: Path) -> Path:
+    """pip executable of a project's .venv."""
+    if os.name == "nt":
+        return project_path / ".venv" / "Scripts" / "pip.exe"
+    return project_path / ".venv" / "bin" / "pip"
+
+
 def _find_available_port(start_port: int = 3000) -> int:
     """Find an available port starting from start_port."""
     import socket
@@ -332,9 +733,36 @@ def init(
     start_dagster: bool = typer.Option(
         False, "--start-dagster", help="Start Dagster UI after project creation"
     ),
+    offline: bool = typer.Option(
+        False,
+        "--offline",
+        envvar="POLSTER_OFFLINE",
+        help="Install only from the local cache/wheelhouse, never the network",
+    ),
+    cache_dir: Path = typer.Option(
+        None,
+        "--cache-dir",
+        envvar="POLSTER_CACHE_DIR",
+        file_okay=False,
+        help="uv/pip cache directory shared between projects",
+    ),
+    wheelhouse: Path = typer.Option(
+        None,
+        "--wheelhouse",
+        envvar="POLSTER_WHEELHOUSE",
+        exists=True,
+        file_okay=False,
+        help="Directory of pre-built wheels to install from (--find-links)",
+    ),
 ) -> None:
     """Initialize a new Polster project."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from rich.prompt import Confirm, Prompt
+
     rprint(f"[bold]Creating new Polster project: {project_name}[/bold]")
+    started = time.perf_counter()
+    timings: list[tuple[str, float]] = []
 
     # Validate project name
     project_name = validate_project_name(project_name)
@@ -357,117 +785,10 @@ def init(
         rprint("[red]Template directory not found.[/red]")
         raise typer.Exit(1)
 
-    # Copy base template
-    def copy_tree(src_dir: Path, dest_dir: Path) -> None:
-        skip_dirs = {
-            ".ruff_cache",
-            "__pycache__",
-            ".git",
-            ".pytest_cache",
-            ".mypy_cache",
-        }
-        for item in src_dir.rglob("*"):
-            if item.is_file():
-                rel_path = item.relative_to(src_dir)
-                if any(part in skip_dirs for part in rel_path.parts):
-                    continue
-                dest_file = dest_dir / rel_path
-                replacements = {"{{PROJECT_NAME}}": project_name}
-                if dry_run:
-                    rprint(f"Would create: {dest_file}")
-                else:
-                    copy_template_file(item, dest_file, replacements)
-
-    if dry_run:
-        rprint("[bold]Dry run - would create:[/bold]")
-    else:
-        rprint("[green][OK][/green] Created directory and copied template files")
-
-    copy_tree(template_dir, project_path)
-
-    # Create workspace.yaml for Dagster
-    workspace_content = """pythonpath:
-  - src
-load_from:
-  - python_file: src/orchestration/definitions.py
-"""
-    workspace_file = project_path / "workspace.yaml"
-    if dry_run:
-        rprint(f"Would create: {workspace_file}")
-    else:
-        workspace_file.write_text(workspace_content)
-        rprint("[green][OK][/green] Created workspace.yaml for Dagster")
-
-    if not sample_assets and not dry_run:
-        # Remove sample assets if not requested
-        for asset_file in project_path.glob("src/core/*_example.py"):
-            asset_file.unlink()
-        for asset_file in project_path.glob("src/orchestration/assets/*/*_example.py"):
-            asset_file.unlink()
-        rprint("[green][OK][/green] Removed sample assets as requested")
-
-    # Handle git initialization
-    init_git = False
-    if git:
-        init_git = True
-    elif no_git:
-        init_git = False
-    else:
-        if not dry_run:
-            init_git = Confirm.ask("Initialize git repository?")
-
-    if init_git and not dry_run:
-        if run_command(["git", "init"], cwd=project_path):
-            rprint("[green][OK][/green] Initialized git repository")
-        else:
-            rprint("[yellow][WARN][/yellow] Git initialization failed")
-
-    # Handle CI/CD platform selection
-    selected_platform = cicd_platform
-    if cicd_platform is None and not dry_run:
-        rprint("\n[bold]CI/CD Pipeline Setup[/bold]")
-        rprint("Choose a CI/CD platform to generate an automated pipeline (optional):")
-        rprint("1. Azure DevOps")
-        rprint("2. GitHub Actions")
-        rprint("3. GitLab CI")
-        rprint("4. Skip CI/CD setup")
-
-        choice = Prompt.ask("Enter choice (1-4)", default="4")
-        platforms = {
-            "1": "azure-devops",
-            "2": "github-actions",
-            "3": "gitlab-ci",
-            "4": None,
-        }
-        selected_platform = platforms.get(choice)
-
-    if selected_platform:
-        cicd_template_dir = Path(__file__).parent / "templates" / "cicd"
-        template_file = None
-        dest_file = None
-
-        if selected_platform == "azure-devops":
-            template_file = cicd_template_dir / "azure-pipelines.yml"
-            dest_file = project_path / "azure-pipelines.yml"
-        elif selected_platform == "github-actions":
-            template_file = cicd_template_dir / "github-workflow.yml"
-            dest_file = project_path / ".github" / "workflows" / "polster.yml"
-        elif selected_platform == "gitlab-ci":
-            template_file = cicd_template_dir / "gitlab-ci.yml"
-            dest_file = project_path / ".gitlab-ci.yml"
-
-        if template_file and dest_file:
-            if dry_run:
-                rprint(f"Would create: {dest_file}")
-            elif template_file.exists():
-                copy_template_file(template_file, dest_file)
-                rprint(f"[green][OK][/green] Created {selected_platform} pipeline file")
-            else:
-                rprint(f"[yellow][WARN][/yellow] Template for {selected_platform} not found")
-
-    # Handle uv installation
+    # Decide on the installer first so the environment can be built while
+    # the templates are rendered
     do_install_uv = False
-    if install_uv and not shutil.which("uv") and not dry_run:
+    if install_uv and not shutil.which("uv") and not dry_run and not offline:
         do_install_uv = Confirm.ask("Install uv (Python package installer)?")
 
     if do_install_uv and not dry_run:
@@ -494,42 +815,155 @@ load_from:
         else:
             rprint("[yellow][WARN][/yellow] uv installation failed")
 
-    # Create virtual environment and install dependencies
-    if not dry_run:
-        rprint("Setting up Python environment...")
-        if shutil.which("uv"):
-            # Use uv
-            if run_command(["uv", "venv"], cwd=project_path):
-                rprint("[green][OK][/green] Created virtual environment with uv")
-
-                # Try uv sync first, then fall back to uv pip install
-                if run_command(["uv", "sync", "--extra", "dev"], cwd=project_path):
-                    rprint("[green][OK][/green] Installed dependencies with uv sync")
-                elif run_command(
-                    ["uv", "pip", "install", "-e", ".[dev]"], cwd=project_path
-                ):
-                    rprint("[green][OK][/green] Installed dependencies with uv pip")
-                else:
-                    rprint("[yellow][WARN][/yellow] Failed to install dependencies with uv")
+    installer = "uv" if shutil.which("uv") else "pip"
+    flags = installer_flags(installer, offline, cache_dir, wheelhouse)
+    if offline and installer == "pip" and not wheelhouse:
+        rprint(
+            "[yellow][WARN][/yellow] --offline with pip needs --wheelhouse; "
+            "dependency installation will likely fail"
+        )
+
+    # Collect template files; pyproject.toml and README.md go first because
+    # dependency installation only needs those
+    skip_dirs = {
+        ".ruff_cache",
+        "__pycache__",
+        ".git",
+        ".pytest_cache",
+        ".mypy_cache",
+    }
+    template_files = sorted(
+        (
+            item
+            for item in template_dir.rglob("*")
+            if item.is_file()
+            and not any(
+                part in skip_dirs for part in item.relative_to(template_dir).parts
+            )
+        ),
+        key=lambda item: item.name not in INSTALL_FILES,
+    )
+    replacements = {"{{PROJECT_NAME}}": project_name}
+
+    if dry_run:
+        rprint("[bold]Dry run - would create:[/bold]")
+        for item in template_files:
+            rprint(f"Would create: {project_path / item.relative_to(template_dir)}")
+
+    with ThreadPoolExecutor(max_workers=1) as background:
+        environment = None
+        with timed_phase(timings, "templates"):
+            if not dry_run:
+                for item in template_files:
+                    if environment is None and item.name not in INSTALL_FILES:
+                        rprint("Setting up Python environment in the background...")
+                        environment = background.submit(
+                            install_dependencies, project_path, installer, flags, timings
+                        )
+                    copy_template_file(
+                        item, project_path / item.relative_to(template_dir), replacements
+                    )
+                rprint("[green][OK][/green] Created directory and copied template files")
+
+            # Create workspace.yaml for Dagster
+            workspace_content = """pythonpath:
+  - src
+load_from:
+  - python_file: src/orchestration/definitions.py
+"""
+            workspace_file = project_path / "workspace.yaml"
+            if dry_run:
+                rprint(f"Would create: {workspace_file}")
             else:
-                rprint("[yellow][WARN][/yellow] Failed to create virtual environment")
+                workspace_file.write_text(workspace_content)
+                rprint("[green][OK][/green] Created workspace.yaml for Dagster")
+
+            if not sample_assets and not dry_run:
+                # Remove sample assets if not requested
+                for asset_file in project_path.glob("src/core/*_example.py"):
+                    asset_file.unlink()
+                for asset_file in project_path.glob(
+                    "src/orchestration/assets/*/*_example.py"
+                ):
+                    asset_file.unlink()
+                rprint("[green][OK][/green] Removed sample assets as requested")
+
+        # Handle git initialization
+        init_git = False
+        if git:
+            init_git = True
+        elif no_git:
+            init_git = False
         else:
-            # Fallback to python -m venv
-            if run_command([sys.executable, "-m", "venv", ".venv"], cwd=project_path):
-                rprint("[green][OK][/green] Created virtual environment")
-
-                # Install dependencies
-                pip_cmd = (
-                    [".venv/bin/pip"]
-                    if os.name != "nt"
-                    else [".venv\\Scripts\\pip.exe"]
-                )
-                if run_command(pip_cmd + ["install", "-e", ".[dev]"], cwd=project_path):
-                    rprint("[green][OK][/green] Installed dependencies")
-                else:
-                    rprint("[yellow][WARN][/yellow] Failed to install dependencies")
+            if not dry_run:
+                init_git = Confirm.ask("Initialize git repository?")
+
+        if init_git and not dry_run:
+            if run_command(["git", "init"], cwd=project_path):
+                rprint("[green][OK][/green] Initialized git repository")
             else:
-                rprint("[yellow][WARN][/yellow] Failed to create virtual environment")
+                rprint("[yellow][WARN][/yellow] Git initialization failed")
+
+        # Handle CI/CD platform selection
+        selected_platform = cicd_platform
+        if cicd_platform is None and not dry_run:
+            rprint("\n[bold]CI/CD Pipeline Setup[/bold]")
+            rprint("Choose a CI/CD platform to generate an automated pipeline (optional):")
+            rprint("1. Azure DevOps")
+            rprint("2. GitHub Actions")
+            rprint("3. GitLab CI")
+            rprint("4. Skip CI/CD setup")
+
+            choice = Prompt.ask("Enter choice (1-4)", default="4")
+            platforms = {
+                "1": "azure-devops",
+                "2": "github-actions",
+                "3": "gitlab-ci",
+                "4": None,
+            }
+            selected_platform = platforms.get(choice)
+
+        if selected_platform:
+            cicd_template_dir = Path(__file__).parent / "templates" / "cicd"
+            template_file = None
+            dest_file = None
+
+            if selected_platform == "azure-devops":
+                template_file = cicd_template_dir / "azure-pipelines.yml"
+                dest_file = project_path / "azure-pipelines.yml"
+            elif selected_platform == "github-actions":
+                template_file = cicd_template_dir / "github-workflow.yml"
+                dest_file = project_path / ".github" / "workflows" / "polster.yml"
+            elif selected_platform == "gitlab-ci":
+                template_file = cicd_template_dir / "gitlab-ci.yml"
+                dest_file = project_path / ".gitlab-ci.yml"
+
+            if template_file and dest_file:
+                if dry_run:
+                    rprint(f"Would create: {dest_file}")
+                elif template_file.exists():
+                    copy_template_file(template_file, dest_file)
+                    rprint(f"[green][OK][/green] Created {selected_platform} pipeline file")
+                else:
+                    rprint(
+                        f"[yellow][WARN][/yellow] Template for {selected_platform} not found"
+                    )
+
+        # Wait for the environment, then install the project on top of it
+        if environment is not None:
+            with timed_phase(timings, "waiting for environment"):
+                messages = environment.result()
+            for message in messages:
+                rprint(message)
+            if (project_path / ".venv").exists():
+                with timed_phase(timings, "project install"):
+                    installed = install_project(project_path, installer, flags)
+                if installed:
+                    rprint(f"[green][OK][/green] Installed project with {installer}")
+                else:
+                    rprint(
+                        f"[yellow][WARN][/yellow] Failed to install dependencies with {installer}"
+                    )
 
     # Final instructions
     if not dry_run:
@@ -566,6 +1000,8 @@ load_from:
         rprint("\nTo add new assets:")
         rprint("  polster add-asset")
 
+        print_timings(timings, time.perf_counter() - started)
+
         # Start Dagster UI if requested
         if start_dagster:
             _start_dagster_ui(project_path)
@@ -575,14 +1011,39 @@ load_from:
 def add_asset(
     layer: str = typer.Option(None, "--layer", help="Layer (bronze/silver/gold)"),
     name: str = typer.Option(None, "--name", help="Asset name (lowercase snake_case)"),
+    pool: str = typer.Option(
+        "cpu",
+        "--pool",
+        help="Resource pool used to limit concurrency (e.g. adls, mysql, api, sftp, cpu)",
+    ),
+    spec_file: Path = typer.Option(
+        None,
+        "--from",
+        exists=True,
+        dir_okay=False,
+        help="Create many assets at once from a YAML, JSON or CSV spec file",
+    ),
+    schema_from: Path = typer.Option(
+        None,
+        "--schema-from",
+        exists=True,
+        dir_okay=False,
+        help="Generate a typed schema from a sample .parquet, .csv, .json or .ndjson file",
+    ),
     dry_run: bool = typer.Option(
         False, "--dry-run", help="Preview files without creating"
     ),
 ) -> None:
     """Add a new asset to the current Polster project."""
+    from rich.prompt import Confirm, Prompt
+
     # Ensure we're in a valid project
     project_path = ensure_polster_project()
 
+    if spec_file is not None:
+        add_assets_from_spec(spec_file, project_path, dry_run)
+        return
+
     rprint("[bold]Adding new asset to Polster project[/bold]")
 
     # Handle layer selection
@@ -605,6 +1066,8 @@ def add_asset(
         asset_name = Prompt.ask("Asset name (lowercase snake_case)")
         asset_name = validate_asset_name(asset_name)
 
+    pool = validate_pool_name(pool.lower())
+
     # Handle upstream dependencies for silver/gold assets
     deps = []
     if layer in ["silver", "gold"]:
@@ -662,86 +1125,38 @@ def add_asset(
                 deps = [default_dep]
                 rprint(f"Using default upstream: {default_dep}")
 
-    # Define file paths
-    core_file = project_path / "src" / "core" / f"{layer}_{asset_name}.py"
-    orch_file = (
-        project_path
-        / "src"
-        / "orchestration"
-        / "assets"
-        / layer
-        / f"run_{layer}_{asset_name}.py"
-    )
+    core_file, orch_file = asset_file_paths(layer, asset_name, project_path)
 
     # Check if files already exist
     if core_file.exists() or orch_file.exists():
         rprint("[red]Error: Asset files already exist.[/red]")
         raise typer.Exit(1)
 
+    columns = read_sample_schema(schema_from, project_path) if schema_from else None
+
     if dry_run:
         rprint("[bold]Dry run - would create:[/bold]")
         rprint(f"  Core file: {core_file.relative_to(project_path)}")
         rprint(f"  Orchestration file: {orch_file.relative_to(project_path)}")
+        rprint(f"  Resource pool: {pool}")
+        if columns:
+            rprint(f"  Schema: {len(columns)} columns from {schema_from}")
         return
 
-    # Get template files
-    template_dir = Path(__file__).parent / "templates" / "assets"
-    core_template = template_dir / f"core_{layer}.py"
-    orch_template = template_dir / f"orch_{layer}.py"
-
-    if not core_template.exists() or not orch_template.exists():
-        rprint(f"[red]Template files not found for layer: {layer}[/red]")
-        raise typer.Exit(1)
-
-    # Create files with replacements
-    replacements = {"{{ASSET_NAME}}": asset_name, "{{DEPS}}": str(deps)}
-
-    copy_template_file(core_template, core_file, replacements)
-    copy_template_file(orch_template, orch_file, replacements)
-
-    asset_function_name = f"run_{layer}_{asset_name}"
+    files = render_asset_files(
+        layer, asset_name, deps, pool, project_path, render_schema(columns)
+    )
 
     # Update the assets/{layer}/__init__.py to include the new asset
-    init_file = (
-        project_path / "src" / "orchestration" / "assets" / layer / "__init__.py"
-    )
+    init_file = layer_init_file(layer, project_path)
     if init_file.exists():
-        content = init_file.read_text()
-
-        # Add import if not already present
-        import_line = f"from orchestration.assets.{layer}.{asset_function_name} import {asset_function_name}"
-        if import_line not in content:
-            # Insert before __all__ or at end
-            if "__all__" in content:
-                content = content.replace("__all__", import_line + "\n\n__all__", 1)
-            else:
-                content += f"\n{import_line}\n"
-
-        # Update __all__ if it exists
-        if "__all__" in content:
-            # Find __all__ and add the new name
-            lines = content.splitlines()
-            for i, line in enumerate(lines):
-                if line.strip().startswith("__all__"):
-                    # Parse the __all__ list
-                    all_start = lines[i].find("[")
-                    if all_start != -1:
-                        all_end = lines[i].find("]", all_start)
-                        if all_end != -1:
-                            current_all = lines[i][all_start : all_end + 1]
-                            # Add the new name if not present
-                            if f'"{asset_function_name}"' not in current_all:
-                                # Remove closing ] and add
-                                updated_all = (
-                                    current_all[:-1]
-                                    + f', "{asset_function_name}"'
-                                    + current_all[-1:]
-                                )
-                                lines[i] = lines[i].replace(current_all, updated_all)
-                                content = "\n".join(lines) + "\n"
-                    break
+        files[init_file] = register_assets_in_init(
+            init_file.read_text(), layer, [f"run_{layer}_{asset_name}"]
+        )
 
-        init_file.write_text(content)
+    write_files_atomically(files)
+
+    if init_file.exists():
         rprint(f"[green][OK][/green] Updated: {init_file.relative_to(project_path)}")
 
     rprint(f"[green][OK][/green] Created core file: {core_file.relative_to(project_path)}")
@@ -749,6 +1164,9 @@ def add_asset(
         f"[green][OK][/green] Created orchestration file: {orch_file.relative_to(project_path)}"
     )
 
+    if columns:
+        rprint(f"[green][OK][/green] Generated SCHEMA with {len(columns)} columns")
+
     rprint("\n[bold]Next steps:[/bold]")
     rprint("1. Edit the core file to implement your logic")
     rprint("2. Uncomment the example code to test")
@@ -756,6 +1174,68 @@ def add_asset(
     rprint("4. Your new asset will appear automatically in the Dagster interface")
 
 
+def add_assets_from_spec(spec_file: Path, project_path: Path, dry_run: bool) -> None:
+    """Create every asset in a spec file in one validated, atomic pass."""
+    rprint(f"[bold]Adding assets from {spec_file}[/bold]")
+
+    planned, errors = plan_asset_batch(load_asset_spec(spec_file), project_path)
+    if errors:
+        rprint(f"[red]Spec validation failed with {len(errors)} error(s):[/red]")
+        for error in errors:
+            rprint(f"  - {error}")
+        raise typer.Exit(1)
+    if not planned:
+        rprint("[yellow]No assets defined in spec file[/yellow]")
+        return
+
+    for layer in ["bronze", "silver", "gold"]:
+        count = sum(1 for a in planned if a["layer"] == layer)
+        if count:
+            rprint(f"- {count} {layer} asset(s)")
+
+    files: dict[Path, str] = {}
+    for asset in planned:
+        schema = "None"
+        if asset["schema_from"]:
+            # Sample paths are relative to the spec file
+            sample = spec_file.parent / asset["schema_from"]
+            if not sample.is_file():
+                rprint(f"[red]Schema sample not found: {sample}[/red]")
+                raise typer.Exit(1)
+            schema = render_schema(read_sample_schema(sample, project_path))
+        files.update(
+            render_asset_files(
+                asset["layer"],
+                asset["name"],
+                asset["deps"],
+                asset["pool"],
+                project_path,
+                schema,
+            )
+        )
+
+    # Rewrite each layer's __init__.py once with all of its new assets
+    for layer in ["bronze", "silver", "gold"]:
+        new_functions = [a["function"] for a in planned if a["layer"] == layer]
+        init_file = layer_init_file(layer, project_path)
+        if new_functions and init_file.exists():
+            files[init_file] = register_assets_in_init(
+                init_file.read_text(), layer, new_functions
+            )
+
+    if dry_run:
+        rprint("[bold]Dry run - would write:[/bold]")
+        for file_path in files:
+            rprint(f"  {file_path.relative_to(project_path)}")
+        return
+
+    write_files_atomically(files)
+    rprint(
+        f"[green][OK][/green] Created {len(planned)} asset(s) "
+        f"({len(files)} files written)"
+    )
+
+
 @app.command()
 def remove_asset(
     layer: str = typer.Option(None, "--layer", help="Layer (bronze/silver/gold)"),
@@ -768,6 +1248,8 @@ def remove_asset(
     ),
 ) -> None:
     """Remove an asset from the current Polster project."""
+    from rich.prompt import Confirm, Prompt
+
     # Ensure we're in a valid project
     project_path = ensure_polster_project()
 
@@ -834,12 +1316,13 @@ def remove_asset(
         return
 
     # Check dependencies for all selected assets
+    selected_keys = {f"{layer}_{asset['name']}" for asset in selected_assets}
     all_dependent_assets = []
     for asset in selected_assets:
         dependents = check_asset_dependencies(asset["name"], layer, project_path)
-        all_dependent_assets.extend(dependents)
+        all_dependent_assets.extend(d for d in dependents if d not in selected_keys)
 
-    all_dependent_assets = list(set(all_dependent_assets))  # Remove duplicates
+    all_dependent_assets = sorted(set(all_dependent_assets))  # Remove duplicates
 
     # Show impact analysis
     rprint(f"\n[bold]Selection Summary:[/bold]")
@@ -924,9 +1407,360 @@ def remove_asset(
         rprint("[yellow]No files were removed[/yellow]")
 
 
+@app.command()
+def graph(
+    output_format: str = typer.Option(
+        "text", "--format", help="Output format (text, dot, json)"
+    ),
+    upstream: str = typer.Option(
+        None, "--upstream", help="Only show ASSET and everything it depends on"
+    ),
+    downstream: str = typer.Option(
+        None, "--downstream", help="Only show ASSET and everything that depends on it"
+    ),
+) -> None:
+    """Show the asset dependency graph with levels and critical path."""
+    from polster.graph import AssetGraph, CycleError
+    from polster.index import load_index
+
+    project_path = ensure_polster_project()
+
+    output_format = output_format.lower()
+    if output_format not in ["text", "dot", "json"]:
+        rprint("[red]Format must be one of: text, dot, json[/red]")
+        raise typer.Exit(1)
+    if upstream and downstream:
+        rprint("[red]Use either --upstream or --downstream, not both[/red]")
+        raise typer.Exit(1)
+
+    asset_graph = AssetGraph.from_index(load_index(project_path))
+    focus = None
+    if upstream or downstream:
+        focus = resolve_asset_ref(upstream or downstream, asset_graph)
+        related = (
+            asset_graph.upstream_of(focus)
+            if upstream
+            else asset_graph.downstream_of(focus)
+        )
+        asset_graph = asset_graph.subgraph({focus, *related})
+
+    try:
+        if output_format == "json":
+            typer.echo(asset_graph.to_json())
+            return
+        if output_format == "dot":
+            typer.echo(asset_graph.to_dot())
+            return
+        levels = asset_graph.topological_levels()
+        critical_path = asset_graph.critical_path()
+    except CycleError as e:
+        rprint(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1) from None
+
+    if not levels:
+        rprint("[yellow]No assets found[/yellow]")
+        return
+
+    if focus:
+        direction = "upstream of" if upstream else "downstream of"
+        rprint(f"[bold]Assets {direction} {focus}[/bold]")
+    rprint(
+        f"[bold]{len(asset_graph.assets)} asset(s), "
+        f"{len(asset_graph.edges())} dependency(ies), {len(levels)} level(s)[/bold]"
+    )
+    for number, level in enumerate(levels):
+        rprint(f"\n[bold]Level {number}[/bold] (parallelism: {len(level)})")
+        for name in level:
+            asset = asset_graph.assets.get(name)
+            if asset is None:
+                rprint(f"  {name} [dim](external)[/dim]")
+                continue
+            deps = ", ".join(sorted(asset_graph.upstream[name])) or "-"
+            pool = f" [dim]pool={asset.pool}[/dim]" if asset.pool else ""
+            rprint(f"  {name}{pool} <- {deps}")
+
+    rprint(f"\n[bold]Max parallelism:[/bold] {max(len(level) for level in levels)}")
+    rprint(
+        f"[bold]Critical path ({len(critical_path)}):[/bold] "
+        + " -> ".join(critical_path)
+    )
+
+
+@app.command()
+def status(
+    layer: str = typer.Option(None, "--layer", help="Only show one layer"),
+    output_format: str = typer.Option(
+        "table", "--format", help="Output format (table, json)"
+    ),
+    stale_only: bool = typer.Option(
+        False, "--stale", help="Only show stale or missing assets"
+    ),
+) -> None:
+    """Show the latest snapshot, age, size and row count of every asset."""
+    from rich.console import Console
+    from rich.table import Table
+
+    from polster.index import load_index
+    from polster.status import (
+        UnsupportedStoreError,
+        collect_status,
+        format_age,
+        format_size,
+        snapshot_store,
+    )
+
+    project_path = ensure_polster_project()
+
+    if layer and layer.lower() not in ["bronze", "silver", "gold"]:
+        rprint("[red]Layer must be one of: bronze, silver, gold[/red]")
+        raise typer.Exit(1)
+
+    try:
+        store = snapshot_store(project_path)
+    except UnsupportedStoreError as e:
+        rprint(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1) from None
+    statuses = collect_status(
+        load_index(project_path), store, [layer.lower()] if layer else None
+    )
+    if stale_only:
+        statuses = [s for s in statuses if s.snapshot is None or s.stale_because]
+
+    if output_format.lower() == "json":
+        typer.echo(
+            json.dumps(
+                [
+                    {
+                        "asset": s.asset.function,
+                        "layer": s.asset.layer,
+                        "snapshot": s.snapshot.path if s.snapshot else None,
+                        "snapshot_time": s.snapshot.timestamp.isoformat()
+                        if s.snapshot
+                        else None,
+                        "age_seconds": s.age_seconds,
+                        "size_bytes": s.snapshot.size if s.snapshot else None,
+                        "rows": s.snapshot.rows if s.snapshot else None,
+                        "stale_because": s.stale_because,
+                    }
+                    for s in statuses
+                ],
+                indent=2,
+            )
+        )
+        return
+
+    table = Table(title=f"Asset status ({store.backend} storage)")
+    for column in ["Asset", "Latest snapshot", "Age", "Size", "Rows", "Status"]:
+        table.add_column(column, justify="right" if column in ["Size", "Rows"] else "left")
+    for s in statuses:
+        if s.snapshot is None:
+            table.add_row(s.asset.function, "-", "-", "-", "-", "[yellow]missing[/yellow]")
+            continue
+        state = (
+            f"[yellow]stale[/yellow] ({', '.join(s.stale_because)} newer)"
+            if s.stale_because
+            else "[green]ok[/green]"
+        )
+        table.add_row(
+            s.asset.function,
+            s.snapshot.name,
+            format_age(s.age_seconds),
+            format_size(s.snapshot.size),
+            f"{s.snapshot.rows:,}" if s.snapshot.rows is not None else "?",
+            state,
+        )
+    Console().print(table)
+
+
+@app.command()
+def query(
+    sql: str = typer.Argument(..., help='SQL over layer.table, e.g. "SELECT * FROM silver.orders"'),
+    output: Path = typer.Option(
+        None, "--output", "-o", help="Write the result to a .csv, .ndjson or .parquet file"
+    ),
+    output_format: str = typer.Option(
+        "table", "--format", help="Terminal output format (table, csv, json)"
+    ),
+    limit: int = typer.Option(
+        None, "--limit", min=1, help="Maximum rows (terminal tables default to 50)"
+    ),
+    snapshots: str = typer.Option(
+        "latest", "--snapshots", help="Snapshots to query: latest or all"
+    ),
+    since: str = typer.Option(
+        None, "--since", help="Only snapshots from this timestamp on, e.g. 20260101"
+    ),
+    until: str = typer.Option(
+        None, "--until", help="Only snapshots up to this timestamp, e.g. 20260131T235959Z"
+    ),
+    version: str = typer.Option(
+        None, "--version", help="Delta table version number or timestamp to read"
+    ),
+    explain: bool = typer.Option(
+        False, "--explain", help="Print the optimized query plan instead of running it"
+    ),
+) -> None:
+    """Run ad-hoc SQL over the layers, reading only the data the query needs."""
+    project_path = ensure_polster_project()
+
+    if output_format.lower() not in ["table", "csv", "json"]:
+        rprint("[red]Format must be one of: table, csv, json[/red]")
+        raise typer.Exit(1)
+    if snapshots.lower() not in ["latest", "all"]:
+        rprint("[red]--snapshots must be latest or all[/red]")
+        raise typer.Exit(1)
+
+    # Like the storage probe, the query runs in the project environment
+    # through its own core/storage.py; output is streamed, not captured
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(project_path / "src") + os.pathsep + env.get("PYTHONPATH", "")
+    cmd = [
+        str(project_python(project_path)),
+        str(Path(__file__).parent / "query_runner.py"),
+        sql,
+        "--format",
+        output_format.lower(),
+        "--snapshots",
+        snapshots.lower(),
+    ]
+    if output is not None:
+        cmd += ["--output", str(output.resolve())]
+    for flag, value in (
+        ("--limit", limit),
+        ("--since", since),
+        ("--until", until),
+        ("--version", version),
+    ):
+        if value is not None:
+            cmd += [flag, str(value)]
+    if explain:
+        cmd.append("--explain")
+
+    result = subprocess.run(cmd, cwd=project_path, env=env)
+    if result.returncode != 0:
+        raise typer.Exit(result.returncode)
+
+
+def _ms(stats: dict) -> str:
+    """Format p50/p90/p99 latencies."""
+    return f"{stats['p50']:.2f} / {stats['p90']:.2f} / {stats['p99']:.2f}"
+
+
+def print_storage_report(report: dict) -> None:
+    """Render the storage probe report as tables."""
+    from rich.console import Console
+    from rich.table import Table
+
+    console = Console()
+    rprint(f"[bold]Storage backend:[/bold] {report['backend']} ({report['target']})")
+
+    table = Table(title="Throughput")
+    for column in ("File size", "Write MB/s", "Read MB/s", "Write ms p50/p90/p99", "Read ms p50/p90/p99"):
+        table.add_column(column, justify="right")
+    for row in report["throughput"]:
+        table.add_row(
+            f"{row['file_bytes'] / (1024 * 1024):.1f} MB",
+            f"{row['write_mb_s']:.1f}",
+            f"{row['read_mb_s']:.1f}",
+            _ms(row["write_ms"]),
+            _ms(row["read_ms"]),
+        )
+    console.print(table)
+
+    latency = report["latency"]
+    rprint(
+        f"Per-operation latency (tiny files), ms p50/p90/p99: "
+        f"write {_ms(latency['write_ms'])}, read {_ms(latency['read_ms'])}"
+    )
+
+    table = Table(title="Listing (paid by every latest-snapshot read)")
+    for column in ("Layer", "Files", "List ms p50/p90/p99", "Share of small read"):
+        table.add_column(column, justify="right")
+    read_p50 = latency["read_ms"]["p50"]
+    for row in report["listing"]:
+        list_p50 = row["ms"]["p50"]
+        share = list_p50 / (list_p50 + read_p50) if list_p50 + read_p50 else 0.0
+        table.add_row(row["layer"], str(row["files"]), _ms(row["ms"]), f"{share:.0%}")
+    console.print(table)
+
+
+@app.command()
+def doctor(
+    storage: bool = typer.Option(
+        False, "--storage", help="Measure storage throughput, latency and listing time"
+    ),
+    sizes: str = typer.Option("1,8,32", "--sizes", help="Probe file sizes in MB"),
+    repeat: int = typer.Option(3, "--repeat", min=1, help="Samples per file size"),
+    output_format: str = typer.Option(
+        "table", "--format", help="Output format (table, json)"
+    ),
+) -> None:
+    """Check the project environment and, with --storage, the storage backend."""
+    project_path = ensure_polster_project()
+    python = project_python(project_path)
+
+    if not storage:
+        rprint(f"[bold]Project:[/bold] {project_path.resolve()}")
+        rprint(f"[bold]Python:[/bold] {python}")
+        if python == Path(sys.executable):
+            rprint("[yellow][WARN][/yellow] No .venv found; run 'polster setup'")
+        rprint(f"[bold]Storage backend:[/bold] {os.getenv('STORAGE_BACKEND', 'local')}")
+        rprint("Run 'polster doctor --storage' to benchmark the storage backend.")
+        return
+
+    # The probe runs in the project environment through its own core/storage.py
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(project_path / "src") + os.pathsep + env.get("PYTHONPATH", "")
+    probe = Path(__file__).parent / "storage_probe.py"
+    if output_format.lower() != "json":
+        rprint(f"[dim]Probing storage with {sizes} MB files x{repeat}...[/dim]")
+    result = subprocess.run(
+        [str(python), str(probe), "--sizes", sizes, "--repeat", str(repeat)],
+        cwd=project_path,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        rprint("[red]Storage probe failed:[/red]")
+        rprint(result.stderr.strip())
+        raise typer.Exit(1)
+
+    if output_format.lower() == "json":
+        typer.echo(result.stdout)
+        return
+    print_storage_report(json.loads(result.stdout))
+
+
+def setup_shared_venv(project_root: Path, venv_path: Path) -> None:
+    """Create the project venv from the shared environment cache."""
+    from polster.envcache import create_shared_venv
+    from polster.status import format_size
+
+    rprint(f"[OK] Linking shared environment into {venv_path}")
+    result = create_shared_venv(project_root, venv_path)
+    if result.built:
+        rprint(f"[OK] Built shared environment {result.key} (first project with these dependencies)")
+    else:
+        rprint(f"[OK] Reused shared environment {result.key}")
+    rprint(
+        f"[OK] Hardlinked {result.linked_files} files ({format_size(result.linked_bytes)}), "
+        f"copied {result.copied_files}"
+    )
+    rprint(f"[green]Virtual environment setup complete in {result.seconds:.1f}s![/green]")
+    rprint(f"[DIR] Location: {venv_path}")
+    rprint(f"[DIR] Shared environment: {result.shared_path}")
+
+
 @app.command()
 def setup(
     force: bool = typer.Option(False, "--force", help="Force recreation of virtual environment"),
+    shared: bool = typer.Option(
+        False,
+        "--shared/--no-shared",
+        envvar="POLSTER_SHARED_ENV",
+        help="Hardlink a cached environment shared by projects with the same dependencies",
+    ),
 ) -> None:
     """Set up or recreate the virtual environment for this project."""
     try:
@@ -957,6 +1791,15 @@ def setup(
             rprint("[yellow]Removing existing virtual environment...[/yellow]")
             shutil.rmtree(venv_path)
 
+        if shared and os.name == "nt":
+            rprint(
+                "[yellow][WARN][/yellow] Shared environments are not supported on "
+                "Windows; doing a full install"
+            )
+        elif shared:
+            setup_shared_venv(project_root, venv_path)
+            return
+
         # Create new venv
         rprint(f"[OK] Creating virtual environment in {venv_path}")
         subprocess.run([sys.executable, "-m", "venv", str(venv_path)], check=True)
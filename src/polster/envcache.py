@@ -0,0 +1,263 @@
+"""Shared virtual environments for projects with identical dependencies.
+
+An environment is built once per dependency set under the cache directory
+(``~/.cache/polster/envs/<key>``) and materialized into each project's
+``.venv`` by hardlinking its site-packages, so every project only pays for a
+fresh interpreter stub and an editable install of itself. The key covers the
+requirements (or ``uv.lock`` when present) and the Python version, so a
+project whose dependencies differ gets its own environment built once.
+
+Hardlinked files are shared between projects: upgrading a package with pip or
+uv replaces the files and breaks the link, but editing installed files in
+place changes them for every project using that environment.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+ENV_METADATA = "polster-env.json"
+
+
+def cache_root() -> Path:
+    """Directory holding the shared environments."""
+    configured = os.environ.get("POLSTER_ENV_CACHE")
+    if configured:
+        return Path(configured).expanduser()
+    if os.name == "nt":
+        base = Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local"))
+        return base / "polster" / "envs"
+    base = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return base / "polster" / "envs"
+
+
+def project_requirements(
+    pyproject_file: Path, extras: tuple[str, ...] = ("dev",)
+) -> list[str]:
+    """Build requirements, dependencies and extras declared in a pyproject.toml."""
+    import tomllib
+
+    data = tomllib.loads(pyproject_file.read_text(encoding="utf-8"))
+    project = data.get("project", {})
+    requirements = list(data.get("build-system", {}).get("requires", []))
+    if any(req.startswith("hatchling") for req in requirements):
+        # Needed for editable installs without build isolation
+        requirements.append("editables")
+    requirements += project.get("dependencies", [])
+    for extra in extras:
+        requirements += project.get("optional-dependencies", {}).get(extra, [])
+    return requirements
+
+
+def environment_key(project_root: Path, requirements: list[str]) -> str:
+    """Hash of the dependency set and the interpreter it is installed for."""
+    digest = hashlib.sha256()
+    digest.update(
+        json.dumps(
+            {
+                "requirements": sorted(set(requirements)),
+                "python": list(sys.version_info[:2]),
+                "implementation": sys.implementation.name,
+                "platform": [sys.platform, platform.machine()],
+            },
+            sort_keys=True,
+        ).encode()
+    )
+    lock_file = project_root / "uv.lock"
+    if lock_file.exists():
+        # Pinned versions make the key exact rather than range-based
+        digest.update(lock_file.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def venv_python(venv_path: Path) -> Path:
+    """Python interpreter of a virtual environment."""
+    if os.name == "nt":
+        return venv_path / "Scripts" / "python.exe"
+    return venv_path / "bin" / "python"
+
+
+def venv_site_packages(venv_path: Path) -> Path:
+    """site-packages of a venv created by the running interpreter."""
+    if os.name == "nt":
+        return venv_path / "Lib" / "site-packages"
+    version = f"python{sys.version_info.major}.{sys.version_info.minor}"
+    return venv_path / "lib" / version / "site-packages"
+
+
+@dataclass
+class MaterializeResult:
+    """Outcome of creating a project venv from a shared environment."""
+
+    key: str
+    shared_path: Path
+    built: bool
+    linked_files: int
+    copied_files: int
+    linked_bytes: int
+    seconds: float
+
+
+def build_shared_env(key: str, requirements: list[str]) -> Path:
+    """Build the shared environment for a key unless it already exists.
+
+    The environment is built in a temporary directory and renamed into place,
+    so concurrent builds of the same key never see a half-installed one.
+    """
+    shared_path = cache_root() / key
+    if (shared_path / ENV_METADATA).exists():
+        return shared_path
+
+    shared_path.parent.mkdir(parents=True, exist_ok=True)
+    staging = shared_path.with_name(f".{key}.{os.getpid()}.tmp")
+    shutil.rmtree(staging, ignore_errors=True)
+    try:
+        subprocess.run([sys.executable, "-m", "venv", str(staging)], check=True)
+        if shutil.which("uv"):
+            install = ["uv", "pip", "install", "--python", str(venv_python(staging))]
+        else:
+            install = [str(venv_python(staging)), "-m", "pip", "install"]
+        subprocess.run(
+            [*install, *requirements], check=True, capture_output=True, text=True
+        )
+        (staging / ENV_METADATA).write_text(
+            json.dumps(
+                {
+                    "key": key,
+                    "requirements": requirements,
+                    "python": platform.python_version(),
+                    "created": time.time(),
+                },
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+        try:
+            os.replace(staging, shared_path)
+        except OSError:
+            # Another process finished the same key first
+            if not (shared_path / ENV_METADATA).exists():
+                raise
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    return shared_path
+
+
+def _link_or_copy(src: Path, dest: Path) -> bool:
+    """Hardlink a file, copying when links aren't possible (other device)."""
+    try:
+        os.link(src, dest)
+        return True
+    except OSError:
+        shutil.copy2(src, dest)
+        return False
+
+
+def _rewrite_shebang(data: bytes, python: Path) -> bytes | None:
+    """Point a console script at another interpreter; None if not a script."""
+    if not data.startswith(b"#!"):
+        return None
+    first_line, newline, rest = data.partition(b"\n")
+    if b"python" not in first_line:
+        return None
+    return b"#!" + str(python).encode() + newline + rest
+
+
+def materialize(shared_path: Path, venv_path: Path) -> tuple[int, int, int]:
+    """Create ``venv_path`` and hardlink the shared environment's packages into it.
+
+    Returns (linked files, copied files, linked bytes).
+    """
+    subprocess.run(
+        [sys.executable, "-m", "venv", "--without-pip", str(venv_path)], check=True
+    )
+    linked = copied = linked_bytes = 0
+
+    src_site, dest_site = venv_site_packages(shared_path), venv_site_packages(venv_path)
+    for dirpath, _, filenames in os.walk(src_site):
+        relative = Path(dirpath).relative_to(src_site)
+        (dest_site / relative).mkdir(parents=True, exist_ok=True)
+        for name in filenames:
+            src, dest = Path(dirpath) / name, dest_site / relative / name
+            if dest.exists() or src.is_symlink():
+                continue
+            if _link_or_copy(src, dest):
+                linked += 1
+                linked_bytes += src.stat().st_size
+            else:
+                copied += 1
+
+    # Console scripts (pip, dagster, pytest, ...) embed the interpreter path
+    src_bin, dest_bin = venv_python(shared_path).parent, venv_python(venv_path).parent
+    python = venv_python(venv_path)
+    for src in src_bin.iterdir():
+        dest = dest_bin / src.name
+        if (
+            dest.exists()
+            or src.is_dir()
+            or src.name.lower().startswith(("activate", "python"))
+        ):
+            continue
+        data = src.read_bytes()
+        rewritten = _rewrite_shebang(data, python)
+        if rewritten is None:
+            _link_or_copy(src, dest)
+        else:
+            dest.write_bytes(rewritten)
+            dest.chmod(src.stat().st_mode)
+        copied += 1
+    return linked, copied, linked_bytes
+
+
+def create_shared_venv(project_root: Path, venv_path: Path) -> MaterializeResult:
+    """Create a project's venv from the shared environment for its dependencies.
+
+    Builds the shared environment on first use (a full install), then links
+    it into ``venv_path`` and installs the project itself without dependencies.
+    """
+    if os.name == "nt":
+        # Windows console scripts are .exe launchers with the interpreter path
+        # baked in, so they can't be re-pointed like shebangs
+        raise OSError("Shared environments are not supported on Windows")
+
+    started = time.perf_counter()
+    requirements = project_requirements(project_root / "pyproject.toml")
+    key = environment_key(project_root, requirements)
+    shared_path = cache_root() / key
+    built = not (shared_path / ENV_METADATA).exists()
+    build_shared_env(key, requirements)
+
+    linked, copied, linked_bytes = materialize(shared_path, venv_path)
+    subprocess.run(
+        [
+            str(venv_python(venv_path)),
+            "-m",
+            "pip",
+            "install",
+            "--no-deps",
+            "--no-build-isolation",
+            "-e",
+            str(project_root),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return MaterializeResult(
+        key=key,
+        shared_path=shared_path,
+        built=built,
+        linked_files=linked,
+        copied_files=copied,
+        linked_bytes=linked_bytes,
+        seconds=time.perf_counter() - started,
+    )
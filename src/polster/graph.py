@@ -0,0 +1,170 @@
+"""Asset dependency graph built from the ``deps`` of each ``@asset``.
+
+The graph powers ``polster graph`` (topological levels, critical path,
+parallelism per level) and the impact analysis in ``polster remove-asset``.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import deque
+
+from polster.index import AssetInfo, ProjectIndex
+
+
+class CycleError(ValueError):
+    """Raised when asset dependencies form a cycle."""
+
+    def __init__(self, nodes: list[str]):
+        self.nodes = nodes
+        super().__init__(f"Dependency cycle between: {', '.join(nodes)}")
+
+
+class AssetGraph:
+    """Directed graph of assets; edges point from an asset to its dependents."""
+
+    def __init__(self, assets: list[AssetInfo]):
+        self.assets = {asset.function: asset for asset in assets}
+        self.upstream: dict[str, set[str]] = {name: set() for name in self.assets}
+        self.downstream: dict[str, set[str]] = {name: set() for name in self.assets}
+        for asset in assets:
+            for dep in asset.deps:
+                # Deps that are not defined in the project become external nodes
+                self.upstream.setdefault(dep, set())
+                self.downstream.setdefault(dep, set())
+                self.upstream[asset.function].add(dep)
+                self.downstream[dep].add(asset.function)
+
+    @classmethod
+    def from_index(cls, index: ProjectIndex) -> AssetGraph:
+        """Build the graph for every asset in a project index."""
+        return cls(index.assets())
+
+    @property
+    def nodes(self) -> list[str]:
+        """All node names, including external dependencies."""
+        return sorted(self.upstream)
+
+    @property
+    def external(self) -> list[str]:
+        """Dependencies that are not defined as assets in the project."""
+        return sorted(name for name in self.upstream if name not in self.assets)
+
+    def edges(self) -> list[tuple[str, str]]:
+        """Return (upstream, downstream) pairs."""
+        return sorted(
+            (dep, node) for node, deps in self.upstream.items() for dep in deps
+        )
+
+    def _closure(self, start: str, adjacency: dict[str, set[str]]) -> list[str]:
+        """Breadth-first walk from a node, excluding the node itself."""
+        if start not in adjacency:
+            raise KeyError(start)
+        seen = {start}
+        queue = deque([start])
+        order = []
+        while queue:
+            for neighbour in sorted(adjacency[queue.popleft()]):
+                if neighbour not in seen:
+                    seen.add(neighbour)
+                    order.append(neighbour)
+                    queue.append(neighbour)
+        return order
+
+    def upstream_of(self, name: str) -> list[str]:
+        """Everything the asset depends on, directly or transitively."""
+        return self._closure(name, self.upstream)
+
+    def downstream_of(self, name: str) -> list[str]:
+        """Everything that depends on the asset, directly or transitively."""
+        return self._closure(name, self.downstream)
+
+    def subgraph(self, names: set[str]) -> AssetGraph:
+        """Graph restricted to the given nodes."""
+        assets = [
+            AssetInfo(**{**vars(asset), "deps": [d for d in asset.deps if d in names]})
+            for name, asset in self.assets.items()
+            if name in names
+        ]
+        graph = AssetGraph(assets)
+        for name in names:
+            graph.upstream.setdefault(name, set())
+            graph.downstream.setdefault(name, set())
+        return graph
+
+    def topological_levels(self) -> list[list[str]]:
+        """Group nodes into levels that can run in parallel (Kahn's algorithm).
+
+        Level 0 holds nodes without dependencies; every other node sits one
+        level below its deepest dependency.
+        """
+        remaining = {name: len(deps) for name, deps in self.upstream.items()}
+        level = sorted(name for name, count in remaining.items() if count == 0)
+        levels = []
+        while level:
+            levels.append(level)
+            next_level = set()
+            for name in level:
+                for dependent in self.downstream[name]:
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0:
+                        next_level.add(dependent)
+            level = sorted(next_level)
+
+        placed = sum(len(names) for names in levels)
+        if placed != len(remaining):
+            stuck = sorted(name for name, count in remaining.items() if count > 0)
+            raise CycleError(stuck)
+        return levels
+
+    def critical_path(self) -> list[str]:
+        """Longest dependency chain, which bounds the run time of a full run."""
+        longest: dict[str, list[str]] = {}
+        for level in self.topological_levels():
+            for name in level:
+                best: list[str] = []
+                for dep in self.upstream[name]:
+                    if len(longest[dep]) > len(best):
+                        best = longest[dep]
+                longest[name] = [*best, name]
+        return max(longest.values(), key=len, default=[])
+
+    def to_dict(self) -> dict:
+        """JSON-serializable summary of the graph."""
+        levels = self.topological_levels()
+        return {
+            "nodes": [
+                {
+                    "name": name,
+                    "layer": self.assets[name].layer if name in self.assets else None,
+                    "pool": self.assets[name].pool if name in self.assets else None,
+                    "external": name not in self.assets,
+                    "deps": sorted(self.upstream[name]),
+                }
+                for name in self.nodes
+            ],
+            "edges": [list(edge) for edge in self.edges()],
+            "levels": levels,
+            "max_parallelism": max((len(level) for level in levels), default=0),
+            "critical_path": self.critical_path(),
+        }
+
+    def to_json(self) -> str:
+        """Render the graph summary as JSON."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_dot(self) -> str:
+        """Render the graph in Graphviz DOT format, clustered by layer."""
+        lines = ["digraph polster {", "  rankdir=LR;", "  node [shape=box];"]
+        layers: dict[str, list[str]] = {}
+        for name, asset in self.assets.items():
+            layers.setdefault(asset.layer, []).append(name)
+        for layer, names in sorted(layers.items()):
+            lines.append(f'  subgraph "cluster_{layer}" {{')
+            lines.append(f'    label="{layer}";')
+            lines.extend(f'    "{name}";' for name in sorted(names))
+            lines.append("  }")
+        lines.extend(f'  "{name}" [style=dashed];' for name in self.external)
+        lines.extend(f'  "{src}" -> "{dst}";' for src, dst in self.edges())
+        lines.append("}")
+        return "\n".join(lines)
@@ -0,0 +1,329 @@
+"""Cached index of the assets defined in a Polster project.
+
+Assets are discovered by parsing the ``@asset`` decorators in
+``src/orchestration/assets/<layer>/*.py`` with ``ast`` (nothing is imported).
+The result is persisted in ``.polster/index.json`` and each file is only
+re-parsed when its modification time or size changes.
+"""
+
+from __future__ import annotations
+
+import ast
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+LAYERS = ("bronze", "silver", "gold")
+INDEX_FILE = Path(".polster") / "index.json"
+INDEX_VERSION = 2
+POOL_TAG = "polster/pool"
+
+
+@dataclass
+class AssetInfo:
+    """An asset as declared by its ``@asset`` decorator."""
+
+    function: str
+    layer: str
+    name: str
+    description: str
+    file: str
+    deps: list[str] = field(default_factory=list)
+    pool: str | None = None
+    core_file: str | None = None
+
+
+def _literal(node: ast.expr) -> object:
+    """Evaluate a literal node, returning None for anything dynamic."""
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return None
+
+
+def _dep_names(node: ast.expr) -> list[str]:
+    """Extract dependency names from a ``deps=`` argument."""
+    if not isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+        return []
+    names = []
+    for item in node.elts:
+        if isinstance(item, ast.Constant) and isinstance(item.value, str):
+            names.append(item.value)
+        elif isinstance(item, ast.Name):
+            # deps=[run_bronze_orders] referencing the upstream asset function
+            names.append(item.id)
+        elif (
+            isinstance(item, ast.Call)
+            and getattr(item.func, "id", getattr(item.func, "attr", None)) == "AssetKey"
+            and item.args
+        ):
+            key = _literal(item.args[0])
+            if isinstance(key, str):
+                names.append(key)
+            elif isinstance(key, (list, tuple)) and key:
+                names.append(str(key[-1]))
+    return names
+
+
+def _asset_decorator(node: ast.FunctionDef) -> ast.expr | None:
+    """Return the ``@asset`` decorator of a function, if it has one."""
+    for decorator in node.decorator_list:
+        target = decorator.func if isinstance(decorator, ast.Call) else decorator
+        if getattr(target, "id", getattr(target, "attr", None)) == "asset":
+            return decorator
+    return None
+
+
+def _core_file(tree: ast.Module) -> str | None:
+    """Find the core module an orchestration file imports its logic from."""
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.module:
+            parts = node.module.split(".")
+            if parts[0] == "src":
+                parts = parts[1:]
+            if len(parts) == 2 and parts[0] == "core":
+                return f"src/core/{parts[1]}.py"
+    return None
+
+
+def parse_asset_file(path: Path, layer: str, relative: str) -> list[AssetInfo]:
+    """Parse one orchestration module and return the assets it defines."""
+    tree = ast.parse(path.read_bytes(), filename=str(path))
+    core_file = _core_file(tree)
+    assets = []
+    for node in tree.body:
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        decorator = _asset_decorator(node)
+        if decorator is None:
+            continue
+
+        kwargs = (
+            {kw.arg: kw.value for kw in decorator.keywords if kw.arg}
+            if isinstance(decorator, ast.Call)
+            else {}
+        )
+        asset_layer = _literal(kwargs["group_name"]) if "group_name" in kwargs else None
+        if not isinstance(asset_layer, str):
+            asset_layer = layer
+
+        prefix = f"run_{asset_layer}_"
+        name = node.name[len(prefix) :] if node.name.startswith(prefix) else node.name
+
+        description = (
+            _literal(kwargs["description"]) if "description" in kwargs else None
+        )
+        if not isinstance(description, str):
+            description = f"{asset_layer.title()} asset for {name}"
+
+        op_tags = _literal(kwargs["op_tags"]) if "op_tags" in kwargs else None
+        pool = op_tags.get(POOL_TAG) if isinstance(op_tags, dict) else None
+
+        assets.append(
+            AssetInfo(
+                function=node.name,
+                layer=asset_layer,
+                name=name,
+                description=description,
+                file=relative,
+                deps=_dep_names(kwargs["deps"]) if "deps" in kwargs else [],
+                pool=pool,
+                core_file=core_file,
+            )
+        )
+    return assets
+
+
+def parse_core_outputs(path: Path) -> list[list[str]]:
+    """Find the snapshots a core module writes as [layer, filename prefix] pairs.
+
+    Recognizes ``write_parquet(df, "silver", f"silver_orders_{timestamp}.parquet")``
+    style calls; the prefix is the literal text before the first placeholder.
+    """
+    tree = ast.parse(path.read_bytes(), filename=str(path))
+    outputs = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        if (
+            getattr(node.func, "id", getattr(node.func, "attr", None))
+            != "write_parquet"
+        ):
+            continue
+        args = list(node.args[1:3])
+        keywords = {kw.arg: kw.value for kw in node.keywords if kw.arg}
+        layer_node = keywords.get("layer", args[0] if args else None)
+        filename_node = keywords.get("filename", args[1] if len(args) > 1 else None)
+        if not (
+            isinstance(layer_node, ast.Constant) and isinstance(layer_node.value, str)
+        ):
+            continue
+        if isinstance(filename_node, ast.JoinedStr) and filename_node.values:
+            first = filename_node.values[0]
+            if not (isinstance(first, ast.Constant) and first.value):
+                continue
+            prefix = first.value
+        elif isinstance(filename_node, ast.Constant) and isinstance(
+            filename_node.value, str
+        ):
+            prefix = filename_node.value.removesuffix(".parquet")
+        else:
+            continue
+        if [layer_node.value, prefix] not in outputs:
+            outputs.append([layer_node.value, prefix])
+    return outputs
+
+
+def _cached(
+    path: Path, relative: str, cached: dict[str, dict], key: str, parse
+) -> tuple[dict, bool]:
+    """Reuse a cached entry when mtime and size match, else parse the file.
+
+    Returns the entry and whether it had to be (re-)parsed.
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return {"mtime_ns": 0, "size": 0, key: []}, relative in cached
+    previous = cached.get(relative)
+    if (
+        previous is not None
+        and previous["mtime_ns"] == stat.st_mtime_ns
+        and previous["size"] == stat.st_size
+    ):
+        return previous, False
+    try:
+        parsed = parse(path)
+    except (OSError, SyntaxError, ValueError):
+        parsed = []
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, key: parsed}, True
+
+
+class ProjectIndex:
+    """Assets of a project, keyed by the orchestration file they live in."""
+
+    def __init__(
+        self,
+        project_path: Path,
+        files: dict[str, dict],
+        core_files: dict[str, dict] | None = None,
+    ):
+        self.project_path = project_path
+        self._assets = sorted(
+            (
+                AssetInfo(**asset)
+                for entry in files.values()
+                for asset in entry["assets"]
+            ),
+            key=_sort_key,
+        )
+        self._by_function = {asset.function: asset for asset in self._assets}
+        self._core_files = core_files or {}
+
+    @classmethod
+    def load(cls, project_path: Path) -> ProjectIndex:
+        """Load the cached index, re-parsing only files that changed."""
+        index_path = project_path / INDEX_FILE
+        cached: dict[str, dict] = {}
+        cached_core: dict[str, dict] = {}
+        try:
+            data = json.loads(index_path.read_text(encoding="utf-8"))
+            if data.get("version") == INDEX_VERSION:
+                cached = data.get("files", {})
+                cached_core = data.get("core_files", {})
+        except (OSError, ValueError):
+            pass
+
+        files: dict[str, dict] = {}
+        changed = False
+        assets_root = project_path / "src" / "orchestration" / "assets"
+        for layer in LAYERS:
+            try:
+                entries = list(os.scandir(assets_root / layer))
+            except FileNotFoundError:
+                continue
+            for entry in entries:
+                if not entry.name.endswith(".py") or entry.name == "__init__.py":
+                    continue
+                relative = f"src/orchestration/assets/{layer}/{entry.name}"
+                files[relative], parsed = _cached(
+                    Path(entry.path),
+                    relative,
+                    cached,
+                    "assets",
+                    lambda path, layer=layer, relative=relative: [
+                        asdict(asset)
+                        for asset in parse_asset_file(path, layer, relative)
+                    ],
+                )
+                changed = changed or parsed
+
+        # Core modules are indexed too, for the snapshots each asset writes
+        core_files: dict[str, dict] = {}
+        for entry in files.values():
+            for asset in entry["assets"]:
+                relative = asset.get("core_file")
+                if relative and relative not in core_files:
+                    core_files[relative], parsed = _cached(
+                        project_path / relative,
+                        relative,
+                        cached_core,
+                        "outputs",
+                        parse_core_outputs,
+                    )
+                    changed = changed or parsed
+
+        if (
+            changed
+            or files.keys() != cached.keys()
+            or core_files.keys() != cached_core.keys()
+        ):
+            _save(index_path, files, core_files)
+        return cls(project_path, files, core_files)
+
+    def assets(self, layer: str | None = None) -> list[AssetInfo]:
+        """Return all assets, optionally restricted to one layer."""
+        if layer is None:
+            return list(self._assets)
+        return [asset for asset in self._assets if asset.layer == layer]
+
+    def get(self, function: str) -> AssetInfo | None:
+        """Look up an asset by its function name (its Dagster asset key)."""
+        return self._by_function.get(function)
+
+    def outputs(self, asset: AssetInfo) -> list[tuple[str, str]]:
+        """Snapshots an asset writes, as (layer, filename prefix) pairs.
+
+        Falls back to the ``<layer>_<name>_`` naming convention used by the
+        asset templates when the core module has no recognizable writes.
+        """
+        entry = self._core_files.get(asset.core_file or "")
+        if entry and entry["outputs"]:
+            return [(layer, prefix) for layer, prefix in entry["outputs"]]
+        return [(asset.layer, f"{asset.layer}_{asset.name}_")]
+
+
+def _sort_key(asset: AssetInfo) -> tuple[int, str]:
+    """Order assets by layer (bronze, silver, gold) and then by name."""
+    rank = LAYERS.index(asset.layer) if asset.layer in LAYERS else len(LAYERS)
+    return rank, asset.name
+
+
+def _save(
+    index_path: Path, files: dict[str, dict], core_files: dict[str, dict]
+) -> None:
+    """Persist the index atomically; a read-only project just skips caching."""
+    data = {"version": INDEX_VERSION, "files": files, "core_files": core_files}
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = index_path.with_name(index_path.name + ".tmp")
+        tmp.write_text(json.dumps(data, indent=1), encoding="utf-8")
+        os.replace(tmp, index_path)
+    except OSError:
+        pass
+
+
+def load_index(project_path: Path) -> ProjectIndex:
+    """Load the asset index for a project (shared by all CLI commands)."""
+    return ProjectIndex.load(project_path)
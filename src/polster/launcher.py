@@ -1,8 +1,13 @@
 """
 Polster CLI Launcher - Automatic Virtual Environment Management
 
-This launcher automatically detects and activates the project's virtual environment
-before running the actual CLI commands.
+This launcher automatically detects the project's virtual environment and runs
+the actual CLI commands inside it. When polster is installed in the project's
+``.venv`` the launcher re-executes itself with that interpreter; otherwise the
+venv is activated for any subprocesses the command starts.
+
+Startup is kept cheap: ``--version`` never imports the CLI, and commands that
+don't need a project (``init``, ``--help``) skip the project lookup.
 """
 
 import os
@@ -10,6 +15,14 @@ import subprocess
 import sys
 from pathlib import Path
 
+# Set on re-exec so the child interpreter never re-executes again
+REEXEC_ENV = "POLSTER_LAUNCHER_REEXEC"
+# Project root found by the parent launcher, reused by the child
+PROJECT_ROOT_ENV = "POLSTER_PROJECT_ROOT"
+
+# Arguments that don't need a project directory or its venv
+PROJECTLESS_ARGS = {"init", "--help", "--install-completion", "--show-completion"}
+
 
 def find_project_root(start_path: Path | None = None) -> Path:
     """Find the polster project root by searching for pyproject.toml."""
@@ -26,6 +39,18 @@ def find_project_root(start_path: Path | None = None) -> Path:
     raise FileNotFoundError("Could not find polster project root. Are you in a polster project directory?")
 
 
+def venv_python(venv_path: Path) -> Path:
+    """Path of the Python interpreter inside a virtual environment."""
+    if os.name == "nt":  # Windows
+        return venv_path / "Scripts" / "python.exe"
+    return venv_path / "bin" / "python"
+
+
+def venv_bin_dir(venv_path: Path) -> Path:
+    """Directory holding the venv's executables."""
+    return venv_path / ("Scripts" if os.name == "nt" else "bin")
+
+
 def create_venv(venv_path: Path) -> None:
     """Create a virtual environment at the specified path."""
     print(f"Creating virtual environment in {venv_path}")
@@ -34,39 +59,103 @@ def create_venv(venv_path: Path) -> None:
 
 def install_package_in_venv(venv_path: Path, project_root: Path) -> None:
     """Install the polster package in editable mode within the venv."""
-    if os.name == "nt":  # Windows
-        pip_path = venv_path / "Scripts" / "pip.exe"
-    else:  # Unix
-        pip_path = venv_path / "bin" / "pip"
+    pip_path = venv_bin_dir(venv_path) / ("pip.exe" if os.name == "nt" else "pip")
 
     print("Installing polster in virtual environment...")
     subprocess.run([str(pip_path), "install", "-e", str(project_root)], check=True)
 
 
-def activate_venv_and_run(venv_path: Path, args: list[str]) -> None:
-    """Activate the virtual environment and run the polster CLI."""
-    if os.name == "nt":  # Windows
-        # On Windows, we need to set environment variables
-        env = os.environ.copy()
-        env["VIRTUAL_ENV"] = str(venv_path)
-        env["PATH"] = str(venv_path / "Scripts") + os.pathsep + env.get("PATH", "")
-        # Run the actual CLI
-        from polster.cli import app
-        # Remove 'polster' from args if present
-        if args and args[0].endswith("polster"):
-            args = args[1:]
-        app(args=args)
-    else:  # Unix
-        # On Unix, set environment variables for activation
-        env = os.environ.copy()
-        env["VIRTUAL_ENV"] = str(venv_path)
-        env["PATH"] = str(venv_path / "bin") + os.pathsep + env.get("PATH", "")
-
-        # Run the actual CLI
-        from polster.cli import app
-        if args and args[0].endswith("polster"):
-            args = args[1:]
-        app(args=args)
+def use_shared_env() -> bool:
+    """Whether POLSTER_SHARED_ENV asks for venvs linked from the shared cache."""
+    enabled = os.environ.get("POLSTER_SHARED_ENV", "").lower() in {"1", "true", "yes", "on"}
+    return enabled and os.name != "nt"
+
+
+def is_running_in_venv(venv_path: Path) -> bool:
+    """Check whether the current interpreter belongs to the venv."""
+    try:
+        return Path(sys.prefix).resolve() == venv_path.resolve()
+    except OSError:
+        return False
+
+
+def polster_installed_in_venv(venv_path: Path) -> bool:
+    """Check whether the polster CLI is installed in the venv.
+
+    Looks for polster's dist-info in site-packages instead of starting the
+    venv's interpreter, which would cost as much as the re-exec itself.
+    """
+    if os.name == "nt":
+        site_dirs = [venv_path / "Lib" / "site-packages"]
+    else:
+        site_dirs = list((venv_path / "lib").glob("python*/site-packages"))
+    return any(
+        any(site_dir.glob("polster-*.dist-info")) for site_dir in site_dirs
+    )
+
+
+def activated_env(venv_path: Path) -> dict[str, str]:
+    """Environment variables of an activated venv."""
+    env = os.environ.copy()
+    env["VIRTUAL_ENV"] = str(venv_path)
+    env["PATH"] = str(venv_bin_dir(venv_path)) + os.pathsep + env.get("PATH", "")
+    env.pop("PYTHONHOME", None)
+    return env
+
+
+def reexec_in_venv(venv_path: Path, project_root: Path, args: list[str]) -> None:
+    """Replace this process with the launcher running on the venv's Python."""
+    python = str(venv_python(venv_path))
+    env = activated_env(venv_path)
+    env[REEXEC_ENV] = "1"
+    env[PROJECT_ROOT_ENV] = str(project_root)
+    command = [python, "-m", "polster.launcher", *args]
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+    if os.name == "nt":
+        # Windows has no real exec; os.execve would return control to the
+        # shell before the child finishes.
+        sys.exit(subprocess.call(command, env=env))
+    os.execve(python, command, env)
+
+
+def run_cli(args: list[str]) -> None:
+    """Run the polster CLI in this interpreter."""
+    from polster.cli import app
+
+    app(args=args)
+
+
+def activate_venv_and_run(
+    venv_path: Path,
+    args: list[str],
+    project_root: Path | None = None,
+    allow_reexec: bool = True,
+) -> None:
+    """Run the polster CLI inside the project's virtual environment.
+
+    Re-executes with the venv's interpreter when polster is installed there, so
+    the command sees the project's packages. Otherwise the CLI runs in this
+    interpreter with the venv activated for the subprocesses it starts
+    (``dagster``, ``uv``, ``pip``).
+    """
+    if args and args[0].endswith("polster"):
+        args = args[1:]
+    if project_root is None:
+        project_root = venv_path.parent
+
+    if (
+        allow_reexec
+        and not is_running_in_venv(venv_path)
+        and venv_python(venv_path).exists()
+        and polster_installed_in_venv(venv_path)
+    ):
+        reexec_in_venv(venv_path, project_root, args)
+        return
+
+    os.environ.update(activated_env(venv_path))
+    run_cli(args)
 
 
 def is_development_environment(project_root: Path) -> bool:
@@ -78,24 +167,31 @@ def is_development_environment(project_root: Path) -> bool:
 def main() -> None:
     """Main entry point that handles venv auto-activation."""
     try:
-        # Check if this is an init command (doesn't need existing project)
-        args = sys.argv
-        if len(args) >= 2 and args[1] == "init":
-            # For init command, run directly without venv activation
-            from polster.cli import app
-            app(args=args[1:])  # Remove 'polster' from args
+        args = sys.argv[1:]
+        # Markers left by a parent launcher that re-executed into the venv;
+        # removed so nested `polster` calls from subprocesses start fresh
+        reexecuted = os.environ.pop(REEXEC_ENV, None) is not None
+        known_root = os.environ.pop(PROJECT_ROOT_ENV, None)
+
+        # Fast path: answer --version without importing typer or rich
+        if args == ["--version"]:
+            from polster import __version__
+
+            print(f"polster {__version__}")
+            return
+
+        # init, --help and bare `polster` don't need an existing project
+        if not args or args[0] in PROJECTLESS_ARGS:
+            run_cli(args)
             return
 
         # For all other commands, find project and activate venv
-        project_root = find_project_root()
+        project_root = Path(known_root) if known_root else find_project_root()
 
         # Check if we're in the development environment
         if is_development_environment(project_root):
             # In development, run CLI directly without venv
-            from polster.cli import app
-            if args and args[0].endswith("polster"):
-                args = args[1:]  # Remove 'polster' from args
-            app(args=args)
+            run_cli(args)
             return
 
         # For generated projects, use venv activation
@@ -103,12 +199,18 @@ def main() -> None:
 
         # Check if venv exists
         if not venv_path.exists():
-            print("Virtual environment not found. Creating one...")
-            create_venv(venv_path)
-            install_package_in_venv(venv_path, project_root)
+            if use_shared_env():
+                from polster.envcache import create_shared_venv
+
+                print("Virtual environment not found. Linking the shared environment...")
+                create_shared_venv(project_root, venv_path)
+            else:
+                print("Virtual environment not found. Creating one...")
+                create_venv(venv_path)
+                install_package_in_venv(venv_path, project_root)
 
         # Activate venv and run CLI
-        activate_venv_and_run(venv_path, sys.argv)
+        activate_venv_and_run(venv_path, args, project_root, allow_reexec=not reexecuted)
 
     except FileNotFoundError as e:
         print(f"Error: {e}")
@@ -0,0 +1,194 @@
+"""Ad-hoc SQL over the lake layers, run by ``polster query``.
+
+This script runs inside the project's virtual environment with ``src`` on
+``sys.path``, so tables are read through the project's own
+``core/storage.py`` and whatever backend the assets use. References such as
+``silver.orders`` are resolved to a Delta table or to parquet snapshots and
+registered as lazy scans in a polars ``SQLContext``; the query is executed
+lazily, so only the columns and row groups it needs are read.
+
+Results stream to stdout (table, CSV or NDJSON) or to a CSV, NDJSON or
+parquet file. It is not imported by the CLI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+
+TABLE_REF = re.compile(
+    r"\b(bronze|silver|gold)\.([A-Za-z_][A-Za-z0-9_]*)\b", re.IGNORECASE
+)
+DEFAULT_TABLE_ROWS = 50
+
+
+class QueryError(Exception):
+    """A table reference that can't be resolved or an invalid option."""
+
+
+def snapshot_prefix(
+    storage, layer: str, name: str, args: argparse.Namespace
+) -> str | None:
+    """Prefix of the snapshots of ``layer.name`` in the requested range.
+
+    ``silver.orders`` matches ``orders_<timestamp>.parquet`` and
+    ``silver_orders_<timestamp>.parquet``.
+    """
+    for prefix in (f"{name}_", f"{layer}_{name}_"):
+        if storage.list_snapshots(layer, prefix, args.since, args.until):
+            return prefix
+    return None
+
+
+def delta_table(storage, layer: str, name: str) -> str | None:
+    """Name of the Delta table backing ``layer.name``, if there is one."""
+    for candidate in (name, f"{layer}_{name}"):
+        try:
+            if storage.delta_exists(layer, candidate):
+                return candidate
+        except (ImportError, ValueError):
+            # deltalake not installed, or a backend without Delta support
+            return None
+    return None
+
+
+def resolve_table(storage, layer: str, name: str, args: argparse.Namespace):
+    """Lazy scan for one ``layer.name`` reference."""
+    table = delta_table(storage, layer, name)
+    if table is not None:
+        return storage.scan_delta(layer, table, args.version)
+    if args.version is not None:
+        raise QueryError(f"{layer}.{name} is not a Delta table; --version needs one")
+
+    prefix = snapshot_prefix(storage, layer, name, args)
+    if prefix is None:
+        raise QueryError(
+            f"No snapshots or Delta table found for {layer}.{name} "
+            f"(looked for {name}_* and {layer}_{name}_* in {layer})"
+        )
+    if args.snapshots == "latest":
+        return storage.scan_parquet_range(
+            layer, prefix, args.since, args.until, last_n=1
+        )
+    # Across snapshots, _snapshot_ts tells the rows of each one apart
+    return storage.scan_parquet_range(
+        layer, prefix, args.since, args.until, include_snapshot_ts=True
+    )
+
+
+def build_query(sql: str, args: argparse.Namespace):
+    """Register every referenced table and return the lazy query result."""
+    import polars as pl
+    from core import storage
+
+    context = pl.SQLContext()
+    registered: dict[tuple[str, str], str] = {}
+
+    def replace(match: re.Match) -> str:
+        layer, name = match.group(1).lower(), match.group(2)
+        key = (layer, name)
+        if key not in registered:
+            registered[key] = f"{layer}__{name}"
+            context.register(registered[key], resolve_table(storage, layer, name, args))
+        return registered[key]
+
+    rewritten = TABLE_REF.sub(replace, sql)
+    if not registered:
+        raise QueryError(
+            "The query references no tables; use layer.table, e.g. silver.orders"
+        )
+    return context.execute(rewritten, eager=False)
+
+
+def iter_batches(lf):
+    """Result batches as they are produced (whole result on older polars)."""
+    if hasattr(lf, "collect_batches"):
+        yield from lf.collect_batches()
+    else:
+        yield lf.collect()
+
+
+def write_output(lf, path: str) -> None:
+    """Stream the result into a CSV, NDJSON or parquet file."""
+    lower = path.lower()
+    if lower.endswith(".parquet"):
+        lf.sink_parquet(path)
+    elif lower.endswith(".csv"):
+        lf.sink_csv(path)
+    elif lower.endswith((".ndjson", ".jsonl")):
+        lf.sink_ndjson(path)
+    else:
+        raise QueryError("Output file must end in .csv, .ndjson, .jsonl or .parquet")
+    print(f"Wrote {path}", file=sys.stderr)
+
+
+def write_stdout(lf, output_format: str, limit: int | None) -> None:
+    """Print the result as a table, or stream it as CSV or NDJSON."""
+    import polars as pl
+
+    if output_format == "table":
+        limit = limit or DEFAULT_TABLE_ROWS
+        df = lf.limit(limit).collect()
+        with pl.Config(tbl_rows=limit, tbl_cols=-1, fmt_str_lengths=60):
+            print(df)
+        return
+
+    if limit is not None:
+        lf = lf.limit(limit)
+    header = True
+    for batch in iter_batches(lf):
+        if output_format == "csv":
+            sys.stdout.write(batch.write_csv(include_header=header))
+            header = False
+        else:
+            sys.stdout.write(batch.write_ndjson())
+        sys.stdout.flush()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("sql", help="SQL query over layer.table references")
+    parser.add_argument("--output", help="Write to a .csv, .ndjson or .parquet file")
+    parser.add_argument(
+        "--format", default="table", choices=["table", "csv", "json"], dest="fmt"
+    )
+    parser.add_argument("--limit", type=int, help="Maximum rows to return")
+    parser.add_argument("--snapshots", default="latest", choices=["latest", "all"])
+    parser.add_argument("--since", help="Earliest snapshot timestamp, e.g. 20260101")
+    parser.add_argument(
+        "--until", help="Latest snapshot timestamp, e.g. 20260131T235959Z"
+    )
+    parser.add_argument("--version", help="Delta table version or timestamp")
+    parser.add_argument("--explain", action="store_true", help="Print the query plan")
+    args = parser.parse_args()
+    if args.version is not None and args.version.isdigit():
+        args.version = int(args.version)
+
+    try:
+        lf = build_query(args.sql, args)
+        if args.explain:
+            print(lf.explain())
+        elif args.output:
+            write_output(
+                lf if args.limit is None else lf.limit(args.limit), args.output
+            )
+        else:
+            write_stdout(lf, args.fmt, args.limit)
+    except QueryError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except BrokenPipeError:
+        # Output piped into head and friends
+        sys.stderr.close()
+        return 0
+    except Exception as e:
+        # Polars appends the resolved plan; the first line says what failed
+        message = str(e).strip().splitlines()[0] if str(e).strip() else ""
+        print(f"Error: {type(e).__name__}: {message}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+"""Read the schema of a sample file for ``polster add-asset --schema-from``.
+
+Runs with the project's Python, where polars is installed, and prints the
+columns as JSON ``[[name, "pl.<dtype>"], ...]`` so the CLI can render a
+``pl.Schema`` constant without importing polars itself.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+
+def dtype_code(dtype) -> str:
+    """Python source that recreates a polars data type."""
+    import polars as pl
+
+    if isinstance(dtype, pl.Datetime):
+        return f"pl.Datetime({dtype.time_unit!r}, {dtype.time_zone!r})"
+    if isinstance(dtype, pl.Duration):
+        return f"pl.Duration({dtype.time_unit!r})"
+    if isinstance(dtype, pl.Decimal):
+        return f"pl.Decimal({dtype.precision!r}, {dtype.scale!r})"
+    if isinstance(dtype, pl.Array):
+        return f"pl.Array({dtype_code(dtype.inner)}, {dtype.shape!r})"
+    if isinstance(dtype, pl.List):
+        return f"pl.List({dtype_code(dtype.inner)})"
+    if isinstance(dtype, pl.Struct):
+        fields = ", ".join(f"{f.name!r}: {dtype_code(f.dtype)}" for f in dtype.fields)
+        return f"pl.Struct({{{fields}}})"
+    if isinstance(dtype, pl.Enum):
+        return f"pl.Enum({dtype.categories.to_list()!r})"
+    if isinstance(dtype, pl.Categorical):
+        return "pl.Categorical()"
+    return f"pl.{dtype.base_type().__name__}"
+
+
+def sample_schema(path: Path):
+    """Schema of a parquet, CSV, JSON or NDJSON sample."""
+    import polars as pl
+
+    suffix = path.suffix.lower()
+    if suffix == ".parquet":
+        return pl.scan_parquet(path).collect_schema()
+    if suffix == ".csv":
+        # Scan the whole sample so rare values don't narrow the inferred types
+        return pl.read_csv(path, infer_schema_length=None).schema
+    if suffix in {".ndjson", ".jsonl"}:
+        return pl.read_ndjson(path, infer_schema_length=None).schema
+    if suffix == ".json":
+        return pl.read_json(path, infer_schema_length=None).schema
+    raise ValueError(f"Unsupported sample file type: {suffix}")
+
+
+def main() -> int:
+    schema = sample_schema(Path(sys.argv[1]))
+    json.dump([[name, dtype_code(dtype)] for name, dtype in schema.items()], sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
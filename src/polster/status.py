@@ -0,0 +1,404 @@
+"""Snapshot status for ``polster status``.
+
+Finds the latest snapshot of every asset on local disk or ADLS, and reads row
+counts from parquet footers with ranged reads, so no data pages are scanned.
+Only the standard library is needed (plus the Azure SDK for ADLS).
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+
+from polster.graph import AssetGraph
+from polster.index import AssetInfo, ProjectIndex
+
+SNAPSHOT_TIME_FORMATS = ("%Y%m%dT%H%M%SZ", "%Y%m%dT%H%M%S", "%Y%m%d", "%Y-%m-%d")
+FOOTER_READ_SIZE = 64 * 1024
+
+# Settings that select each remote backend in the project's core/backends.py;
+# without them the project falls back to local storage
+_REMOTE_BACKENDS = {
+    "adls": ("ADLS_ACCOUNT_NAME", "ADLS_ACCOUNT_KEY", "ADLS_CONTAINER"),
+    "s3": ("S3_BUCKET",),
+    "fsspec": ("FSSPEC_URL",),
+}
+
+
+class UnsupportedStoreError(ValueError):
+    """Raised when ``polster status`` can't read the project's storage backend."""
+
+
+def parse_snapshot_time(text: str) -> datetime | None:
+    """Timestamp in a snapshot name, as accepted by the project's core/storage.py."""
+    for pattern in SNAPSHOT_TIME_FORMATS:
+        try:
+            return datetime.strptime(text, pattern).replace(tzinfo=UTC)
+        except ValueError:
+            pass
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+def is_snapshot_of(name: str, prefix: str) -> bool:
+    """Whether ``name`` was written under ``prefix``: the rest is just its timestamp.
+
+    ``bronze_orders_items_<ts>.parquet`` belongs to another asset than
+    ``bronze_orders_``. A prefix that is a whole name matches that file only.
+    """
+    if not name.startswith(prefix) or not name.endswith(".parquet"):
+        return False
+    rest = name[len(prefix) : -len(".parquet")]
+    return rest == "" or parse_snapshot_time(rest) is not None
+
+
+@dataclass
+class Snapshot:
+    """A parquet file in a layer."""
+
+    layer: str
+    name: str
+    path: str
+    size: int
+    modified: datetime
+    rows: int | None = None
+
+    @property
+    def timestamp(self) -> datetime:
+        """When the snapshot was produced: the filename stamp, else its mtime."""
+        stem = self.name.removesuffix(".parquet")
+        return parse_snapshot_time(stem.rsplit("_", 1)[-1]) or self.modified
+
+
+@dataclass
+class AssetStatus:
+    """Latest snapshot of an asset and whether it is older than its upstreams."""
+
+    asset: AssetInfo
+    snapshot: Snapshot | None
+    stale_because: list[str] = field(default_factory=list)
+
+    @property
+    def age_seconds(self) -> float | None:
+        """Seconds since the latest snapshot was produced."""
+        if self.snapshot is None:
+            return None
+        return (datetime.now(UTC) - self.snapshot.timestamp).total_seconds()
+
+
+# =============================================================================
+# Parquet footer
+# =============================================================================
+
+
+class _CompactReader:
+    """Just enough of the Thrift compact protocol to walk parquet metadata."""
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.pos = 0
+
+    def byte(self) -> int:
+        value = self.data[self.pos]
+        self.pos += 1
+        return value
+
+    def varint(self) -> int:
+        shift = result = 0
+        while True:
+            byte = self.byte()
+            result |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return result
+            shift += 7
+
+    def zigzag(self) -> int:
+        value = self.varint()
+        return (value >> 1) ^ -(value & 1)
+
+    def skip(self, field_type: int) -> None:
+        if field_type in (1, 2):  # bool, encoded in the field header
+            return
+        if field_type == 3:  # byte
+            self.pos += 1
+        elif field_type in (4, 5, 6):  # i16, i32, i64
+            self.varint()
+        elif field_type == 7:  # double
+            self.pos += 8
+        elif field_type == 8:  # binary
+            length = self.varint()
+            self.pos += length
+        elif field_type in (9, 10):  # list, set
+            header = self.byte()
+            size = header >> 4
+            if size == 15:
+                size = self.varint()
+            for _ in range(size):
+                self.skip_element(header & 0x0F)
+        elif field_type == 11:  # map
+            size = self.varint()
+            if size:
+                types = self.byte()
+                for _ in range(size):
+                    self.skip_element(types >> 4)
+                    self.skip_element(types & 0x0F)
+        elif field_type == 12:  # struct
+            self.skip_struct()
+        else:
+            raise ValueError(f"Unknown thrift type {field_type}")
+
+    def skip_element(self, element_type: int) -> None:
+        # Booleans inside containers take a full byte
+        if element_type in (1, 2):
+            self.pos += 1
+        else:
+            self.skip(element_type)
+
+    def fields(self):
+        """Yield (field id, type) for the struct at the current position."""
+        last_id = 0
+        while True:
+            header = self.byte()
+            field_type = header & 0x0F
+            if field_type == 0:
+                return
+            delta = header >> 4
+            last_id = last_id + delta if delta else self.zigzag()
+            yield last_id, field_type
+
+    def skip_struct(self) -> None:
+        for _, field_type in self.fields():
+            self.skip(field_type)
+
+
+def parquet_num_rows(footer: bytes) -> int:
+    """Return ``num_rows`` from serialized parquet FileMetaData."""
+    reader = _CompactReader(footer)
+    for field_id, field_type in reader.fields():
+        if field_id == 3 and field_type == 6:
+            return reader.zigzag()
+        reader.skip(field_type)
+    raise ValueError("num_rows not found in parquet footer")
+
+
+def read_num_rows(size: int, read_range: Callable[[int, int], bytes]) -> int:
+    """Read the row count of a parquet file of ``size`` bytes via ranged reads."""
+    length = min(size, FOOTER_READ_SIZE)
+    tail = read_range(size - length, length)
+    if len(tail) < 8 or tail[-4:] != b"PAR1":
+        raise ValueError("not a parquet file")
+    footer_length = struct.unpack("<I", tail[-8:-4])[0]
+    if footer_length + 8 > len(tail):
+        # Unusually large footer (very wide tables): fetch exactly what's needed
+        tail = read_range(size - footer_length - 8, footer_length + 8)
+    return parquet_num_rows(tail[-footer_length - 8 : -8])
+
+
+# =============================================================================
+# Snapshot stores
+# =============================================================================
+
+
+class LocalSnapshotStore:
+    """Snapshots under ``<project>/data/<layer>/``."""
+
+    backend = "local"
+
+    def __init__(self, project_path: Path):
+        self.data_dir = project_path / "data"
+
+    def list_layer(self, layer: str) -> list[Snapshot]:
+        snapshots = []
+        try:
+            entries = list(os.scandir(self.data_dir / layer))
+        except FileNotFoundError:
+            return snapshots
+        for entry in entries:
+            if entry.is_file() and entry.name.endswith(".parquet"):
+                stat = entry.stat()
+                snapshots.append(
+                    Snapshot(
+                        layer=layer,
+                        name=entry.name,
+                        path=entry.path,
+                        size=stat.st_size,
+                        modified=datetime.fromtimestamp(stat.st_mtime, UTC),
+                    )
+                )
+        return snapshots
+
+    def read_range(self, snapshot: Snapshot, offset: int, length: int) -> bytes:
+        with open(snapshot.path, "rb") as f:
+            f.seek(offset)
+            return f.read(length)
+
+
+class AdlsSnapshotStore:
+    """Snapshots under ``<ADLS_BASE_PATH>/<layer>/`` in an ADLS container."""
+
+    backend = "adls"
+
+    def __init__(
+        self, account_name: str, account_key: str, container: str, base_path: str
+    ):
+        from azure.storage.filedatalake import DataLakeServiceClient
+
+        service = DataLakeServiceClient(
+            account_url=os.getenv("ADLS_ACCOUNT_URL")
+            or f"https://{account_name}.dfs.core.windows.net",
+            credential=account_key,
+        )
+        self.file_system = service.get_file_system_client(container)
+        self.base_path = base_path
+        self.uri_prefix = f"abfss://{container}@{account_name}.dfs.core.windows.net"
+
+    def list_layer(self, layer: str) -> list[Snapshot]:
+        directory = f"{self.base_path}/{layer}".strip("/")
+        snapshots = []
+        try:
+            paths = list(self.file_system.get_paths(path=directory, recursive=False))
+        except Exception as e:
+            if type(e).__name__ == "ResourceNotFoundError":
+                return snapshots
+            raise
+        for item in paths:
+            name = item.name.split("/")[-1]
+            if item.is_directory or not name.endswith(".parquet"):
+                continue
+            snapshots.append(
+                Snapshot(
+                    layer=layer,
+                    name=name,
+                    path=f"{self.uri_prefix}/{item.name}",
+                    size=item.content_length,
+                    modified=item.last_modified,
+                )
+            )
+        return snapshots
+
+    def read_range(self, snapshot: Snapshot, offset: int, length: int) -> bytes:
+        directory = f"{self.base_path}/{snapshot.layer}".strip("/")
+        file_client = self.file_system.get_file_client(f"{directory}/{snapshot.name}")
+        return file_client.download_file(offset=offset, length=length).readall()
+
+
+def snapshot_store(project_path: Path) -> LocalSnapshotStore | AdlsSnapshotStore:
+    """Pick the store the same way the project's core/storage.py does.
+
+    Raises:
+        UnsupportedStoreError: If the project writes somewhere status can't
+            read (s3, fsspec, the process-local memory backend), or to ADLS
+            without the Azure SDK installed here.
+    """
+    backend = (os.getenv("STORAGE_BACKEND") or "local").lower()
+    required = _REMOTE_BACKENDS.get(backend, ())
+    if backend == "local" or (required and not all(map(os.getenv, required))):
+        return LocalSnapshotStore(project_path)
+    if backend != "adls":
+        raise UnsupportedStoreError(
+            f"polster status does not support the {backend} storage backend "
+            "(supported: local, adls)"
+        )
+    try:
+        return AdlsSnapshotStore(
+            os.environ["ADLS_ACCOUNT_NAME"],
+            os.environ["ADLS_ACCOUNT_KEY"],
+            os.environ["ADLS_CONTAINER"],
+            (os.getenv("ADLS_BASE_PATH") or "polster/data").strip("/"),
+        )
+    except ModuleNotFoundError:
+        raise UnsupportedStoreError(
+            "Reading ADLS needs the Azure SDK: pip install azure-storage-file-datalake"
+        ) from None
+
+
+# =============================================================================
+# Status
+# =============================================================================
+
+
+def collect_status(
+    index: ProjectIndex,
+    store: LocalSnapshotStore | AdlsSnapshotStore,
+    layers: list[str] | None = None,
+    max_workers: int = 16,
+) -> list[AssetStatus]:
+    """Latest snapshot, size, row count and staleness for every asset."""
+    assets = index.assets()
+    wanted = [a for a in assets if layers is None or a.layer in layers]
+    needed_layers = sorted({layer for a in assets for layer, _ in index.outputs(a)})
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        listings = dict(
+            zip(needed_layers, pool.map(store.list_layer, needed_layers), strict=True)
+        )
+
+        latest: dict[str, Snapshot | None] = {}
+        for asset in assets:
+            candidates = [
+                snapshot
+                for layer, prefix in index.outputs(asset)
+                for snapshot in listings.get(layer, [])
+                if is_snapshot_of(snapshot.name, prefix)
+            ]
+            latest[asset.function] = max(
+                candidates, key=lambda s: (s.timestamp, s.name), default=None
+            )
+
+        def with_rows(snapshot: Snapshot) -> None:
+            try:
+                snapshot.rows = read_num_rows(
+                    snapshot.size,
+                    lambda offset, length: store.read_range(snapshot, offset, length),
+                )
+            except (OSError, ValueError, IndexError):
+                snapshot.rows = None
+
+        to_read = [latest[a.function] for a in wanted if latest[a.function]]
+        list(pool.map(with_rows, to_read))
+
+    graph = AssetGraph(assets)
+    statuses = []
+    for asset in wanted:
+        snapshot = latest[asset.function]
+        stale_because = []
+        if snapshot is not None:
+            for upstream in sorted(graph.upstream.get(asset.function, ())):
+                upstream_snapshot = latest.get(upstream)
+                if (
+                    upstream_snapshot
+                    and upstream_snapshot.timestamp > snapshot.timestamp
+                ):
+                    stale_because.append(upstream)
+        statuses.append(AssetStatus(asset, snapshot, stale_because))
+    return statuses
+
+
+def format_age(seconds: float | None) -> str:
+    """Human readable age such as '3m', '5h' or '2d'."""
+    if seconds is None:
+        return "-"
+    for unit, size in (("d", 86400), ("h", 3600), ("m", 60)):
+        if seconds >= size:
+            return f"{int(seconds // size)}{unit}"
+    return f"{max(int(seconds), 0)}s"
+
+
+def format_size(size: int) -> str:
+    """Human readable byte size."""
+    if size < 1024:
+        return f"{size} B"
+    value = float(size)
+    for unit in ("KB", "MB", "GB", "TB"):
+        value /= 1024
+        if value < 1024 or unit == "TB":
+            break
+    return f"{value:.1f} {unit}"
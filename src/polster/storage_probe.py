@@ -0,0 +1,159 @@
+"""Storage throughput probe run by ``polster doctor --storage``.
+
+This script runs inside the project's virtual environment with ``src`` on
+``sys.path`` and goes through the project's own ``core/storage.py``, so it
+measures exactly the backend the assets use (local disk, ADLS, S3 or any
+other registered backend, including emulators such as MinIO). It prints a JSON report on stdout.
+
+It is not imported by the CLI; polars and the project code are only
+available in the project environment.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import os
+import sys
+import time
+import uuid
+
+PROBE_LAYER = "_doctor"
+PAYLOAD_BYTES = 256
+
+
+def percentiles(samples: list[float]) -> dict[str, float]:
+    """p50/p90/p99 and max of latencies in milliseconds (nearest rank)."""
+    ordered = sorted(samples)
+
+    def rank(fraction: float) -> float:
+        index = max(0, min(len(ordered) - 1, round(fraction * len(ordered) + 0.5) - 1))
+        return round(ordered[index] * 1000, 2)
+
+    return {
+        "p50": rank(0.50),
+        "p90": rank(0.90),
+        "p99": rank(0.99),
+        "max": round(ordered[-1] * 1000, 2),
+    }
+
+
+def timed(func, *args):
+    """Run a function and return (seconds, result)."""
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def synthetic_frame(pl, size_bytes: int):
+    """Incompressible DataFrame of roughly ``size_bytes`` of parquet."""
+    rows = max(1, size_bytes // (PAYLOAD_BYTES + 8))
+    return pl.DataFrame(
+        {
+            "id": pl.int_range(rows, eager=True),
+            "payload": [os.urandom(PAYLOAD_BYTES) for _ in range(rows)],
+        }
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="1,8,32", help="File sizes in MB")
+    parser.add_argument("--repeat", type=int, default=3, help="Samples per size")
+    parser.add_argument("--small-ops", type=int, default=20, help="Tiny-file samples")
+    parser.add_argument("--layers", default="bronze,silver,gold", help="Layers to list")
+    args = parser.parse_args()
+
+    import polars as pl
+    from core import storage
+    from core.backends import get_backend
+
+    backend = storage.get_storage_backend()
+    if get_backend().name != backend:
+        backend = f"local ({backend} not configured)"
+    run_id = uuid.uuid4().hex[:8]
+    written: list[str] = []
+    report: dict = {
+        "backend": backend,
+        "target": os.path.dirname(
+            os.path.dirname(storage.resolve_path(PROBE_LAYER, "probe"))
+        ),
+        "throughput": [],
+    }
+
+    try:
+        for size_mb in [float(size) for size in args.sizes.split(",") if size.strip()]:
+            df = synthetic_frame(pl, int(size_mb * 1024 * 1024))
+            buffer = io.BytesIO()
+            df.write_parquet(buffer)
+            file_bytes = buffer.tell()
+
+            write_times, read_times = [], []
+            for i in range(args.repeat):
+                filename = f"probe_{run_id}_{size_mb:g}mb_{i}.parquet"
+                seconds, _ = timed(storage.write_parquet, df, PROBE_LAYER, filename)
+                written.append(filename)
+                write_times.append(seconds)
+                seconds, _ = timed(storage.read_parquet, PROBE_LAYER, filename)
+                read_times.append(seconds)
+
+            megabytes = file_bytes / (1024 * 1024)
+            report["throughput"].append(
+                {
+                    "size_mb": size_mb,
+                    "file_bytes": file_bytes,
+                    "write_mb_s": round(
+                        megabytes / (sum(write_times) / len(write_times)), 1
+                    ),
+                    "read_mb_s": round(
+                        megabytes / (sum(read_times) / len(read_times)), 1
+                    ),
+                    "write_ms": percentiles(write_times),
+                    "read_ms": percentiles(read_times),
+                }
+            )
+
+        # Per-operation latency, dominated by round trips rather than bandwidth
+        tiny = pl.DataFrame({"id": [1]})
+        write_times, read_times = [], []
+        for i in range(args.small_ops):
+            filename = f"probe_{run_id}_tiny_{i}.parquet"
+            write_times.append(
+                timed(storage.write_parquet, tiny, PROBE_LAYER, filename)[0]
+            )
+            written.append(filename)
+            read_times.append(timed(storage.read_parquet, PROBE_LAYER, filename)[0])
+        report["latency"] = {
+            "write_ms": percentiles(write_times),
+            "read_ms": percentiles(read_times),
+        }
+
+        # Listing cost at the current layer sizes; every read_parquet_latest
+        # call pays one listing
+        report["listing"] = []
+        for layer in [layer for layer in args.layers.split(",") if layer]:
+            times, files = [], []
+            for _ in range(max(args.repeat, 5)):
+                seconds, files = timed(storage.list_parquet, layer)
+                times.append(seconds)
+            report["listing"].append(
+                {"layer": layer, "files": len(files), "ms": percentiles(times)}
+            )
+    finally:
+        for filename in written:
+            try:
+                storage.delete_file(PROBE_LAYER, filename)
+            except Exception:
+                pass
+        try:
+            os.rmdir(os.path.join(storage.DATA_DIR, PROBE_LAYER))
+        except OSError:
+            pass
+
+    json.dump(report, sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,7 +12,7 @@ import polars as pl
 
 try:
     # Try relative imports (when run as module through Dagster)
-    from .storage import write_parquet
+    from .storage import open_parquet_writer
 except ImportError:
     # Fall back to absolute imports (when run directly)
     import sys
@@ -20,7 +20,12 @@ except ImportError:
 
     # Add src directory to path for absolute imports
     sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-    from core.storage import write_parquet
+    from core.storage import open_parquet_writer
+
+
+# Columns and types this asset writes. Generate from a sample file with
+# `polster add-asset --schema-from sample.parquet`; None skips validation.
+SCHEMA: pl.Schema | None = {{SCHEMA}}
 
 
 def extract() -> str:
@@ -31,22 +36,33 @@ def extract() -> str:
     """
     # TODO: Uncomment and modify this example implementation with your actual data extraction logic
     #
-    # # Create sample data (replace with your actual data source)
-    # df = pl.DataFrame({
-    #     "id": [1, 2, 3],
-    #     "name": ["Alice", "Bob", "Charlie"],
-    #     "value": [10.5, 20.3, 15.7],
-    #     "created_at": ["2024-01-01", "2024-01-02", "2024-01-03"]
-    # })
+    # # Read the source in batches (replace with your actual data source).
+    # # Passing schema=SCHEMA skips type inference, e.g.
+    # # pl.read_csv_batched(path, schema=SCHEMA) or a paginated API
+    # batches = [
+    #     pl.DataFrame({
+    #         "id": [1, 2, 3],
+    #         "name": ["Alice", "Bob", "Charlie"],
+    #         "value": [10.5, 20.3, 15.7],
+    #         "created_at": ["2024-01-01", "2024-01-02", "2024-01-03"]
+    #     }),
+    # ]
     #
-    # # Add metadata
-    # df = df.with_columns(
-    #     pl.lit(datetime.utcnow().isoformat()).alias("fetched_at")
-    # )
-    #
-    # # Write with timestamp
+    # # Each batch becomes a row group, so only one is in memory at a time;
+    # # batches are validated against the schema and the file appears on exit.
+    # # fetched_at is added here, so it isn't in a SCHEMA sampled from the source
+    # fetched_at = datetime.utcnow().isoformat()
+    # schema = pl.Schema({**SCHEMA, "fetched_at": pl.String}) if SCHEMA else None
     # timestamp = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
-    # return write_parquet(df, "bronze", f"bronze_{{ASSET_NAME}}_{timestamp}.parquet")
+    # filename = f"bronze_{{ASSET_NAME}}_{timestamp}.parquet"
+    # with open_parquet_writer("bronze", filename, schema=schema) as writer:
+    #     for df in batches:
+    #         writer.write(df.with_columns(pl.lit(fetched_at).alias("fetched_at")))
+    # return writer.path
+    #
+    # # For reference tables that rarely change, pass dedupe=True (and leave
+    # # out fetched_at): a byte-identical snapshot is not written again and
+    # # the asset doesn't materialize, so downstream assets don't rerun.
     #
     # Note: Uncomment the above code and modify it for your use case
 
@@ -23,6 +23,11 @@ except ImportError:
     from core.storage import read_parquet_latest, write_parquet
 
 
+# Columns and types this asset writes. Generate from a sample file with
+# `polster add-asset --schema-from sample.parquet`; None skips validation.
+SCHEMA: pl.Schema | None = {{SCHEMA}}
+
+
 def aggregate() -> str:
     """Aggregate silver data and write to gold layer.
 
@@ -47,7 +52,16 @@ def aggregate() -> str:
     #
     # # Write with timestamp
     # timestamp = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
-    # return write_parquet(result, "gold", f"gold_{{ASSET_NAME}}_{timestamp}.parquet")
+    # return write_parquet(
+    #     result, "gold", f"gold_{{ASSET_NAME}}_{timestamp}.parquet", schema=SCHEMA
+    # )
+    #
+    # # Or upsert the aggregates into a Delta table keyed by the group columns
+    # # (pip install deltalake; add write_delta to the imports above). A silver
+    # # Delta table is read with read_delta("silver", "silver_<name>").
+    # return write_delta(
+    #     result, "gold", "gold_{{ASSET_NAME}}", mode="merge", on="category", schema=SCHEMA
+    # )
     #
     # Note: Uncomment the above code and modify it for your use case
 
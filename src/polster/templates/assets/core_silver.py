@@ -23,6 +23,11 @@ except ImportError:
     from core.storage import read_parquet_latest, write_parquet
 
 
+# Columns and types this asset writes. Generate from a sample file with
+# `polster add-asset --schema-from sample.parquet`; None skips validation.
+SCHEMA: pl.Schema | None = {{SCHEMA}}
+
+
 def transform() -> str:
     """Transform bronze data and write to silver layer.
 
@@ -34,7 +39,8 @@ def transform() -> str:
     # # Read latest bronze data
     # df = read_parquet_latest("bronze", "bronze_{{ASSET_NAME}}_")
     #
-    # # Apply transformations (example: clean data types)
+    # # Apply transformations (example: clean data types). Bronze written with
+    # # a schema is already typed, so only cast columns whose type changes.
     # cleaned = df.with_columns(
     #     pl.col("created_at").cast(pl.Datetime),
     #     pl.col("value").cast(pl.Float64).round(2),
@@ -45,9 +51,17 @@ def transform() -> str:
     #     pl.lit(datetime.utcnow().isoformat()).alias("transformed_at")
     # )
     #
-    # # Write with timestamp
+    # # Write with timestamp; the batch is validated against SCHEMA
     # timestamp = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
-    # return write_parquet(cleaned, "silver", f"silver_{{ASSET_NAME}}_{timestamp}.parquet")
+    # return write_parquet(
+    #     cleaned, "silver", f"silver_{{ASSET_NAME}}_{timestamp}.parquet", schema=SCHEMA
+    # )
+    #
+    # # Or keep one Delta table and upsert only the changed rows by key
+    # # (pip install deltalake; add write_delta to the imports above):
+    # return write_delta(
+    #     cleaned, "silver", "silver_{{ASSET_NAME}}", mode="merge", on="id", schema=SCHEMA
+    # )
     #
     # Note: Uncomment the above code and modify it for your use case
 
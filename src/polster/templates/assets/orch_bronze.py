@@ -3,18 +3,19 @@
 This file was generated by `polster add-asset`.
 """
 
-from dagster import asset
+from dagster import AssetExecutionContext, asset
 
 from core.bronze_{{ASSET_NAME}} import extract
-from orchestration.utils import create_output_with_metadata
+from orchestration.utils import materialize
 
 
 @asset(
     group_name="bronze",
     description="Bronze asset for {{ASSET_NAME}}",
     compute_kind="polars",
+    output_required=False,
+    op_tags={"polster/pool": "{{POOL}}"},
 )
-def run_bronze_{{ASSET_NAME}}():
+def run_bronze_{{ASSET_NAME}}(context: AssetExecutionContext):
     """Run bronze extraction for {{ASSET_NAME}}."""
-    bronze_path = extract()
-    return create_output_with_metadata(bronze_path)
\ No newline at end of file
+    yield from materialize(context, extract)
\ No newline at end of file
@@ -3,20 +3,21 @@
 This file was generated by `polster add-asset`.
 """
 
-from dagster import asset, AutomationCondition
+from dagster import AssetExecutionContext, AutomationCondition, asset
 
 from core.gold_{{ASSET_NAME}} import aggregate
-from orchestration.utils import create_output_with_metadata
+from orchestration.utils import materialize
 
 
 @asset(
     group_name="gold",
     description="Gold asset for {{ASSET_NAME}}",
     compute_kind="polars",
+    output_required=False,
+    op_tags={"polster/pool": "{{POOL}}"},
     automation_condition=AutomationCondition.eager(),
     deps={{DEPS}},
 )
-def run_gold_{{ASSET_NAME}}():
+def run_gold_{{ASSET_NAME}}(context: AssetExecutionContext):
     """Run gold aggregation for {{ASSET_NAME}}."""
-    gold_path = aggregate()
-    return create_output_with_metadata(gold_path)
\ No newline at end of file
+    yield from materialize(context, aggregate)
\ No newline at end of file
@@ -3,20 +3,21 @@
 This file was generated by `polster add-asset`.
 """
 
-from dagster import asset, AutomationCondition
+from dagster import AssetExecutionContext, AutomationCondition, asset
 
 from core.silver_{{ASSET_NAME}} import transform
-from orchestration.utils import create_output_with_metadata
+from orchestration.utils import materialize
 
 
 @asset(
     group_name="silver",
     description="Silver asset for {{ASSET_NAME}}",
     compute_kind="polars",
+    output_required=False,
+    op_tags={"polster/pool": "{{POOL}}"},
     automation_condition=AutomationCondition.eager(),
     deps={{DEPS}},
 )
-def run_silver_{{ASSET_NAME}}():
+def run_silver_{{ASSET_NAME}}(context: AssetExecutionContext):
     """Run silver transformation for {{ASSET_NAME}}."""
-    silver_path = transform()
-    return create_output_with_metadata(silver_path)
\ No newline at end of file
+    yield from materialize(context, transform)
\ No newline at end of file
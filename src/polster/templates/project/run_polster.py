@@ -7,6 +7,9 @@ Usage:
   python run_dagster.py              # Materialize all assets
   python run_dagster.py --ui         # Materialize + launch Dagster UI
   python run_dagster.py --no-materialize --ui  # Launch UI only
+  python run_dagster.py --pool-limit mysql=2  # Cap concurrent MySQL assets
+  python run_dagster.py --metrics-file polster.prom  # Export run metrics
+  python run_dagster.py --watch 900 --metrics-port 9464  # Rerun, serve metrics
 """
 
 import argparse
@@ -14,6 +17,7 @@ import os
 import pathlib
 import subprocess
 import sys
+import time
 
 
 def find_project_root(start: pathlib.Path) -> pathlib.Path:
@@ -41,6 +45,36 @@ def build_env(root: pathlib.Path) -> dict[str, str]:
     return env
 
 
+def pool_limit(value: str) -> str:
+    """Validate a --pool-limit argument of the form POOL=LIMIT."""
+    pool, sep, limit = value.partition("=")
+    if not sep or not pool or not limit.isdigit():
+        raise argparse.ArgumentTypeError(
+            f"invalid pool limit '{value}' (expected POOL=LIMIT, e.g. adls=4)"
+        )
+    return value
+
+
+def apply_concurrency_limits(
+    root: pathlib.Path,
+    env: dict[str, str],
+    pool_limits: list[str],
+    max_concurrent: int | None,
+) -> None:
+    """Pass pool limits to Dagster through the environment read by core.settings."""
+    if pool_limits:
+        sys.path.insert(0, str(root / "src"))
+        from core.settings import DEFAULT_POOL_LIMITS
+
+        # Later entries win, so command line limits override the .env limits,
+        # and those the built-in defaults
+        existing = env.get("POLSTER_POOL_LIMITS") or DEFAULT_POOL_LIMITS
+        env["POLSTER_POOL_LIMITS"] = ",".join(filter(None, [existing, *pool_limits]))
+        print(f"[POOL] Concurrency limits: {', '.join(pool_limits)}")
+    if max_concurrent is not None:
+        env["POLSTER_MAX_CONCURRENT"] = str(max_concurrent)
+
+
 def materialize_assets(root: pathlib.Path, env: dict[str, str]) -> bool:
     """Materialize all assets and return success status."""
     print("[START] Materializing all assets...")
@@ -62,6 +96,74 @@ def materialize_assets(root: pathlib.Path, env: dict[str, str]) -> bool:
         return False
 
 
+def enable_tracing(root: pathlib.Path, env: dict[str, str]) -> dict[str, str]:
+    """Environment for one run that records its spans to a fresh JSON lines file."""
+    run_env = dict(env)
+    modes = {
+        mode.strip()
+        for mode in run_env.get("POLSTER_TRACE", "").lower().split(",")
+        if mode.strip() not in ("", "0", "off", "false", "none")
+    }
+    run_env["POLSTER_TRACE"] = ",".join(sorted(modes | {"json"}))
+    stamp = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+    run_env["POLSTER_TRACE_FILE"] = str(
+        root / ".polster" / "traces" / f"run-{stamp}.jsonl"
+    )
+    return run_env
+
+
+def materialize_with_metrics(
+    root: pathlib.Path, env: dict[str, str], metrics_file: str | None
+) -> bool:
+    """Materialize all assets traced, then add the run to the metrics."""
+    sys.path.insert(0, str(root / "src"))
+    from core.metrics import collect_run
+
+    run_env = enable_tracing(root, env)
+    started = time.monotonic()
+    success = materialize_assets(root, run_env)
+    trace_path = run_env["POLSTER_TRACE_FILE"]
+    collect_run(trace_path, success, time.monotonic() - started, metrics_file)
+    if metrics_file:
+        print(f"[METRICS] Wrote {metrics_file}")
+    keep_traces = "json" in env.get("POLSTER_TRACE", "").lower()
+    if not keep_traces and os.path.exists(trace_path):
+        # Traced only for the metrics; traces are kept when asked for
+        os.remove(trace_path)
+    return success
+
+
+def watch(
+    root: pathlib.Path,
+    env: dict[str, str],
+    interval: float,
+    metrics_file: str | None,
+    metrics_port: int | None,
+) -> None:
+    """Materialize all assets every ``interval`` seconds until interrupted."""
+    if metrics_port is not None:
+        sys.path.insert(0, str(root / "src"))
+        from core.metrics import serve_metrics
+
+        host = os.getenv("POLSTER_METRICS_HOST", "127.0.0.1")
+        server = serve_metrics(metrics_port, host)
+        print(f"[METRICS] Serving http://{host}:{metrics_port}/metrics")
+    collect = metrics_file is not None or metrics_port is not None
+    print(f"[WATCH] Materializing every {interval:g}s, press Ctrl+C to stop")
+    try:
+        while True:
+            if collect:
+                materialize_with_metrics(root, env, metrics_file)
+            else:
+                materialize_assets(root, env)
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        print("\n👋 Watch stopped.")
+    finally:
+        if metrics_port is not None:
+            server.shutdown()
+
+
 def launch_ui(root: pathlib.Path, env: dict[str, str]):
     """Launch the Dagster development UI."""
     print("[WEB] Launching Dagster UI...")
@@ -87,6 +189,9 @@ Examples:
   python run_dagster.py              # Materialize all assets
   python run_dagster.py --ui         # Materialize + launch UI
   python run_dagster.py --no-materialize --ui  # Launch UI only
+  python run_dagster.py --pool-limit adls=2 --pool-limit mysql=1
+  python run_dagster.py --metrics-file /var/lib/node_exporter/polster.prom
+  python run_dagster.py --watch 900 --metrics-port 9464
         """,
     )
     parser.add_argument(
@@ -97,11 +202,57 @@ Examples:
         action="store_true",
         help="Skip asset materialization (use with --ui)",
     )
+    parser.add_argument(
+        "--pool-limit",
+        action="append",
+        default=[],
+        type=pool_limit,
+        metavar="POOL=LIMIT",
+        help="Max concurrent assets for a resource pool (repeatable)",
+    )
+    parser.add_argument(
+        "--max-concurrent",
+        type=int,
+        default=None,
+        help="Max concurrent assets overall (default: one per CPU)",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        default=os.getenv("POLSTER_METRICS_FILE") or None,
+        metavar="PATH",
+        help="Write Prometheus metrics here after each run (textfile collector)",
+    )
+    parser.add_argument(
+        "--watch",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Materialize all assets again every SECONDS until interrupted",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Serve Prometheus metrics on this port while watching",
+    )
     args = parser.parse_args()
+    if args.metrics_port is not None and args.watch is None:
+        parser.error("--metrics-port needs --watch")
+    if args.watch is not None and (args.ui or args.no_materialize):
+        parser.error("--watch can't be combined with --ui or --no-materialize")
+
+    apply_concurrency_limits(ROOT, ENV, args.pool_limit, args.max_concurrent)
+
+    if args.watch is not None:
+        watch(ROOT, ENV, args.watch, args.metrics_file, args.metrics_port)
+        return
 
     # Materialize assets unless skipped
     if not args.no_materialize:
-        success = materialize_assets(ROOT, ENV)
+        if args.metrics_file:
+            success = materialize_with_metrics(ROOT, ENV, args.metrics_file)
+        else:
+            success = materialize_assets(ROOT, ENV)
         if not success and not args.ui:
             sys.exit(1)  # Exit if materialization failed and not launching UI
     else:
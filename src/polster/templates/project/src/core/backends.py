@@ -0,0 +1,803 @@
+"""Storage backends for the lake layers.
+
+A backend maps ``(layer, filename)`` to an object in one store and provides
+the primitives the storage layer is built on: list, read (whole or a byte
+range), write, delete, and a staged write that only becomes visible under
+its name on commit. It also tells polars how to reach its objects directly
+(``uri`` plus ``storage_options``), so reads and scans go through polars'
+native cloud reader with projection and predicate pushdown instead of
+downloading whole files through an SDK.
+
+Backends are registered by name and selected with STORAGE_BACKEND:
+
+- ``local``: files under DATA_DIR
+- ``adls``: Azure Data Lake Storage Gen2 (requires azure-storage-file-datalake)
+- ``s3``: Amazon S3 and S3-compatible stores such as MinIO (requires boto3)
+- ``fsspec``: any fsspec filesystem, e.g. ``gcs://bucket/lake`` (requires fsspec)
+- ``memory``: a process-local dict, for tests and benchmarks without any I/O
+
+Other stores plug in with ``register_backend("name", factory)``. A backend
+whose configuration or client library is missing falls back to local storage.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import threading
+import uuid
+from collections.abc import Callable
+from typing import Any, Protocol
+
+from .paths import DATA_DIR
+
+# Bytes buffered before a block (ADLS) or part (S3) is uploaded; S3 parts
+# must be at least 5 MB
+BLOCK_SIZE = 8 * 1024 * 1024
+
+# URL schemes polars scans natively; other fsspec protocols are read whole
+NATIVE_SCHEMES = {
+    "s3",
+    "s3a",
+    "gs",
+    "gcs",
+    "az",
+    "abfs",
+    "abfss",
+    "adl",
+    "http",
+    "https",
+    "hf",
+}
+
+
+def _staging_name(filename: str) -> str:
+    """Hidden-from-listings name for a file that is still being written."""
+    return f"{filename}.{uuid.uuid4().hex[:8]}.tmp"
+
+
+class StagedWrite(Protocol):
+    """Writable stream whose data appears under its final name on commit."""
+
+    def write(self, data) -> int: ...
+
+    def tell(self) -> int: ...
+
+    def commit(self) -> str: ...
+
+    def abort(self) -> None: ...
+
+
+class Backend(Protocol):
+    """Operations every storage backend implements."""
+
+    name: str
+    # True when polars can scan ``uri()`` itself (with ``storage_options``)
+    native_scan: bool
+
+    def available(self) -> bool: ...
+
+    def uri(self, layer: str, filename: str) -> str: ...
+
+    def storage_options(self) -> dict[str, str] | None: ...
+
+    def list(self, layer: str, prefix: str = "") -> list[str]: ...
+
+    def read_bytes(self, layer: str, filename: str) -> bytes: ...
+
+    def read_range(
+        self, layer: str, filename: str, start: int, length: int
+    ) -> bytes: ...
+
+    def write_bytes(self, layer: str, filename: str, data: bytes) -> str: ...
+
+    def delete(self, layer: str, filename: str) -> None: ...
+
+    def open_staged(self, layer: str, filename: str) -> StagedWrite: ...
+
+
+# =============================================================================
+# Local filesystem
+# =============================================================================
+
+
+class _LocalStagedFile(io.RawIOBase):
+    """Writes next to the destination and renames into place on commit."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.local_path = _staging_name(path)
+        self._file = None
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        if self._file is None:
+            self._file = open(self.local_path, "wb")
+        return self._file.write(data)
+
+    def tell(self) -> int:
+        return self._file.tell() if self._file is not None else 0
+
+    def commit(self) -> str:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        elif not os.path.exists(self.local_path):
+            open(self.local_path, "wb").close()
+        os.replace(self.local_path, self.path)
+        return self.path
+
+    def abort(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        try:
+            os.remove(self.local_path)
+        except FileNotFoundError:
+            pass
+
+
+class LocalBackend:
+    """Files under DATA_DIR/<layer>/."""
+
+    name = "local"
+    native_scan = True
+
+    def __init__(self, root: str = DATA_DIR):
+        self.root = root
+
+    def available(self) -> bool:
+        return True
+
+    def uri(self, layer: str, filename: str) -> str:
+        return os.path.join(self.root, layer, filename)
+
+    def storage_options(self) -> dict[str, str] | None:
+        return None
+
+    def list(self, layer: str, prefix: str = "") -> list[str]:
+        directory = os.path.join(self.root, layer)
+        if not os.path.isdir(directory):
+            return []
+        return sorted(
+            entry.name
+            for entry in os.scandir(directory)
+            if entry.is_file() and entry.name.startswith(prefix)
+        )
+
+    def read_bytes(self, layer: str, filename: str) -> bytes:
+        with open(self.uri(layer, filename), "rb") as f:
+            return f.read()
+
+    def read_range(self, layer: str, filename: str, start: int, length: int) -> bytes:
+        with open(self.uri(layer, filename), "rb") as f:
+            f.seek(start)
+            return f.read(length)
+
+    def write_bytes(self, layer: str, filename: str, data: bytes) -> str:
+        staged = self.open_staged(layer, filename)
+        try:
+            staged.write(data)
+            return staged.commit()
+        except BaseException:
+            staged.abort()
+            raise
+
+    def delete(self, layer: str, filename: str) -> None:
+        try:
+            os.remove(self.uri(layer, filename))
+        except FileNotFoundError:
+            pass
+
+    def open_staged(self, layer: str, filename: str) -> _LocalStagedFile:
+        path = self.uri(layer, filename)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return _LocalStagedFile(path)
+
+
+# =============================================================================
+# Azure Data Lake Storage Gen2
+# =============================================================================
+
+
+def _is_not_found(error: Exception) -> bool:
+    """Whether an SDK error means the object doesn't exist."""
+    if type(error).__name__ in {"ResourceNotFoundError", "NoSuchKey"}:
+        return True
+    # botocore ClientError
+    response = getattr(error, "response", None)
+    if isinstance(response, dict):
+        return response.get("Error", {}).get("Code") in {"NoSuchKey", "404", "NotFound"}
+    return False
+
+
+class _AdlsStagedFile(io.RawIOBase):
+    """Stages data to a temporary ADLS file in blocks; flush and rename on commit.
+
+    Staged blocks only become file content when flushed, so an aborted write
+    leaves nothing readable behind.
+    """
+
+    def __init__(
+        self, file_system_client, path: str, uri: str, block_size: int = BLOCK_SIZE
+    ):
+        self._file_system_client = file_system_client
+        self._path = path
+        self._uri = uri
+        self._file_client = file_system_client.get_file_client(_staging_name(path))
+        self._block_size = block_size
+        self._buffer = bytearray()
+        self._offset = 0
+        self._file_client.create_file()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._buffer += data
+        if len(self._buffer) >= self._block_size:
+            self._stage()
+        return len(data)
+
+    def tell(self) -> int:
+        return self._offset + len(self._buffer)
+
+    def _stage(self) -> None:
+        if self._buffer:
+            self._file_client.append_data(
+                bytes(self._buffer), offset=self._offset, length=len(self._buffer)
+            )
+            self._offset += len(self._buffer)
+            self._buffer.clear()
+
+    def commit(self) -> str:
+        self._stage()
+        self._file_client.flush_data(self._offset)
+        self._file_client.rename_file(
+            f"{self._file_system_client.file_system_name}/{self._path}"
+        )
+        return self._uri
+
+    def abort(self) -> None:
+        try:
+            self._file_client.delete_file()
+        except Exception:
+            pass
+
+
+class AdlsBackend:
+    """ADLS Gen2 container configured with the ADLS_* environment variables."""
+
+    name = "adls"
+    native_scan = True
+
+    def __init__(self):
+        self.account_name = os.getenv("ADLS_ACCOUNT_NAME")
+        self.account_key = os.getenv("ADLS_ACCOUNT_KEY")
+        self.container = os.getenv("ADLS_CONTAINER")
+        self.base_path = (os.getenv("ADLS_BASE_PATH") or "polster/data").strip("/")
+        # Custom endpoint, e.g. a local Azurite emulator
+        self.account_url = (os.getenv("ADLS_ACCOUNT_URL") or "").rstrip("/") or (
+            f"https://{self.account_name}.dfs.core.windows.net"
+        )
+        self._client = None
+
+    def available(self) -> bool:
+        if not (self.account_name and self.account_key and self.container):
+            return False
+        try:
+            import azure.storage.filedatalake  # noqa: F401
+        except ModuleNotFoundError:
+            return False
+        return True
+
+    @property
+    def client(self):
+        if self._client is None:
+            from azure.storage.filedatalake import DataLakeServiceClient
+
+            service = DataLakeServiceClient(
+                account_url=self.account_url, credential=self.account_key
+            )
+            self._client = service.get_file_system_client(self.container)
+        return self._client
+
+    def _path(self, layer: str, filename: str = "") -> str:
+        return f"{self.base_path}/{layer}/{filename}".strip("/")
+
+    def uri(self, layer: str, filename: str) -> str:
+        return (
+            f"abfss://{self.container}@{self.account_name}.dfs.core.windows.net/"
+            f"{self._path(layer, filename)}"
+        )
+
+    def storage_options(self) -> dict[str, str] | None:
+        options = {"account_name": self.account_name, "account_key": self.account_key}
+        if os.getenv("ADLS_ACCOUNT_URL"):
+            options["endpoint"] = self.account_url
+            if self.account_url.startswith("http://"):
+                options["allow_http"] = "true"
+        return options
+
+    def list(self, layer: str, prefix: str = "") -> list[str]:
+        try:
+            paths = list(self.client.get_paths(path=self._path(layer), recursive=False))
+        except Exception as e:
+            if _is_not_found(e):
+                return []
+            raise
+        names = (item.name.split("/")[-1] for item in paths if not item.is_directory)
+        return sorted(name for name in names if name.startswith(prefix))
+
+    def _download(self, layer: str, filename: str, **kwargs) -> bytes:
+        file_client = self.client.get_file_client(self._path(layer, filename))
+        try:
+            return file_client.download_file(**kwargs).readall()
+        except Exception as e:
+            if _is_not_found(e):
+                raise FileNotFoundError(self.uri(layer, filename)) from e
+            raise
+
+    def read_bytes(self, layer: str, filename: str) -> bytes:
+        # Large files are fetched in parallel chunks
+        return self._download(layer, filename, max_concurrency=4)
+
+    def read_range(self, layer: str, filename: str, start: int, length: int) -> bytes:
+        return self._download(layer, filename, offset=start, length=length)
+
+    def write_bytes(self, layer: str, filename: str, data: bytes) -> str:
+        file_client = self.client.get_file_client(self._path(layer, filename))
+        file_client.upload_data(data, overwrite=True)
+        return self.uri(layer, filename)
+
+    def delete(self, layer: str, filename: str) -> None:
+        try:
+            self.client.get_file_client(self._path(layer, filename)).delete_file()
+        except Exception as e:
+            if not _is_not_found(e):
+                raise
+
+    def open_staged(self, layer: str, filename: str) -> _AdlsStagedFile:
+        return _AdlsStagedFile(
+            self.client, self._path(layer, filename), self.uri(layer, filename)
+        )
+
+
+# =============================================================================
+# S3 and S3-compatible object stores
+# =============================================================================
+
+
+class _S3StagedUpload(io.RawIOBase):
+    """Multipart upload that completes, and becomes visible, on commit.
+
+    Small files are sent with a single PUT; larger ones are uploaded in parts
+    as data is written. An aborted upload leaves no object behind.
+    """
+
+    def __init__(self, client, bucket: str, key: str, part_size: int = BLOCK_SIZE):
+        self._client = client
+        self._bucket = bucket
+        self._key = key
+        self._part_size = part_size
+        self._buffer = bytearray()
+        self._offset = 0
+        self._upload_id = None
+        self._parts: list[dict] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._buffer += data
+        if len(self._buffer) >= self._part_size:
+            self._upload_part()
+        return len(data)
+
+    def tell(self) -> int:
+        return self._offset + len(self._buffer)
+
+    def _upload_part(self) -> None:
+        if self._upload_id is None:
+            self._upload_id = self._client.create_multipart_upload(
+                Bucket=self._bucket, Key=self._key
+            )["UploadId"]
+        number = len(self._parts) + 1
+        response = self._client.upload_part(
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=self._upload_id,
+            PartNumber=number,
+            Body=bytes(self._buffer),
+        )
+        self._parts.append({"ETag": response["ETag"], "PartNumber": number})
+        self._offset += len(self._buffer)
+        self._buffer.clear()
+
+    def commit(self) -> str:
+        if self._upload_id is None:
+            self._client.put_object(
+                Bucket=self._bucket, Key=self._key, Body=bytes(self._buffer)
+            )
+        else:
+            if self._buffer:
+                self._upload_part()
+            self._client.complete_multipart_upload(
+                Bucket=self._bucket,
+                Key=self._key,
+                UploadId=self._upload_id,
+                MultipartUpload={"Parts": self._parts},
+            )
+        return f"s3://{self._bucket}/{self._key}"
+
+    def abort(self) -> None:
+        if self._upload_id is not None:
+            try:
+                self._client.abort_multipart_upload(
+                    Bucket=self._bucket, Key=self._key, UploadId=self._upload_id
+                )
+            except Exception:
+                pass
+
+
+class S3Backend:
+    """S3 bucket configured with the S3_* environment variables.
+
+    Credentials come from the usual AWS sources (AWS_ACCESS_KEY_ID and
+    AWS_SECRET_ACCESS_KEY, a profile or an instance role). S3_ENDPOINT_URL
+    points at an S3-compatible store such as MinIO.
+    """
+
+    name = "s3"
+    native_scan = True
+
+    def __init__(self):
+        self.bucket = os.getenv("S3_BUCKET")
+        self.base_path = (os.getenv("S3_BASE_PATH") or "polster/data").strip("/")
+        self.endpoint_url = os.getenv("S3_ENDPOINT_URL")
+        self.region = os.getenv("S3_REGION") or os.getenv("AWS_REGION") or "us-east-1"
+        self._client = None
+
+    def available(self) -> bool:
+        if not self.bucket:
+            return False
+        try:
+            import boto3  # noqa: F401
+        except ModuleNotFoundError:
+            return False
+        return True
+
+    @property
+    def client(self):
+        if self._client is None:
+            import boto3
+
+            self._client = boto3.client(
+                "s3", endpoint_url=self.endpoint_url, region_name=self.region
+            )
+        return self._client
+
+    def _key(self, layer: str, filename: str = "") -> str:
+        return f"{self.base_path}/{layer}/{filename}".lstrip("/")
+
+    def uri(self, layer: str, filename: str) -> str:
+        return f"s3://{self.bucket}/{self._key(layer, filename)}"
+
+    def storage_options(self) -> dict[str, str] | None:
+        options = {"aws_region": self.region}
+        for option, variable in (
+            ("aws_access_key_id", "AWS_ACCESS_KEY_ID"),
+            ("aws_secret_access_key", "AWS_SECRET_ACCESS_KEY"),
+            ("aws_session_token", "AWS_SESSION_TOKEN"),
+        ):
+            if os.getenv(variable):
+                options[option] = os.environ[variable]
+        if self.endpoint_url:
+            options["aws_endpoint_url"] = self.endpoint_url
+            if self.endpoint_url.startswith("http://"):
+                options["aws_allow_http"] = "true"
+        return options
+
+    def list(self, layer: str, prefix: str = "") -> list[str]:
+        directory = self._key(layer)
+        names = []
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(
+            Bucket=self.bucket, Prefix=directory + prefix, Delimiter="/"
+        ):
+            names += [
+                item["Key"][len(directory) :] for item in page.get("Contents", [])
+            ]
+        return sorted(names)
+
+    def _get(self, layer: str, filename: str, **kwargs) -> bytes:
+        try:
+            response = self.client.get_object(
+                Bucket=self.bucket, Key=self._key(layer, filename), **kwargs
+            )
+        except Exception as e:
+            if _is_not_found(e):
+                raise FileNotFoundError(self.uri(layer, filename)) from e
+            raise
+        return response["Body"].read()
+
+    def read_bytes(self, layer: str, filename: str) -> bytes:
+        return self._get(layer, filename)
+
+    def read_range(self, layer: str, filename: str, start: int, length: int) -> bytes:
+        return self._get(layer, filename, Range=f"bytes={start}-{start + length - 1}")
+
+    def write_bytes(self, layer: str, filename: str, data: bytes) -> str:
+        self.client.put_object(
+            Bucket=self.bucket, Key=self._key(layer, filename), Body=data
+        )
+        return self.uri(layer, filename)
+
+    def delete(self, layer: str, filename: str) -> None:
+        self.client.delete_object(Bucket=self.bucket, Key=self._key(layer, filename))
+
+    def open_staged(self, layer: str, filename: str) -> _S3StagedUpload:
+        return _S3StagedUpload(self.client, self.bucket, self._key(layer, filename))
+
+
+# =============================================================================
+# Any fsspec filesystem
+# =============================================================================
+
+
+class _FsspecStagedFile(io.RawIOBase):
+    """Writes to a temporary path and moves it into place on commit."""
+
+    def __init__(self, fs, path: str):
+        self._fs = fs
+        self._path = path
+        self._staging_path = _staging_name(path)
+        self._file = fs.open(self._staging_path, "wb")
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        return self._file.write(data)
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def commit(self) -> str:
+        self._file.close()
+        self._fs.mv(self._staging_path, self._path)
+        return self._fs.unstrip_protocol(self._path)
+
+    def abort(self) -> None:
+        try:
+            self._file.close()
+            self._fs.rm_file(self._staging_path)
+        except Exception:
+            pass
+
+
+class FsspecBackend:
+    """Any fsspec filesystem rooted at FSSPEC_URL (e.g. ``gcs://bucket/lake``).
+
+    FSSPEC_OPTIONS holds the filesystem's options as JSON. They are fsspec
+    arguments, not polars ``storage_options`` keys, so a filesystem configured
+    with them is read through fsspec rather than scanned natively.
+    """
+
+    name = "fsspec"
+
+    def __init__(self):
+        self.url = os.getenv("FSSPEC_URL")
+        self.options = json.loads(os.getenv("FSSPEC_OPTIONS") or "{}")
+        self._fs = None
+        self._root = ""
+        scheme = self.url.split("://", 1)[0] if self.url and "://" in self.url else ""
+        self.native_scan = scheme in NATIVE_SCHEMES and not self.options
+
+    def available(self) -> bool:
+        if not self.url:
+            return False
+        try:
+            import fsspec  # noqa: F401
+        except ModuleNotFoundError:
+            return False
+        return True
+
+    def _ensure_fs(self) -> tuple[Any, str]:
+        """The filesystem and the root path within it, resolved together."""
+        if self._fs is None:
+            from fsspec.core import url_to_fs
+
+            self._fs, self._root = url_to_fs(self.url, **self.options)
+        return self._fs, self._root
+
+    @property
+    def fs(self):
+        return self._ensure_fs()[0]
+
+    def _path(self, layer: str, filename: str = "") -> str:
+        _, root = self._ensure_fs()
+        return f"{root.rstrip('/')}/{layer}/{filename}".rstrip("/")
+
+    def uri(self, layer: str, filename: str) -> str:
+        return self.fs.unstrip_protocol(self._path(layer, filename))
+
+    def storage_options(self) -> dict[str, str] | None:
+        return None
+
+    def list(self, layer: str, prefix: str = "") -> list[str]:
+        try:
+            entries = self.fs.ls(self._path(layer), detail=True)
+        except FileNotFoundError:
+            return []
+        names = (
+            entry["name"].rstrip("/").split("/")[-1]
+            for entry in entries
+            if entry["type"] == "file"
+        )
+        return sorted(name for name in names if name.startswith(prefix))
+
+    def read_bytes(self, layer: str, filename: str) -> bytes:
+        return self.fs.cat_file(self._path(layer, filename))
+
+    def read_range(self, layer: str, filename: str, start: int, length: int) -> bytes:
+        path = self._path(layer, filename)
+        return self.fs.cat_file(path, start=start, end=start + length)
+
+    def write_bytes(self, layer: str, filename: str, data: bytes) -> str:
+        path = self._path(layer, filename)
+        self.fs.makedirs(self._path(layer), exist_ok=True)
+        self.fs.pipe_file(path, data)
+        return self.fs.unstrip_protocol(path)
+
+    def delete(self, layer: str, filename: str) -> None:
+        try:
+            self.fs.rm_file(self._path(layer, filename))
+        except FileNotFoundError:
+            pass
+
+    def open_staged(self, layer: str, filename: str) -> _FsspecStagedFile:
+        self.fs.makedirs(self._path(layer), exist_ok=True)
+        return _FsspecStagedFile(self.fs, self._path(layer, filename))
+
+
+# =============================================================================
+# In-memory
+# =============================================================================
+
+
+class _MemoryStagedFile(io.RawIOBase):
+    """Buffers the file and stores it in the backend on commit."""
+
+    def __init__(self, backend: MemoryBackend, layer: str, filename: str):
+        self._backend = backend
+        self._key = (layer, filename)
+        self._buffer = io.BytesIO()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        return self._buffer.write(data)
+
+    def tell(self) -> int:
+        return self._buffer.tell()
+
+    def commit(self) -> str:
+        self._backend._put(*self._key, self._buffer.getvalue())
+        self._buffer = io.BytesIO()
+        return self._backend.uri(*self._key)
+
+    def abort(self) -> None:
+        self._buffer = io.BytesIO()
+
+
+class MemoryBackend:
+    """Files kept as bytes in a process-local dict.
+
+    Same write, list, latest and scan behaviour as the other backends with no
+    disk or network I/O, so transform tests run at memory speed. Contents
+    live as long as the backend instance (until ``reset_backends``).
+    """
+
+    name = "memory"
+    native_scan = False
+
+    def __init__(self):
+        self._files: dict[tuple[str, str], bytes] = {}
+        self._lock = threading.Lock()
+
+    def available(self) -> bool:
+        return True
+
+    def uri(self, layer: str, filename: str) -> str:
+        return f"memory://{layer}/{filename}"
+
+    def storage_options(self) -> dict[str, str] | None:
+        return None
+
+    def _put(self, layer: str, filename: str, data: bytes) -> None:
+        with self._lock:
+            self._files[(layer, filename)] = data
+
+    def list(self, layer: str, prefix: str = "") -> list[str]:
+        with self._lock:
+            names = [name for lay, name in self._files if lay == layer]
+        return sorted(name for name in names if name.startswith(prefix))
+
+    def read_bytes(self, layer: str, filename: str) -> bytes:
+        with self._lock:
+            try:
+                return self._files[(layer, filename)]
+            except KeyError:
+                raise FileNotFoundError(self.uri(layer, filename)) from None
+
+    def read_range(self, layer: str, filename: str, start: int, length: int) -> bytes:
+        return self.read_bytes(layer, filename)[start : start + length]
+
+    def write_bytes(self, layer: str, filename: str, data: bytes) -> str:
+        self._put(layer, filename, bytes(data))
+        return self.uri(layer, filename)
+
+    def delete(self, layer: str, filename: str) -> None:
+        with self._lock:
+            self._files.pop((layer, filename), None)
+
+    def open_staged(self, layer: str, filename: str) -> _MemoryStagedFile:
+        return _MemoryStagedFile(self, layer, filename)
+
+    def clear(self) -> None:
+        """Drop every stored file."""
+        with self._lock:
+            self._files.clear()
+
+
+# =============================================================================
+# Registry
+# =============================================================================
+
+_FACTORIES: dict[str, Callable[[], Backend]] = {
+    "local": LocalBackend,
+    "adls": AdlsBackend,
+    "s3": S3Backend,
+    "fsspec": FsspecBackend,
+    "memory": MemoryBackend,
+}
+_instances: dict[str, Backend] = {}
+
+
+def register_backend(name: str, factory: Callable[[], Backend]) -> None:
+    """Make a backend selectable with STORAGE_BACKEND=<name>."""
+    _FACTORIES[name.lower()] = factory
+    _instances.pop(name.lower(), None)
+
+
+def backend_names() -> list[str]:
+    """Names of the registered backends."""
+    return sorted(_FACTORIES)
+
+
+def reset_backends() -> None:
+    """Forget cached backends, e.g. after changing their environment variables."""
+    _instances.clear()
+
+
+def get_backend(name: str | None = None) -> Backend:
+    """The backend for ``name`` (default: STORAGE_BACKEND), created once.
+
+    Raises:
+        ValueError: If no backend is registered under the name.
+    """
+    name = (name or os.getenv("STORAGE_BACKEND") or "local").lower()
+    if name not in _FACTORIES:
+        raise ValueError(
+            f"Unsupported STORAGE_BACKEND: {name} "
+            f"(expected one of {', '.join(backend_names())})"
+        )
+    if name not in _instances:
+        backend = _FACTORIES[name]()
+        _instances[name] = backend if backend.available() else _FACTORIES["local"]()
+    return _instances[name]
@@ -13,7 +13,7 @@ from faker import Faker
 
 try:
     # Try relative imports (when run as module through Dagster)
-    from .storage import write_parquet
+    from .storage import open_parquet_writer
 except ImportError:
     # Fall back to absolute imports (when run directly)
     import os
@@ -21,11 +21,53 @@ except ImportError:
 
     # Add src directory to path for absolute imports
     sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-    from core.storage import write_parquet
+    from core.storage import open_parquet_writer
 
 
 fake = Faker()
 
+# Output columns and types: building the DataFrame with them skips type
+# inference, and the writer validates every batch against them
+SCHEMA = pl.Schema(
+    {
+        "order_id": pl.Int64,
+        "customer_id": pl.Int64,
+        "order_date": pl.Datetime("us"),
+        "status": pl.String,
+        "total_amount": pl.Float64,
+        "fetched_at": pl.String,
+    }
+)
+
+# Rows per generated batch (one parquet row group each)
+BATCH_SIZE = 250
+
+
+def generate_orders(count: int, fetch_time: str):
+    """Yield fake orders in batches, as a paginated source would."""
+    customer_ids = list(range(1, 201))
+    columns = {k: v for k, v in SCHEMA.items() if k != "fetched_at"}
+
+    for start in range(0, count, BATCH_SIZE):
+        orders = []
+        for idx in range(start, min(start + BATCH_SIZE, count)):
+            order_date = fake.date_time_between(start_date="-120d", end_date="now")
+            total_amount = round(random.uniform(25.0, 520.0), 2)
+            orders.append(
+                {
+                    "order_id": 10000 + idx,
+                    "customer_id": random.choice(customer_ids),
+                    "order_date": order_date,
+                    "status": random.choice(
+                        ["placed", "shipped", "delivered", "cancelled", "returned"]
+                    ),
+                    "total_amount": total_amount,
+                }
+            )
+        yield pl.DataFrame(orders, schema=columns).with_columns(
+            pl.lit(fetch_time).alias("fetched_at")
+        )
+
 
 def extract() -> str:
     """Extract data and write to bronze layer.
@@ -33,28 +75,15 @@ def extract() -> str:
     Returns:
         str: Path to the written parquet file.
     """
-    customer_ids = list(range(1, 201))
     fetch_time = datetime.now(UTC).replace(microsecond=0).isoformat()
-    orders = []
-
-    for idx in range(500):
-        order_date = fake.date_time_between(start_date="-120d", end_date="now")
-        total_amount = round(random.uniform(25.0, 520.0), 2)
-        orders.append(
-            {
-                "order_id": 10000 + idx,
-                "customer_id": random.choice(customer_ids),
-                "order_date": order_date,
-                "status": random.choice(
-                    ["placed", "shipped", "delivered", "cancelled", "returned"]
-                ),
-                "total_amount": total_amount,
-            }
-        )
-
-    df = pl.DataFrame(orders).with_columns(pl.lit(fetch_time).alias("fetched_at"))
     timestamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
-    return write_parquet(df, "bronze", f"bronze_orders_{timestamp}.parquet")
+
+    # Each batch is written as a row group as soon as it is generated
+    filename = f"bronze_orders_{timestamp}.parquet"
+    with open_parquet_writer("bronze", filename, schema=SCHEMA) as writer:
+        for batch in generate_orders(500, fetch_time):
+            writer.write(batch)
+    return writer.path
 
 
 if __name__ == "__main__":
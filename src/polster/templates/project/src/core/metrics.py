@@ -0,0 +1,328 @@
+"""Prometheus metrics for pipeline runs, built from tracing spans.
+
+``run_polster.py --metrics-file`` traces each run (``POLSTER_TRACE=json``,
+see ``core/tracing.py``) and afterwards folds its spans into cumulative
+counters and histograms kept in ``.polster/metrics/state.json``:
+
+- asset durations, runs and failures, rows and bytes written and read
+- storage operation latencies by operation and backend
+- cache hits and misses: deduplicated snapshots (``snapshot_dedupe``) and
+  SFTP files already downloaded (``sftp``)
+- the time, duration and result of the last run
+
+The metrics are written in the Prometheus text format to a file for the
+node_exporter textfile collector, or served on ``/metrics`` by
+``serve_metrics`` (``run_polster.py --watch --metrics-port``).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    from .paths import PROJECT_ROOT
+    from .tracing import load_spans
+except ImportError:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from core.paths import PROJECT_ROOT
+    from core.tracing import load_spans
+
+METRICS_DIR = os.path.join(PROJECT_ROOT, ".polster", "metrics")
+STATE_FILE = os.path.join(METRICS_DIR, "state.json")
+
+ASSET_BUCKETS = (0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800, 3600)
+STORAGE_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+# name: (type, help, histogram buckets)
+METRICS: dict[str, tuple[str, str, tuple[float, ...] | None]] = {
+    "polster_runs_total": ("counter", "Pipeline runs by result.", None),
+    "polster_last_run_timestamp_seconds": (
+        "gauge",
+        "Unix time the last run finished.",
+        None,
+    ),
+    "polster_last_run_duration_seconds": ("gauge", "Duration of the last run.", None),
+    "polster_last_run_success": (
+        "gauge",
+        "1 if the last run succeeded, 0 if it failed.",
+        None,
+    ),
+    "polster_asset_runs_total": ("counter", "Asset executions by result.", None),
+    "polster_asset_failures_total": ("counter", "Failed asset executions.", None),
+    "polster_asset_duration_seconds": (
+        "histogram",
+        "Asset execution time.",
+        ASSET_BUCKETS,
+    ),
+    "polster_asset_rows_written_total": ("counter", "Rows written by assets.", None),
+    "polster_asset_bytes_written_total": ("counter", "Bytes written by assets.", None),
+    "polster_asset_bytes_read_total": ("counter", "Bytes downloaded by assets.", None),
+    "polster_storage_operation_duration_seconds": (
+        "histogram",
+        "Latency of storage operations.",
+        STORAGE_BUCKETS,
+    ),
+    "polster_storage_errors_total": ("counter", "Failed storage operations.", None),
+    "polster_cache_requests_total": (
+        "counter",
+        "Cache lookups by cache and result (hit or miss).",
+        None,
+    ),
+}
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    """Label set in exposition format, used as the series key."""
+    return ",".join(
+        f'{key}="{_escape(value)}"' for key, value in sorted(labels.items())
+    )
+
+
+def load_state(path: str = STATE_FILE) -> dict:
+    """Cumulative metric values of earlier runs ({metric: {labels: value}})."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_state(state: dict, path: str = STATE_FILE) -> None:
+    _write_atomic(path, json.dumps(state, indent=2, sort_keys=True))
+
+
+def _write_atomic(path: str, text: str) -> None:
+    # Collectors must never read a half-written file
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def _inc(state: dict, name: str, value: float = 1, **labels: str) -> None:
+    series = state.setdefault(name, {})
+    key = _labels(**labels)
+    series[key] = series.get(key, 0) + value
+
+
+def _set(state: dict, name: str, value: float, **labels: str) -> None:
+    state.setdefault(name, {})[_labels(**labels)] = value
+
+
+def _observe(state: dict, name: str, value: float, **labels: str) -> None:
+    buckets = METRICS[name][2]
+    series = state.setdefault(name, {})
+    key = _labels(**labels)
+    entry = series.setdefault(
+        key, {"buckets": [0] * len(buckets), "sum": 0, "count": 0}
+    )
+    for i, bound in enumerate(buckets):
+        if value <= bound:
+            entry["buckets"][i] += 1
+    entry["sum"] = round(entry["sum"] + value, 6)
+    entry["count"] += 1
+
+
+def record_run(
+    state: dict,
+    spans: list[dict],
+    success: bool,
+    duration: float,
+    finished_at: float | None = None,
+) -> dict:
+    """Add one run and its spans to the cumulative metrics."""
+    by_id = {s["span_id"]: s for s in spans}
+
+    def ancestors(s: dict):
+        parent = by_id.get(s.get("parent_span_id"))
+        while parent is not None:
+            yield parent
+            parent = by_id.get(parent.get("parent_span_id"))
+
+    def asset_of(s: dict) -> str:
+        for candidate in (s, *ancestors(s)):
+            if "asset" in candidate["attributes"]:
+                return candidate["attributes"]["asset"]
+        return "none"
+
+    for s in spans:
+        attributes = s["attributes"]
+        seconds = s["duration_ms"] / 1000
+        if s["name"].startswith("asset."):
+            asset = attributes.get("asset", s["name"].removeprefix("asset."))
+            status = s["status"]
+            _inc(state, "polster_asset_runs_total", asset=asset, status=status)
+            if status == "error":
+                _inc(state, "polster_asset_failures_total", asset=asset)
+            _observe(state, "polster_asset_duration_seconds", seconds, asset=asset)
+            continue
+
+        if s["name"].startswith("storage."):
+            operation = s["name"].removeprefix("storage.")
+            backend = attributes.get("backend", "unknown")
+            _observe(
+                state,
+                "polster_storage_operation_duration_seconds",
+                seconds,
+                operation=operation,
+                backend=backend,
+            )
+            if s["status"] == "error":
+                _inc(
+                    state,
+                    "polster_storage_errors_total",
+                    operation=operation,
+                    backend=backend,
+                )
+            # An upload inside another (e.g. the dedupe manifest) is counted once
+            if any(a["name"] == s["name"] for a in ancestors(s)):
+                continue
+            asset = asset_of(s)
+            if operation in ("upload", "sink") and not attributes.get("unchanged"):
+                _inc(
+                    state,
+                    "polster_asset_bytes_written_total",
+                    attributes.get("bytes") or 0,
+                    asset=asset,
+                )
+                _inc(
+                    state,
+                    "polster_asset_rows_written_total",
+                    attributes.get("rows") or 0,
+                    asset=asset,
+                )
+            elif operation == "download":
+                _inc(
+                    state,
+                    "polster_asset_bytes_read_total",
+                    attributes.get("bytes") or 0,
+                    asset=asset,
+                )
+            if "unchanged" in attributes:
+                result = "hit" if attributes["unchanged"] else "miss"
+                _inc(
+                    state,
+                    "polster_cache_requests_total",
+                    cache="snapshot_dedupe",
+                    result=result,
+                )
+            continue
+
+        if s["name"] == "sftp.download" and "status" in attributes:
+            result = "hit" if attributes["status"] == "cached" else "miss"
+            _inc(state, "polster_cache_requests_total", cache="sftp", result=result)
+            _inc(
+                state,
+                "polster_asset_bytes_read_total",
+                attributes.get("bytes") or 0,
+                asset=asset_of(s),
+            )
+
+    _inc(state, "polster_runs_total", result="success" if success else "failure")
+    _set(state, "polster_last_run_timestamp_seconds", finished_at or time.time())
+    _set(state, "polster_last_run_duration_seconds", duration)
+    _set(state, "polster_last_run_success", 1 if success else 0)
+    return state
+
+
+def _format(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def render(state: dict) -> str:
+    """Metrics in the Prometheus text exposition format."""
+    lines = []
+    for name, (kind, help_text, buckets) in METRICS.items():
+        series = state.get(name)
+        if not series:
+            continue
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for labels, value in sorted(series.items()):
+            if kind != "histogram":
+                series_name = f"{name}{{{labels}}}" if labels else name
+                lines.append(f"{series_name} {_format(value)}")
+                continue
+            prefix = f"{labels}," if labels else ""
+            for bound, count in zip(buckets, value["buckets"], strict=True):
+                lines.append(f'{name}_bucket{{{prefix}le="{bound}"}} {count}')
+            lines.append(f'{name}_bucket{{{prefix}le="+Inf"}} {value["count"]}')
+            lines.append(f"{name}_sum{{{labels}}} {_format(value['sum'])}")
+            lines.append(f"{name}_count{{{labels}}} {value['count']}")
+    return "\n".join(lines) + "\n"
+
+
+def collect_run(
+    trace_path: str,
+    success: bool,
+    duration: float,
+    metrics_file: str | None = None,
+    state_file: str = STATE_FILE,
+) -> str:
+    """Record a traced run and return (and optionally write) the metrics text.
+
+    Args:
+        trace_path: JSON lines file holding the run's spans.
+        success: Whether the run succeeded.
+        duration: Run duration in seconds.
+        metrics_file: Textfile collector file to write, e.g.
+            ``/var/lib/node_exporter/textfile/polster.prom``.
+        state_file: Where cumulative values are kept between runs.
+    """
+    try:
+        spans = load_spans(trace_path)
+    except FileNotFoundError:
+        # Nothing traced, e.g. the run failed before any asset started
+        spans = []
+    state = record_run(load_state(state_file), spans, success, duration)
+    save_state(state, state_file)
+    text = render(state)
+    if metrics_file:
+        _write_atomic(metrics_file, text)
+    return text
+
+
+class _MetricsServer(ThreadingHTTPServer):
+    state_file = STATE_FILE
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    server: _MetricsServer
+
+    def do_GET(self) -> None:
+        if self.path.split("?")[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = render(load_state(self.server.state_file)).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+def serve_metrics(
+    port: int, host: str = "127.0.0.1", state_file: str = STATE_FILE
+) -> ThreadingHTTPServer:
+    """Serve the current metrics on ``http://host:port/metrics`` in the background.
+
+    Every scrape renders the state saved after the latest run. Returns the
+    server; call ``shutdown()`` to stop it.
+    """
+    server = _MetricsServer((host, port), _MetricsHandler)
+    server.state_file = state_file
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -14,12 +14,9 @@ while True:
     current_dir = parent
 PROJECT_ROOT = os.path.abspath(PROJECT_ROOT)
 
-# Define project root and data directories
+# Define project root and data directories. They are created by the local
+# storage backend on first write, so importing the project touches no disk.
 DATA_DIR = os.path.join(PROJECT_ROOT, "data")
 BRONZE_DIR = os.path.join(DATA_DIR, "bronze")
 SILVER_DIR = os.path.join(DATA_DIR, "silver")
 GOLD_DIR = os.path.join(DATA_DIR, "gold")
-
-# Ensure data directories exist
-for directory in [DATA_DIR, BRONZE_DIR, SILVER_DIR, GOLD_DIR]:
-    os.makedirs(directory, exist_ok=True)
@@ -0,0 +1,283 @@
+"""Bounded connection pool for database connectors.
+
+Code that queries a database borrows connections from a pool instead of
+opening its own. A pool lives in one process: the threads of an asset step
+(e.g. the parallel key-range reads of ``sql_extract``) share it, and so do
+all assets only when they run in one process (Dagster's in-process
+executor); under the default multiprocess executor every step process has
+a pool of its own. The pool caps how many connections are open,
+health-checks a connection before lending it out, recycles connections past
+a maximum age and records how long callers waited, so the pool size can be
+planned from real numbers.
+
+Works with any DB-API 2.0 driver; ``orchestration/resources.py`` wraps it as
+a Dagster resource.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+
+class PoolTimeoutError(TimeoutError):
+    """Raised when no connection became free within the acquire timeout."""
+
+
+def validate_connection(connection) -> bool:
+    """Check that a connection is still alive."""
+    try:
+        if hasattr(connection, "ping"):
+            # MySQL drivers
+            connection.ping()
+        else:
+            cursor = connection.cursor()
+            try:
+                cursor.execute("SELECT 1")
+                cursor.fetchall()
+            finally:
+                cursor.close()
+        return True
+    except Exception:
+        return False
+
+
+@dataclass
+class PoolStats:
+    """Snapshot of a pool's usage for capacity planning."""
+
+    max_size: int
+    open: int
+    in_use: int
+    idle: int
+    peak_in_use: int
+    acquired: int
+    waited: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+    timeouts: int
+    created: int
+    recycled: int
+    discarded: int
+
+    @property
+    def wait_seconds_avg(self) -> float:
+        return self.wait_seconds_total / self.acquired if self.acquired else 0.0
+
+
+class PooledConnection:
+    """A borrowed connection; ``close()`` returns it to the pool.
+
+    Everything else is delegated to the driver connection, so it can be
+    passed wherever a DB-API connection is expected (``pl.read_database``,
+    ``core.sql_extract``).
+    """
+
+    def __init__(self, pool: ConnectionPool, connection, created: float):
+        self.driver_connection = connection
+        self._pool = pool
+        self._created = created
+        self._released = False
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.driver_connection, name)
+
+    def close(self, discard: bool = False) -> None:
+        """Return the connection to the pool (or close it with ``discard``)."""
+        if not self._released:
+            self._released = True
+            self._pool._release(self.driver_connection, self._created, discard)
+
+    def __enter__(self) -> PooledConnection:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ConnectionPool:
+    """Thread-safe pool holding at most ``max_size`` open connections.
+
+    Args:
+        connect: Zero-argument function opening a new driver connection.
+        max_size: Maximum number of open connections (idle plus in use).
+        validate: Health check run before a pooled connection is lent out.
+        recycle_seconds: Connections older than this are closed and replaced,
+            ahead of server-side timeouts such as MySQL's ``wait_timeout``.
+        acquire_timeout: Seconds to wait for a free connection.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        max_size: int = 4,
+        validate: Callable[[Any], bool] | None = validate_connection,
+        recycle_seconds: float | None = 3600,
+        acquire_timeout: float = 60.0,
+    ):
+        if max_size < 1:
+            raise ValueError("Pool size must be at least 1")
+        self._connect = connect
+        self._validate = validate
+        self.max_size = max_size
+        self.recycle_seconds = recycle_seconds
+        self.acquire_timeout = acquire_timeout
+
+        self._idle: deque[tuple[Any, float]] = deque()
+        self._open = 0
+        self._in_use = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+        self._peak_in_use = 0
+        self._acquired = 0
+        self._waited = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._timeouts = 0
+        self._created = 0
+        self._recycled = 0
+        self._discarded = 0
+
+    def _expired(self, created: float) -> bool:
+        return (
+            self.recycle_seconds is not None
+            and time.monotonic() - created > self.recycle_seconds
+        )
+
+    def connect(self, timeout: float | None = None) -> PooledConnection:
+        """Borrow a connection, waiting up to ``timeout`` seconds for one.
+
+        Raises:
+            PoolTimeoutError: If the pool stays exhausted for the whole timeout.
+        """
+        timeout = self.acquire_timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+        waited = False
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Connection pool is closed")
+                if self._idle:
+                    connection, created = self._idle.pop()
+                    break
+                if self._open < self.max_size:
+                    connection, created = None, 0.0
+                    self._open += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise PoolTimeoutError(
+                        f"No connection free after {timeout:g}s "
+                        f"(pool size {self.max_size})"
+                    )
+                waited = True
+                self._condition.wait(remaining)
+
+            wait = time.monotonic() - started
+            self._in_use += 1
+            self._peak_in_use = max(self._peak_in_use, self._in_use)
+            self._acquired += 1
+            self._waited += waited
+            self._wait_total += wait
+            self._wait_max = max(self._wait_max, wait)
+
+        # The slot is ours; checks and reconnects happen outside the lock
+        try:
+            if connection is not None and self._expired(created):
+                self._close_quietly(connection)
+                connection = None
+                self._count("_recycled")
+            elif (
+                connection is not None
+                and self._validate is not None
+                and not self._validate(connection)
+            ):
+                self._close_quietly(connection)
+                connection = None
+                self._count("_discarded")
+            if connection is None:
+                connection, created = self._connect(), time.monotonic()
+                self._count("_created")
+        except BaseException:
+            with self._condition:
+                self._in_use -= 1
+                self._open -= 1
+                self._condition.notify()
+            raise
+        return PooledConnection(self, connection, created)
+
+    @contextmanager
+    def connection(self, timeout: float | None = None) -> Iterator[PooledConnection]:
+        """Borrow a connection for the duration of a ``with`` block."""
+        connection = self.connect(timeout)
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    def _release(self, connection, created: float, discard: bool) -> None:
+        if not discard:
+            try:
+                # End any open transaction so the next borrower starts clean
+                connection.rollback()
+            except Exception:
+                discard = True
+        with self._condition:
+            self._in_use -= 1
+            keep = not (discard or self._closed or self._expired(created))
+            if keep:
+                self._idle.append((connection, created))
+            else:
+                self._open -= 1
+            self._condition.notify()
+        if not keep:
+            self._close_quietly(connection)
+
+    def _count(self, counter: str) -> None:
+        with self._condition:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    @staticmethod
+    def _close_quietly(connection) -> None:
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def stats(self) -> PoolStats:
+        """Current usage and cumulative wait/recycle counters."""
+        with self._condition:
+            return PoolStats(
+                max_size=self.max_size,
+                open=self._open,
+                in_use=self._in_use,
+                idle=len(self._idle),
+                peak_in_use=self._peak_in_use,
+                acquired=self._acquired,
+                waited=self._waited,
+                wait_seconds_total=round(self._wait_total, 6),
+                wait_seconds_max=round(self._wait_max, 6),
+                timeouts=self._timeouts,
+                created=self._created,
+                recycled=self._recycled,
+                discarded=self._discarded,
+            )
+
+    def close(self) -> None:
+        """Close idle connections; borrowed ones are closed when returned."""
+        with self._condition:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._open -= len(idle)
+            self._condition.notify_all()
+        for connection, _ in idle:
+            self._close_quietly(connection)
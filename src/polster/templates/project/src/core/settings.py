@@ -11,5 +11,53 @@ BASE_PATH = os.getenv("BASE_PATH", "/src/data/dev")
 # Storage backend
 STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "local")
 
+# Multi-object reads (core.storage.fetch_objects): parallel downloads, the
+# most downloaded-but-unconsumed bytes held in memory at once, and the object
+# size assumed for the budget until the first download has completed
+READ_WORKERS = int(os.getenv("POLSTER_READ_WORKERS", "16"))
+READ_MAX_INFLIGHT_BYTES = (
+    int(os.getenv("POLSTER_READ_MAX_INFLIGHT_MB", "256")) * 1024 * 1024
+)
+READ_OBJECT_SIZE_GUESS = (
+    int(os.getenv("POLSTER_READ_OBJECT_SIZE_MB", "16")) * 1024 * 1024
+)
+
 # Dagster home
 DAGSTER_HOME = os.getenv("DAGSTER_HOME", ".dagster")
+
+# Resource pools
+# Every asset is tagged with a pool ("adls", "mysql", "api", "sftp", "cpu", ...).
+# The executor never runs more assets of one pool at the same time than its limit.
+DEFAULT_POOL = "cpu"
+POOL_TAG = "polster/pool"
+
+
+def parse_pool_limits(value: str) -> dict[str, int]:
+    """Parse pool limits from a string like "adls=4,mysql=2".
+
+    Later entries override earlier ones, so overrides can be appended.
+    """
+    limits: dict[str, int] = {}
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        pool, sep, limit = item.partition("=")
+        if not sep or not pool.strip() or not limit.strip().isdigit():
+            raise ValueError(
+                f"Invalid pool limit '{item}'. Expected POOL=LIMIT, e.g. adls=4"
+            )
+        limits[pool.strip()] = int(limit)
+    return limits
+
+
+DEFAULT_POOL_LIMITS = "adls=8,mysql=4,api=4,sftp=4"
+POOL_LIMITS = parse_pool_limits(os.getenv("POLSTER_POOL_LIMITS", DEFAULT_POOL_LIMITS))
+
+# Overall cap on concurrently running assets (empty = one per CPU)
+_max_concurrent = os.getenv("POLSTER_MAX_CONCURRENT", "")
+MAX_CONCURRENT = int(_max_concurrent) if _max_concurrent else None
+
+# Database connection pools (see orchestration/resources.py)
+MYSQL_PORT = int(os.getenv("MYSQL_PORT", "3306"))
+MYSQL_POOL_SIZE = int(os.getenv("POLSTER_MYSQL_POOL_SIZE", "4"))
@@ -0,0 +1,296 @@
+"""Streaming extraction from SQL databases to parquet.
+
+Rows are pulled with a server-side (unbuffered) cursor in fixed-size batches
+and written as parquet row groups as they arrive, so memory stays bounded by
+a few batches regardless of table size. Large tables can be split into key
+ranges that are read in parallel, each over its own connection.
+
+Works with any DB-API 2.0 driver. Server-side cursors are used for pymysql,
+mysqlclient (MySQLdb) and psycopg2; sqlite3 cursors already stream, which
+makes SQLite a convenient local stand-in for tests.
+"""
+
+from __future__ import annotations
+
+import queue
+import sys
+import threading
+import uuid
+from collections.abc import Callable, Iterator, Mapping
+from typing import Any
+
+import polars as pl
+
+try:
+    # Try relative imports (when run as module through Dagster)
+    from .storage import write_parquet_batches
+except ImportError:
+    # Fall back to absolute imports (when run directly)
+    import os
+
+    # Add src directory to path for absolute imports
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+    from core.storage import write_parquet_batches
+
+DEFAULT_BATCH_SIZE = 50_000
+
+
+def _driver_name(connection) -> str:
+    """Top-level module of the DB-API driver behind a (possibly pooled) connection."""
+    connection = getattr(connection, "driver_connection", connection)
+    return type(connection).__module__.split(".")[0]
+
+
+def server_side_cursor(connection):
+    """Open a cursor that streams rows from the server instead of buffering them."""
+    driver = _driver_name(connection)
+    if driver == "pymysql":
+        import pymysql.cursors
+
+        return connection.cursor(pymysql.cursors.SSCursor)
+    if driver == "MySQLdb":
+        import MySQLdb.cursors
+
+        return connection.cursor(MySQLdb.cursors.SSCursor)
+    if driver == "psycopg2":
+        # Named cursors are server-side in PostgreSQL
+        return connection.cursor(name=f"polster_{uuid.uuid4().hex[:8]}")
+    return connection.cursor()
+
+
+def _placeholder(connection) -> str:
+    """Positional parameter marker of the connection's driver."""
+    driver = sys.modules.get(_driver_name(connection))
+    paramstyle = getattr(driver, "paramstyle", "qmark")
+    return "?" if paramstyle == "qmark" else "%s"
+
+
+def iter_query_batches(
+    connection,
+    query: str,
+    params: tuple | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    schema: pl.Schema | None = None,
+) -> Iterator[pl.DataFrame]:
+    """Yield the result of a query as DataFrames of at most ``batch_size`` rows.
+
+    With ``schema`` (in the query's column order) every batch is built with
+    those types and nothing is inferred; otherwise each batch's types are
+    inferred from its own rows and the parquet writer widens the file to
+    their supertypes (a column that is NULL at first, integers that later
+    turn out to be floats).
+    """
+    cursor = server_side_cursor(connection)
+    try:
+        cursor.execute(query, params or ())
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            if schema is None:
+                # Named cursors only describe the result after the first fetch
+                columns = [column[0] for column in cursor.description]
+                yield pl.DataFrame(
+                    rows, schema=columns, orient="row", infer_schema_length=None
+                )
+            else:
+                yield pl.DataFrame(rows, schema=schema, orient="row", strict=False)
+    finally:
+        cursor.close()
+
+
+def key_ranges(
+    connection,
+    table: str,
+    key: str,
+    parts: int,
+    where: str | None = None,
+) -> list[tuple[int, int]]:
+    """Split the integer ``key`` of a table into half-open [start, end) ranges."""
+    cursor = connection.cursor()
+    try:
+        filter_sql = f" WHERE {where}" if where else ""
+        cursor.execute(
+            f"SELECT MIN({key}) AS low, MAX({key}) AS high FROM {table}{filter_sql}"
+        )
+        row = cursor.fetchone()
+    finally:
+        cursor.close()
+    # Connections may return rows as dicts (e.g. pymysql's DictCursor)
+    low, high = (row["low"], row["high"]) if isinstance(row, Mapping) else row
+    if low is None:
+        return []
+    low, high = int(low), int(high) + 1
+    step = max(1, -(-(high - low) // parts))
+    return [(start, min(start + step, high)) for start in range(low, high, step)]
+
+
+def _range_batches(
+    connect: Callable[[], Any],
+    table: str,
+    columns: str,
+    key: str,
+    key_range: tuple[int, int],
+    where: str | None,
+    batch_size: int,
+    schema: pl.Schema | None,
+) -> Iterator[pl.DataFrame]:
+    """Stream one key range over its own connection."""
+    connection = connect()
+    try:
+        marker = _placeholder(connection)
+        query = (
+            f"SELECT {columns} FROM {table} "
+            f"WHERE {key} >= {marker} AND {key} < {marker}"
+        )
+        if where:
+            query += f" AND ({where})"
+        yield from iter_query_batches(connection, query, key_range, batch_size, schema)
+    finally:
+        connection.close()
+
+
+def _parallel_batches(
+    producers: list[Callable[[], Iterator[pl.DataFrame]]], workers: int
+) -> Iterator[pl.DataFrame]:
+    """Run batch producers on threads and yield their batches as they arrive.
+
+    The queue is bounded, so fast readers block instead of piling up batches
+    while the writer catches up.
+    """
+    batches: queue.Queue = queue.Queue(maxsize=workers * 2)
+    pending: queue.Queue = queue.Queue()
+    for producer in producers:
+        pending.put(producer)
+    stop = threading.Event()
+    done = object()
+
+    def work() -> None:
+        try:
+            while not stop.is_set():
+                try:
+                    producer = pending.get_nowait()
+                except queue.Empty:
+                    return
+                for batch in producer():
+                    while not stop.is_set():
+                        try:
+                            batches.put(batch, timeout=0.5)
+                            break
+                        except queue.Full:
+                            continue
+                    if stop.is_set():
+                        return
+        except BaseException as e:
+            stop.set()
+            batches.put(e)
+        finally:
+            batches.put(done)
+
+    threads = [threading.Thread(target=work, daemon=True) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    try:
+        finished = 0
+        while finished < len(threads):
+            item = batches.get()
+            if item is done:
+                finished += 1
+            elif isinstance(item, BaseException):
+                raise item
+            else:
+                yield item
+    finally:
+        stop.set()
+        # Unblock producers waiting on a full queue
+        while any(thread.is_alive() for thread in threads):
+            try:
+                batches.get(timeout=0.1)
+            except queue.Empty:
+                pass
+
+
+def extract_table_to_parquet(
+    connect: Callable[[], Any],
+    table: str,
+    layer: str,
+    filename: str,
+    columns: str = "*",
+    where: str | None = None,
+    key: str | None = None,
+    workers: int = 1,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    schema: pl.Schema | None = None,
+) -> str:
+    """Stream a table into one parquet snapshot through the storage layer.
+
+    Args:
+        connect: Zero-argument function returning a new DB-API connection;
+            every parallel worker opens its own. A pool's ``connect``
+            (``core.pool.ConnectionPool``) borrows them instead.
+        table: Table (or view) to read.
+        layer: Storage layer to write to, e.g. "bronze".
+        filename: Parquet filename within the layer.
+        columns: Column list for the SELECT.
+        where: Optional SQL filter.
+        key: Integer column used to split the table into ranges; required
+            when ``workers`` > 1. An indexed primary key works best.
+        workers: Number of key ranges read in parallel.
+        batch_size: Rows fetched and written per batch (one row group each).
+        schema: Expected output types (e.g. the asset's SCHEMA).
+
+    Returns:
+        str: Path of the written parquet file.
+    """
+    if workers > 1 and not key:
+        raise ValueError("Parallel extraction needs a key column to split on")
+
+    if workers <= 1:
+        connection = connect()
+        try:
+            query = f"SELECT {columns} FROM {table}" + (
+                f" WHERE {where}" if where else ""
+            )
+            return write_parquet_batches(
+                iter_query_batches(connection, query, None, batch_size, schema),
+                layer,
+                filename,
+                schema,
+            )
+        finally:
+            connection.close()
+
+    connection = connect()
+    try:
+        # More ranges than workers evens out skewed key distributions
+        ranges = key_ranges(connection, table, key, workers * 4, where)
+    finally:
+        connection.close()
+
+    producers = [
+        lambda key_range=key_range: _range_batches(
+            connect, table, columns, key, key_range, where, batch_size, schema
+        )
+        for key_range in ranges
+    ]
+    return write_parquet_batches(
+        _parallel_batches(producers, workers), layer, filename, schema
+    )
+
+
+def extract_query_to_parquet(
+    connection,
+    query: str,
+    layer: str,
+    filename: str,
+    params: tuple | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    schema: pl.Schema | None = None,
+) -> str:
+    """Stream the result of an arbitrary query into one parquet snapshot."""
+    return write_parquet_batches(
+        iter_query_batches(connection, query, params, batch_size, schema),
+        layer,
+        filename,
+        schema,
+    )
@@ -1,17 +1,43 @@
-"""Storage abstraction for local and ADLS backends."""
+"""Storage abstraction over pluggable backends (local, ADLS, S3, fsspec, memory).
+
+Every function here works in terms of ``(layer, filename)`` and delegates to
+the backend selected by STORAGE_BACKEND (see ``core/backends.py``). Writes go
+through the backend's staged writes, so a snapshot only appears under its
+name once complete; reads and scans hand the backend's URI and
+``storage_options`` to polars so remote files are scanned natively.
+
+Besides timestamped parquet snapshots, a layer can hold Delta Lake tables
+(``write_delta`` / ``scan_delta``), which are updated in place by appending,
+overwriting or merging on key columns, and can be read as of any earlier
+version or time.
+
+Each operation runs in a ``storage.*`` tracing span (list, download, parse,
+upload, read, ...) tagged with the backend, bytes and rows; see
+``core/tracing.py``.
+"""
 
 from __future__ import annotations
 
+import contextvars
+import hashlib
 import io
+import json
 import os
+import re
+import shutil
+import tempfile
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from datetime import UTC, datetime
 from typing import Literal
-from urllib.parse import urlparse
 
 import polars as pl
 
-from .paths import DATA_DIR
-
-StorageBackend = Literal["local", "adls"]
+from .backends import Backend, backend_names, get_backend
+from .settings import READ_MAX_INFLIGHT_BYTES, READ_OBJECT_SIZE_GUESS, READ_WORKERS
+from .tracing import span
+from .validation import validate_schema
 
 
 def _load_env(name: str, default: str | None = None) -> str | None:
@@ -20,12 +46,16 @@ def _load_env(name: str, default: str | None = None) -> str | None:
     return value
 
 
-def get_storage_backend() -> StorageBackend:
-    """Get the configured storage backend."""
+def get_storage_backend() -> str:
+    """Name of the configured storage backend (STORAGE_BACKEND).
+
+    The backend actually in use is ``get_backend().name``; it is "local"
+    when the configured one is missing its settings or client library.
+    """
     backend = (_load_env("STORAGE_BACKEND", "local") or "local").lower()
-    if backend not in {"local", "adls"}:
+    if backend not in backend_names():
         raise ValueError(f"Unsupported STORAGE_BACKEND: {backend}")
-    return backend  # type: ignore[return-value]
+    return backend
 
 
 def is_adls_configured() -> bool:
@@ -39,139 +69,929 @@ def is_adls_configured() -> bool:
     )
 
 
-def _adls_base_path() -> str:
-    """Get ADLS base path."""
-    return (_load_env("ADLS_BASE_PATH", "polster/data") or "polster/data").strip("/")
-
-
 def get_adls_base_path() -> str:
     """Get ADLS base path (public interface)."""
-    return _adls_base_path()
+    return (_load_env("ADLS_BASE_PATH", "polster/data") or "polster/data").strip("/")
 
 
 def resolve_path(layer: str, filename: str) -> str:
-    """Resolve file path for the configured storage backend."""
-    backend = get_storage_backend()
-    if backend == "local":
-        return os.path.join(DATA_DIR, layer, filename)
-
-    account_name = _load_env("ADLS_ACCOUNT_NAME")
-    container = _load_env("ADLS_CONTAINER")
-    if not account_name or not container:
-        raise ValueError(
-            "ADLS_ACCOUNT_NAME and ADLS_CONTAINER are required for ADLS storage"
-        )
-    base_path = _adls_base_path()
-    return f"abfss://{container}@{account_name}.dfs.core.windows.net/{base_path}/{layer}/{filename}"
+    """Resolve file path (or URI) for the configured storage backend."""
+    return get_backend().uri(layer, filename)
+
 
+def storage_options() -> dict[str, str] | None:
+    """Options polars needs to read ``resolve_path`` URIs directly."""
+    return get_backend().storage_options()
 
-def write_parquet(df: pl.DataFrame, layer: str, filename: str) -> str:
-    """Write a DataFrame to parquet storage."""
-    backend = get_storage_backend()
 
-    if backend == "local":
-        output_path = resolve_path(layer, filename)
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        df.write_parquet(output_path)
-        return output_path
+def _span(
+    operation: str, backend: Backend, layer: str, filename: str = "", **attributes
+):
+    """Tracing span of one storage operation."""
+    return span(
+        f"storage.{operation}",
+        backend=backend.name,
+        layer=layer,
+        file=filename or None,
+        **attributes,
+    )
 
-    output_uri = resolve_path(layer, filename)
-    parsed = urlparse(output_uri)
 
-    account_name = _load_env("ADLS_ACCOUNT_NAME")
-    account_key = _load_env("ADLS_ACCOUNT_KEY")
-    container = _load_env("ADLS_CONTAINER")
+STATE_LAYER = "_state"
+_SNAPSHOT_STAMP = re.compile(r"\d{4}-?\d{2}-?\d{2}(T\d{2}:?\d{2}:?\d{2}(\.\d+)?Z?)?$")
+
+
+class SnapshotPath(str):
+    """Path of a written snapshot, with its content hash.
+
+    ``unchanged`` is set when a deduplicated write found the content
+    identical to the previous snapshot and returned that one instead of
+    writing a new copy.
+    """
+
+    sha256: str | None
+    unchanged: bool
+
+    def __new__(cls, path: str, sha256: str | None = None, unchanged: bool = False):
+        snapshot = super().__new__(cls, path)
+        snapshot.sha256 = sha256
+        snapshot.unchanged = unchanged
+        return snapshot
+
+
+def _manifest_file(layer: str, filename: str) -> str:
+    """State document recording the last deduplicated snapshot of a table.
+
+    Snapshots of one table share their name up to the timestamp, e.g.
+    ``bronze_orders_20260101T000000Z.parquet`` -> ``bronze_orders``.
+    """
+    stem = filename.removesuffix(".parquet")
+    key = _SNAPSHOT_STAMP.sub("", stem).rstrip("_-.") or stem
+    return f"snapshots_{layer}_{key}.json"
+
+
+def _previous_snapshot(
+    backend: Backend, layer: str, filename: str, digest: str
+) -> str | None:
+    """URI of the newest snapshot of this table if it has the same content.
+
+    The manifest only records deduplicated writes, so it is trusted only
+    while the snapshot it names is still the table's newest one: after a
+    plain write (or a deleted snapshot) the content is written again.
+    """
+    entry = read_json(STATE_LAYER, _manifest_file(layer, filename))
+    if not entry or entry.get("sha256") != digest:
+        return None
+    stem = filename.removesuffix(".parquet")
+    prefix = _SNAPSHOT_STAMP.sub("", stem)
+    if prefix == stem:
+        # Not a timestamped snapshot: each write replaces the same file
+        newest = entry["file"] if entry["file"] in backend.list(layer, stem) else None
+    else:
+        snapshots = list_snapshots(layer, prefix)
+        newest = snapshots[-1][0] if snapshots else None
+    if newest != entry["file"]:
+        return None
+    return backend.uri(layer, entry["file"])
+
+
+def _record_snapshot(layer: str, filename: str, digest: str, size: int) -> None:
+    write_json(
+        {
+            "file": filename,
+            "sha256": digest,
+            "bytes": size,
+            "written_at": datetime.now(UTC).isoformat(),
+        },
+        STATE_LAYER,
+        _manifest_file(layer, filename),
+    )
 
-    if not account_name or not account_key or not container:
-        return _write_parquet_local_fallback(df, layer, filename)
 
-    output_path = parsed.path.lstrip("/")
+def write_parquet(
+    df: pl.DataFrame,
+    layer: str,
+    filename: str,
+    schema: pl.Schema | None = None,
+    dedupe: bool = False,
+) -> str:
+    """Write a DataFrame to parquet storage.
+
+    When ``schema`` is given the DataFrame is validated against it first (see
+    ``core.validation.validate_schema``), so a snapshot never drifts in type.
+
+    With ``dedupe`` the file is hashed before upload. If it is byte-identical
+    to the table's previous snapshot nothing is written and that snapshot's
+    path is returned with ``unchanged`` set (see ``SnapshotPath``), so the
+    orchestration layer can skip the materialization.
+    """
+    if schema is not None:
+        df = validate_schema(df, schema)
+
+    backend = get_backend()
+    with _span("upload", backend, layer, filename, rows=df.height) as traced:
+        if dedupe:
+            buffer = io.BytesIO()
+            df.write_parquet(buffer)
+            data = buffer.getvalue()
+            digest = hashlib.sha256(data).hexdigest()
+            traced.set("bytes", len(data))
+            previous = _previous_snapshot(backend, layer, filename, digest)
+            traced.set("unchanged", previous is not None)
+            if previous is not None:
+                return SnapshotPath(previous, digest, unchanged=True)
+            path = backend.write_bytes(layer, filename, data)
+            _record_snapshot(layer, filename, digest, len(data))
+            return SnapshotPath(path, digest)
+
+        staged = backend.open_staged(layer, filename)
+        try:
+            df.write_parquet(staged)
+            traced.set("bytes", staged.tell())
+            return staged.commit()
+        except BaseException:
+            staged.abort()
+            raise
+
+
+class _HashingWriter(io.RawIOBase):
+    """Passes writes through to a staged write while hashing them."""
+
+    def __init__(self, staged):
+        self.staged = staged
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.sha256.update(data)
+        self.size += memoryview(data).nbytes
+        return self.staged.write(data)
+
+    def tell(self) -> int:
+        return self.size
+
+
+def _widen_schema(current: pl.Schema | None, batch: pl.Schema) -> pl.Schema:
+    """Schema holding both: columns unioned by name, each at its supertype."""
+    if current is None:
+        return batch
+    return pl.concat(
+        [pl.DataFrame(schema=current), pl.DataFrame(schema=batch)],
+        how="diagonal_relaxed",
+    ).schema
+
+
+def _conform_batch(df: pl.DataFrame, schema: pl.Schema) -> pl.DataFrame:
+    """Cast a batch to the schema, adding its missing columns as nulls."""
+    return df.select(
+        pl.col(name).cast(dtype)
+        if name in df.columns
+        else pl.lit(None, dtype).alias(name)
+        for name, dtype in schema.items()
+    )
 
-    buffer = io.BytesIO()
-    df.write_parquet(buffer)
-    buffer.seek(0)
 
+class ParquetSnapshotWriter:
+    """Writes DataFrame batches to one parquet snapshot, one row group each.
+
+    The snapshot is written through the backend's staged write (a temporary
+    file, staged ADLS blocks or an S3 multipart upload) and only appears
+    under its real name on ``commit``, so readers never see a partial file.
+
+    Without ``schema`` the batches' types are inferred and may change from
+    one batch to the next (a column that is all null at first, integers
+    that later turn out to be floats, keys that first appear later). The
+    file is then spooled locally and, when a batch needs wider types, the
+    row groups written so far are rewritten with the common supertypes, one
+    at a time; the finished file is uploaded on ``commit``.
+
+    With ``dedupe`` the bytes are hashed as they are written and a file
+    identical to the previous snapshot is discarded on ``commit``; ``path``
+    then names that snapshot and ``unchanged`` is set.
+    Use it through ``open_parquet_writer``.
+    """
+
+    def __init__(
+        self,
+        layer: str,
+        filename: str,
+        schema: pl.Schema | None = None,
+        compression: str = "zstd",
+        dedupe: bool = False,
+    ):
+        self.layer = layer
+        self.filename = filename
+        self.schema = schema
+        self.compression = compression
+        self.rows = 0
+        self.row_groups = 0
+        self.unchanged = False
+
+        self._backend = get_backend()
+        self.path = self._backend.uri(layer, filename)
+        self._staged = self._backend.open_staged(layer, filename)
+        self._sink = _HashingWriter(self._staged) if dedupe else self._staged
+        self._writer = None
+        # Inferred types: spool locally so the file can be rewritten wider
+        self._file_schema: pl.Schema | None = None
+        self._spool_path: str | None = None
+        self._spool = None
+        if schema is None:
+            self._open_spool()
+
+    def _open_spool(self) -> None:
+        fd, self._spool_path = tempfile.mkstemp(suffix=".parquet")
+        self._spool = os.fdopen(fd, "wb")
+
+    def _close_spool(self) -> None:
+        if self._spool is not None and not self._spool.closed:
+            self._spool.close()
+
+    def write(self, df: pl.DataFrame) -> None:
+        """Append a batch as a row group, validated against the schema."""
+        if self.schema is not None:
+            df = validate_schema(df, self.schema)
+        else:
+            schema = _widen_schema(self._file_schema, df.schema)
+            if self._file_schema is not None and schema != self._file_schema:
+                self._rewrite(schema)
+            self._file_schema = schema
+            df = _conform_batch(df, schema)
+        target = self._spool if self._spool is not None else self._sink
+        with _span(
+            "upload", self._backend, self.layer, self.filename, rows=df.height
+        ) as traced:
+            written = target.tell()
+            self._write_table(df.to_arrow())
+            traced.set("bytes", target.tell() - written)
+        self.rows += df.height
+
+    def _write_table(self, table) -> None:
+        import pyarrow.parquet as pq
+
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(
+                self._spool if self._spool is not None else self._sink,
+                table.schema,
+                compression=self.compression,
+            )
+        elif table.schema != self._writer.schema:
+            # Same polars types can map to different arrow metadata
+            table = table.cast(self._writer.schema)
+        self._writer.write_table(table)
+        self.row_groups += 1
+
+    def _rewrite(self, schema: pl.Schema) -> None:
+        """Rewrite the spooled row groups with wider types."""
+        import pyarrow.parquet as pq
+
+        with _span("rewrite", self._backend, self.layer, self.filename, rows=self.rows):
+            self._writer.close()
+            self._writer = None
+            self._close_spool()
+            previous = self._spool_path
+            self._open_spool()
+            self.row_groups = 0
+            source = pq.ParquetFile(previous)
+            try:
+                for index in range(source.num_row_groups):
+                    part = pl.from_arrow(source.read_row_group(index))
+                    self._write_table(_conform_batch(part, schema).to_arrow())
+            finally:
+                source.close()
+                os.remove(previous)
+
+    def commit(self) -> str:
+        """Finish the file and move it to its final name."""
+        with _span("commit", self._backend, self.layer, self.filename) as traced:
+            if self._writer is None:
+                # No batches at all: still produce a valid, empty snapshot
+                self._write_table(pl.DataFrame(schema=self.schema).to_arrow())
+            self._writer.close()
+            self._writer = None
+            if self._spool is not None:
+                self._close_spool()
+                with open(self._spool_path, "rb") as data:
+                    shutil.copyfileobj(data, self._sink, length=8 * 1024 * 1024)
+                os.remove(self._spool_path)
+                self._spool = self._spool_path = None
+            traced.set_attributes(
+                total_rows=self.rows,
+                row_groups=self.row_groups,
+                file_bytes=self._sink.tell(),
+            )
+            if not isinstance(self._sink, _HashingWriter):
+                self.path = self._staged.commit()
+                return self.path
+
+            digest = self._sink.sha256.hexdigest()
+            previous = _previous_snapshot(
+                self._backend, self.layer, self.filename, digest
+            )
+            traced.set("unchanged", previous is not None)
+            if previous is not None:
+                self._staged.abort()
+                self.unchanged = True
+                self.path = SnapshotPath(previous, digest, unchanged=True)
+                return self.path
+            path = self._staged.commit()
+            _record_snapshot(self.layer, self.filename, digest, self._sink.size)
+            self.path = SnapshotPath(path, digest)
+            return self.path
+
+    def abort(self) -> None:
+        """Discard everything written so far."""
+        if self._writer is not None:
+            try:
+                self._writer.close()
+            except Exception:
+                pass
+            self._writer = None
+        if self._spool is not None:
+            self._close_spool()
+            if os.path.exists(self._spool_path):
+                os.remove(self._spool_path)
+            self._spool = self._spool_path = None
+        self._staged.abort()
+
+
+@contextmanager
+def open_parquet_writer(
+    layer: str,
+    filename: str,
+    schema: pl.Schema | None = None,
+    dedupe: bool = False,
+) -> Iterator[ParquetSnapshotWriter]:
+    """Stream batches into one parquet snapshot in bounded memory.
+
+    Each ``write(batch)`` becomes a row group; the snapshot is committed
+    atomically when the block exits and discarded if it raises::
+
+        with open_parquet_writer("bronze", filename, schema=SCHEMA) as writer:
+            for batch in source:
+                writer.write(batch)
+        return writer.path
+
+    Without ``schema`` the batches' types may differ and the file is widened
+    to fit them all; with ``dedupe`` an unchanged snapshot is not kept (see
+    ``ParquetSnapshotWriter``). Requires pyarrow.
+    """
+    writer = ParquetSnapshotWriter(layer, filename, schema, dedupe=dedupe)
+    try:
+        yield writer
+        writer.commit()
+    except BaseException:
+        writer.abort()
+        raise
+
+
+def write_parquet_batches(
+    batches: Iterable[pl.DataFrame],
+    layer: str,
+    filename: str,
+    schema: pl.Schema | None = None,
+    dedupe: bool = False,
+) -> str:
+    """Write DataFrame batches to one parquet file, one row group per batch.
+
+    Only one batch is held in memory at a time, so the output can be far
+    larger than RAM (see ``open_parquet_writer``).
+    """
+    with open_parquet_writer(layer, filename, schema, dedupe=dedupe) as writer:
+        for df in batches:
+            writer.write(df)
+    return writer.path
+
+
+def sink_parquet(
+    lf: pl.LazyFrame,
+    layer: str,
+    filename: str,
+    schema: pl.Schema | None = None,
+) -> str:
+    """Stream a LazyFrame into a parquet file without collecting it.
+
+    Polars' streaming engine writes the result in chunks, so memory stays
+    bounded by the chunk size rather than the size of the inputs. Locally it
+    sinks straight into the staged file; for remote backends it sinks to a
+    temporary file that is then streamed into the staged upload.
+    """
+    if schema is not None:
+        lf = validate_schema(lf, schema)
+
+    backend = get_backend()
+    staged = backend.open_staged(layer, filename)
+    # The span includes running the query, which streams into the file
+    with _span("sink", backend, layer, filename) as traced:
+        try:
+            local_path = getattr(staged, "local_path", None)
+            if local_path is not None:
+                lf.sink_parquet(local_path, compression="zstd")
+                traced.set("bytes", os.path.getsize(local_path))
+                return staged.commit()
+
+            fd, tmp_path = tempfile.mkstemp(suffix=".parquet")
+            os.close(fd)
+            try:
+                lf.sink_parquet(tmp_path, compression="zstd")
+                traced.set("bytes", os.path.getsize(tmp_path))
+                with open(tmp_path, "rb") as data:
+                    shutil.copyfileobj(data, staged, length=8 * 1024 * 1024)
+            finally:
+                os.remove(tmp_path)
+            return staged.commit()
+        except BaseException:
+            staged.abort()
+            raise
+
+
+def _read_parquet_file(backend: Backend, layer: str, filename: str) -> pl.LazyFrame:
+    """Lazy scan of one file, natively when polars can reach the backend."""
+    if backend.native_scan:
+        return pl.scan_parquet(
+            backend.uri(layer, filename), storage_options=backend.storage_options()
+        )
+    with _span("download", backend, layer, filename) as traced:
+        data = backend.read_bytes(layer, filename)
+        traced.set("bytes", len(data))
+    return _parse_parquet(backend, layer, filename, data).lazy()
+
+
+def _parse_parquet(
+    backend: Backend, layer: str, filename: str, data: bytes
+) -> pl.DataFrame:
+    """Decode a downloaded parquet file."""
+    with _span("parse", backend, layer, filename, bytes=len(data)) as traced:
+        df = pl.read_parquet(io.BytesIO(data))
+        traced.set("rows", df.height)
+    return df
+
+
+def scan_parquet(layer: str, filename: str) -> pl.LazyFrame:
+    """Lazily scan one parquet file in a layer.
+
+    Remote files are read by polars itself, so only the row groups and
+    columns a query needs are fetched.
+    """
+    return _read_parquet_file(get_backend(), layer, filename)
+
+
+def fetch_objects(
+    layer: str,
+    filenames: Iterable[str],
+    workers: int | None = None,
+    max_inflight_bytes: int | None = None,
+) -> Iterator[tuple[str, bytes]]:
+    """Download many objects concurrently, yielding each as soon as it arrives.
+
+    Up to ``workers`` downloads run at once (POLSTER_READ_WORKERS). New ones
+    are only started while the bytes downloaded but not yet consumed, plus
+    the downloads still running (at the average object size so far), stay
+    under ``max_inflight_bytes`` (POLSTER_READ_MAX_INFLIGHT_MB), so memory
+    stays bounded however many objects there are. Until the first download
+    completes, objects are assumed to be POLSTER_READ_OBJECT_SIZE_MB large.
+    Objects are yielded in completion order as ``(filename, data)``.
+
+    The budget covers the raw bytes until the caller consumes them; what
+    the caller keeps (e.g. the decoded frames of ``iter_parquet_objects``)
+    is up to it.
+    """
+    backend = get_backend()
+    workers = max(1, workers or READ_WORKERS)
+    budget = max_inflight_bytes or READ_MAX_INFLIGHT_BYTES
+    names = iter(filenames)
+    running: set[Future] = set()
+    fetched = fetched_bytes = 0
+    exhausted = False
+
+    def download(name: str) -> tuple[str, bytes]:
+        with _span("download", backend, layer, name) as traced:
+            data = backend.read_bytes(layer, name)
+            traced.set("bytes", len(data))
+        return name, data
+
+    pool = ThreadPoolExecutor(max_workers=workers)
     try:
-        from azure.storage.filedatalake import DataLakeServiceClient
-    except ModuleNotFoundError:
-        return _write_parquet_local_fallback(df, layer, filename)
+        while True:
+            while not exhausted and len(running) < workers:
+                held = sum(len(f.result()[1]) for f in running if f.done())
+                pending = sum(1 for f in running if not f.done())
+                expected = (
+                    fetched_bytes / fetched if fetched else READ_OBJECT_SIZE_GUESS
+                )
+                if running and held + pending * expected >= budget:
+                    break
+                name = next(names, None)
+                if name is None:
+                    exhausted = True
+                    break
+                # Run in a copy of the caller's context so the download
+                # spans nest under the caller's span
+                context = contextvars.copy_context()
+                running.add(pool.submit(context.run, download, name))
+            if not running:
+                return
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                running.discard(future)
+                name, data = future.result()
+                fetched += 1
+                fetched_bytes += len(data)
+                yield name, data
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def iter_parquet_objects(
+    layer: str,
+    filenames: Iterable[str],
+    workers: int | None = None,
+    max_inflight_bytes: int | None = None,
+) -> Iterator[tuple[str, pl.DataFrame]]:
+    """Read many parquet files, decoding each one as its download completes."""
+    backend = get_backend()
+    for filename, data in fetch_objects(layer, filenames, workers, max_inflight_bytes):
+        yield filename, _parse_parquet(backend, layer, filename, data)
+
+
+def _scan_files(
+    backend: Backend, layer: str, filenames: list[str]
+) -> list[pl.LazyFrame]:
+    """One lazy frame per file, in the order given.
+
+    Backends polars reads natively are scanned with pushdown (polars fetches
+    the files concurrently itself); others are downloaded with
+    ``fetch_objects`` and decoded as they arrive. Their frames are all kept
+    in memory, so the in-flight budget only bounds the downloads on top of
+    them; stream large ranges with ``iter_parquet_objects`` instead.
+    """
+    if backend.native_scan:
+        options = backend.storage_options()
+        return [
+            pl.scan_parquet(backend.uri(layer, filename), storage_options=options)
+            for filename in filenames
+        ]
+    frames = dict(iter_parquet_objects(layer, filenames))
+    return [frames[filename].lazy() for filename in filenames]
 
-    data_lake_service_client = DataLakeServiceClient(
-        account_url=f"https://{account_name}.dfs.core.windows.net",
-        credential=account_key,
-    )
-    file_system_client = data_lake_service_client.get_file_system_client(container)
-    file_client = file_system_client.get_file_client(output_path)
-    file_client.upload_data(buffer.read(), overwrite=True)
 
-    return output_uri
+def scan_parquet_files(layer: str, filenames: list[str]) -> pl.LazyFrame:
+    """Lazily scan several parquet files in a layer as one table.
+
+    Each file is scanned with projection and predicate pushdown where the
+    backend allows it; columns are unioned by name across files.
+    """
+    backend = get_backend()
+    if not filenames:
+        raise FileNotFoundError(f"No parquet files given in {backend.uri(layer, '')}")
+    return pl.concat(_scan_files(backend, layer, filenames), how="diagonal_relaxed")
 
 
-def _write_parquet_local_fallback(df: pl.DataFrame, layer: str, filename: str) -> str:
-    """Fallback to local storage if ADLS is not configured."""
-    output_path = os.path.join(DATA_DIR, layer, filename)
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    df.write_parquet(output_path)
-    return output_path
+def scan_parquet_latest(layer: str, prefix: str) -> pl.LazyFrame:
+    """Lazily scan the latest parquet file for a given prefix."""
+    backend = get_backend()
+    candidates = list_parquet(layer, prefix)
+    if not candidates:
+        raise FileNotFoundError(
+            f"No parquet files found in {backend.uri(layer, '')} with prefix {prefix}"
+        )
+    return _read_parquet_file(backend, layer, max(candidates))
 
 
 def read_parquet_latest(layer: str, prefix: str) -> pl.DataFrame:
     """Read the latest parquet file for a given prefix."""
-    backend = get_storage_backend()
-    if backend == "local" or not is_adls_configured():
-        return _read_latest_local(layer, prefix)
+    with _span("read", get_backend(), layer, prefix=prefix) as traced:
+        df = scan_parquet_latest(layer, prefix).collect()
+        traced.set("rows", df.height)
+    return df
+
+
+def parse_snapshot_time(text: str) -> datetime | None:
+    """Timestamp in a snapshot name (``20260101T000000Z``, ``20260101``, ISO 8601)."""
+    for pattern in ("%Y%m%dT%H%M%SZ", "%Y%m%dT%H%M%S", "%Y%m%d", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(text, pattern).replace(tzinfo=UTC)
+        except ValueError:
+            pass
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+def _as_time(value: datetime | str | None) -> datetime | None:
+    if value is None or isinstance(value, datetime):
+        if value is not None and value.tzinfo is None:
+            return value.replace(tzinfo=UTC)
+        return value
+    parsed = parse_snapshot_time(value)
+    if parsed is None:
+        raise ValueError(f"Not a snapshot timestamp: {value!r}")
+    return parsed
+
+
+def list_snapshots(
+    layer: str,
+    prefix: str,
+    since: datetime | str | None = None,
+    until: datetime | str | None = None,
+    last_n: int | None = None,
+) -> list[tuple[str, datetime]]:
+    """Snapshots of a table as ``(filename, timestamp)``, oldest first.
+
+    Snapshots are the files named ``<prefix><timestamp>.parquet``; files
+    whose remainder is not a timestamp (e.g. ``<prefix>daily_...``) belong to
+    other tables and are skipped. ``since`` and ``until`` are inclusive
+    bounds; ``last_n`` keeps the newest n snapshots within them.
+    """
+    since, until = _as_time(since), _as_time(until)
+    snapshots = []
+    for filename in list_parquet(layer, prefix):
+        timestamp = parse_snapshot_time(filename[len(prefix) : -len(".parquet")])
+        if timestamp is None:
+            continue
+        if (since and timestamp < since) or (until and timestamp > until):
+            continue
+        snapshots.append((filename, timestamp))
+    snapshots.sort(key=lambda snapshot: snapshot[1])
+    if last_n is not None:
+        snapshots = snapshots[-last_n:] if last_n > 0 else []
+    return snapshots
+
+
+def scan_parquet_range(
+    layer: str,
+    prefix: str,
+    since: datetime | str | None = None,
+    until: datetime | str | None = None,
+    last_n: int | None = None,
+    include_snapshot_ts: bool = False,
+) -> pl.LazyFrame:
+    """Lazily scan a table's snapshots in a time range as one dataset.
+
+    Snapshots are selected by the timestamps in their names (see
+    ``list_snapshots``) and scanned with pushdown, so a query that needs a
+    few columns only reads those. With ``include_snapshot_ts`` each row gets
+    the timestamp of its snapshot as ``_snapshot_ts`` (UTC), for trends and
+    incremental logic::
+
+        history = scan_parquet_range(
+            "silver", "silver_orders_", since="20260101", include_snapshot_ts=True
+        )
+        history.group_by("_snapshot_ts").agg(pl.col("total_amount").sum())
+
+    Raises:
+        FileNotFoundError: If no snapshot matches.
+    """
+    backend = get_backend()
+    snapshots = list_snapshots(layer, prefix, since, until, last_n)
+    if not snapshots:
+        raise FileNotFoundError(
+            f"No snapshots found in {backend.uri(layer, '')} with prefix {prefix} "
+            f"in the requested range"
+        )
+    frames = _scan_files(backend, layer, [filename for filename, _ in snapshots])
+    if include_snapshot_ts:
+        frames = [
+            frame.with_columns(
+                pl.lit(timestamp, dtype=pl.Datetime("us", "UTC")).alias("_snapshot_ts")
+            )
+            for frame, (_, timestamp) in zip(frames, snapshots, strict=True)
+        ]
+    return pl.concat(frames, how="diagonal_relaxed")
 
-    account_name = _load_env("ADLS_ACCOUNT_NAME")
-    account_key = _load_env("ADLS_ACCOUNT_KEY")
-    container = _load_env("ADLS_CONTAINER")
-    base_path = _adls_base_path()
 
-    if not account_name or not account_key or not container:
-        return _read_latest_local(layer, prefix)
+def list_parquet(layer: str, prefix: str = "") -> list[str]:
+    """List the parquet filenames in a layer, optionally filtered by prefix."""
+    backend = get_backend()
+    with _span("list", backend, layer, prefix=prefix) as traced:
+        names = [
+            name for name in backend.list(layer, prefix) if name.endswith(".parquet")
+        ]
+        traced.set("files", len(names))
+    return names
 
-    try:
-        from azure.storage.filedatalake import DataLakeServiceClient
-    except ModuleNotFoundError:
-        return _read_latest_local(layer, prefix)
 
-    data_lake_service_client = DataLakeServiceClient(
-        account_url=f"https://{account_name}.dfs.core.windows.net",
-        credential=account_key,
-    )
-    file_system_client = data_lake_service_client.get_file_system_client(container)
+def read_parquet(layer: str, filename: str) -> pl.DataFrame:
+    """Read one parquet file from a layer."""
+    with _span("read", get_backend(), layer, filename) as traced:
+        df = scan_parquet(layer, filename).collect()
+        traced.set("rows", df.height)
+    return df
 
-    directory_path = f"{base_path}/{layer}".strip("/")
-    candidates = []
-    for path_item in file_system_client.get_paths(path=directory_path):
-        if path_item.is_directory:
-            continue
-        name = path_item.name.split("/")[-1]
-        if name.startswith(prefix) and name.endswith(".parquet"):
-            candidates.append(path_item.name)
 
-    if not candidates:
-        raise FileNotFoundError(
-            f"No parquet files found in {directory_path} with prefix {prefix}"
+def delete_file(layer: str, filename: str) -> None:
+    """Delete a file from a layer; missing files are ignored."""
+    backend = get_backend()
+    with _span("delete", backend, layer, filename):
+        backend.delete(layer, filename)
+
+
+def write_json(data: dict, layer: str, filename: str) -> str:
+    """Write a small JSON document (e.g. extraction state) to a layer."""
+    payload = json.dumps(data, indent=2, default=str).encode("utf-8")
+    backend = get_backend()
+    with _span("upload", backend, layer, filename, bytes=len(payload)):
+        return backend.write_bytes(layer, filename, payload)
+
+
+def read_json(layer: str, filename: str) -> dict | None:
+    """Read a JSON document from a layer; None if it doesn't exist."""
+    backend = get_backend()
+    with _span("download", backend, layer, filename) as traced:
+        try:
+            data = backend.read_bytes(layer, filename)
+        except FileNotFoundError:
+            traced.set("found", False)
+            return None
+        traced.set("bytes", len(data))
+    return json.loads(data)
+
+
+# =============================================================================
+# Delta Lake tables
+# =============================================================================
+
+DeltaMode = Literal["append", "overwrite", "merge"]
+
+
+def _delta_backend() -> Backend:
+    backend = get_backend()
+    if not backend.native_scan:
+        raise ValueError(
+            f"Delta tables are not supported on the {backend.name} backend "
+            "(use local, adls, s3 or an fsspec URL polars can reach natively)"
         )
+    return backend
 
-    latest_path = max(candidates)
-    file_client = file_system_client.get_file_client(latest_path)
-    data = file_client.download_file().readall()
-    buffer = io.BytesIO(data)
-    return pl.read_parquet(buffer)
-
-
-def _read_latest_local(layer: str, prefix: str) -> pl.DataFrame:
-    """Read the latest parquet file from local storage."""
-    directory = os.path.join(DATA_DIR, layer)
-    candidates = [
-        filename
-        for filename in os.listdir(directory)
-        if filename.startswith(prefix) and filename.endswith(".parquet")
-    ]
-    if not candidates:
-        raise FileNotFoundError(
-            f"No parquet files found in {directory} with prefix {prefix}"
+
+def delta_exists(layer: str, name: str) -> bool:
+    """Whether a Delta table exists in a layer."""
+    from deltalake import DeltaTable
+
+    backend = _delta_backend()
+    return DeltaTable.is_deltatable(
+        backend.uri(layer, name), storage_options=backend.storage_options()
+    )
+
+
+class DeltaTablePath(str):
+    """URI of a Delta table written by ``write_delta``.
+
+    Carries the table's layer, name and the version the write produced, so
+    the output can be read back as a table rather than as a file.
+    """
+
+    layer: str
+    name: str
+    version: int | None
+
+    def __new__(cls, uri: str, layer: str, name: str, version: int | None = None):
+        path = super().__new__(cls, uri)
+        path.layer = layer
+        path.name = name
+        path.version = version
+        return path
+
+
+def write_delta(
+    df: pl.DataFrame,
+    layer: str,
+    name: str,
+    mode: DeltaMode = "append",
+    on: str | list[str] | None = None,
+    schema: pl.Schema | None = None,
+) -> str:
+    """Write a DataFrame to a Delta table in a layer.
+
+    Unlike a snapshot, the table keeps its identity across runs: "append"
+    adds rows, "overwrite" replaces the contents as a new version and
+    "merge" upserts by the key columns in ``on`` (matching rows are
+    updated, new keys inserted, everything else is left untouched), so only
+    the data files holding changed rows are rewritten. The first write
+    creates the table whatever the mode.
+
+    Args:
+        df: Rows to write. For "merge", keys must be unique within ``df``.
+        layer: Storage layer, e.g. "silver".
+        name: Table name within the layer, e.g. "silver_orders".
+        mode: "append", "overwrite" or "merge".
+        on: Key column(s) for "merge".
+        schema: Expected column types; validated before writing.
+
+    Returns:
+        DeltaTablePath: URI of the table, with the version written.
+
+    Requires: pip install deltalake
+    """
+    if mode not in ("append", "overwrite", "merge"):
+        raise ValueError(f"Unsupported Delta write mode: {mode}")
+    keys = [on] if isinstance(on, str) else list(on or [])
+    if mode == "merge" and not keys:
+        raise ValueError("Merging into a Delta table needs key columns (on=...)")
+    if schema is not None:
+        df = validate_schema(df, schema)
+
+    backend = _delta_backend()
+    uri = backend.uri(layer, name)
+    options = backend.storage_options()
+
+    with _span(
+        "upload", backend, layer, name, rows=df.height, format="delta", mode=mode
+    ):
+        if mode != "merge" or not delta_exists(layer, name):
+            df.write_delta(
+                uri, mode="append" if mode == "merge" else mode, storage_options=options
+            )
+            return _delta_path(layer, name)
+
+        predicate = " AND ".join(f"target.{key} = source.{key}" for key in keys)
+        (
+            df.write_delta(
+                uri,
+                mode="merge",
+                storage_options=options,
+                delta_merge_options={
+                    "predicate": predicate,
+                    "source_alias": "source",
+                    "target_alias": "target",
+                },
+            )
+            .when_matched_update_all()
+            .when_not_matched_insert_all()
+            .execute()
         )
-    latest = max(candidates)
-    return pl.read_parquet(os.path.join(directory, latest))
+        return _delta_path(layer, name)
+
+
+def _delta_path(layer: str, name: str) -> DeltaTablePath:
+    from deltalake import DeltaTable
+
+    backend = _delta_backend()
+    uri = backend.uri(layer, name)
+    version = DeltaTable(uri, storage_options=backend.storage_options()).version()
+    return DeltaTablePath(uri, layer, name, version)
+
+
+def scan_delta(
+    layer: str, name: str, version: int | str | datetime | None = None
+) -> pl.LazyFrame:
+    """Lazily scan a Delta table, optionally as of an earlier version.
+
+    ``version`` is a version number, or a datetime (or ISO 8601 string) to
+    read the table as it was at that time; None reads the latest version.
+    """
+    backend = _delta_backend()
+    return pl.scan_delta(
+        backend.uri(layer, name),
+        version=version,
+        storage_options=backend.storage_options(),
+    )
+
+
+def read_delta(
+    layer: str, name: str, version: int | str | datetime | None = None
+) -> pl.DataFrame:
+    """Read a Delta table, optionally as of an earlier version (see scan_delta)."""
+    with _span("read", get_backend(), layer, name, format="delta") as traced:
+        df = scan_delta(layer, name, version).collect()
+        traced.set("rows", df.height)
+    return df
+
+
+def describe_output(
+    path: str, preview_rows: int = 20
+) -> tuple[int, list[str], pl.DataFrame]:
+    """Row count, columns and first rows of an asset's output.
+
+    ``path`` is what a core function returned: a parquet snapshot, scanned
+    so only its footer and first rows are read (downloaded whole on backends
+    polars can't scan), or a ``DeltaTablePath``, read as the table at the
+    version that was written.
+    """
+    backend = get_backend()
+    if isinstance(path, DeltaTablePath):
+        lf = scan_delta(path.layer, path.name, path.version)
+    elif backend.native_scan:
+        lf = pl.scan_parquet(str(path), storage_options=backend.storage_options())
+    else:
+        # Snapshot paths are the backend's uri(layer, filename)
+        layer, filename = str(path).rstrip("/").split("/")[-2:]
+        lf = _read_parquet_file(backend, layer, filename)
+    row_count = lf.select(pl.len()).collect().item()
+    return row_count, lf.collect_schema().names(), lf.head(preview_rows).collect()
+
+
+def delta_history(layer: str, name: str, limit: int | None = None) -> list[dict]:
+    """Commits of a Delta table, newest first (version, timestamp, operation)."""
+    from deltalake import DeltaTable
+
+    backend = _delta_backend()
+    table = DeltaTable(
+        backend.uri(layer, name), storage_options=backend.storage_options()
+    )
+    return table.history(limit)
@@ -0,0 +1,386 @@
+"""Structured tracing spans for storage operations, transforms and assets.
+
+Tracing is off unless POLSTER_TRACE is set, and then every span is timed
+and tagged with attributes such as ``rows``, ``bytes`` and ``backend``:
+
+- ``json``: spans are appended as JSON lines to POLSTER_TRACE_FILE
+  (default ``.polster/traces/<run id>.jsonl``), one file per run.
+- ``otlp``: spans are exported to an OpenTelemetry collector through the
+  OpenTelemetry SDK over OTLP/HTTP, configured by the standard
+  OTEL_EXPORTER_OTLP_* variables (pip install -e ".[tracing]").
+
+``json,otlp`` does both.
+
+Spans nest: the asset span contains the ``core.*`` span of its core
+function, which contains the ``storage.*`` spans of its reads and writes.
+Code can add its own::
+
+    with span("silver.dedupe", rows=df.height) as s:
+        df = df.unique()
+        s.set("rows_out", df.height)
+
+``summarize_run`` (or ``python src/core/tracing.py [RUN_ID]``) splits the
+time of each asset of a run into storage I/O and compute. Lazy scans that
+polars reads natively fetch their data when the query is collected in the
+core function, so that time counts as compute unless the data is read with
+``read_parquet``/``read_parquet_latest`` or wrapped in a span of its own.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextvars
+import functools
+import json
+import os
+import secrets
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+try:
+    from .paths import PROJECT_ROOT
+except ImportError:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from core.paths import PROJECT_ROOT
+
+TRACES_DIR = os.path.join(PROJECT_ROOT, ".polster", "traces")
+
+_current: contextvars.ContextVar[Span | None] = contextvars.ContextVar(
+    "polster_span", default=None
+)
+_run_id: str | None = None
+_trace_ids: dict[str, str] = {}
+_tracer = None
+_lock = threading.Lock()
+
+
+def trace_modes() -> frozenset[str]:
+    """Configured exporters ("json", "otlp" or both); empty when tracing is off."""
+    value = os.getenv("POLSTER_TRACE", "").strip().lower()
+    if value in ("", "0", "off", "false", "none"):
+        return frozenset()
+    modes = frozenset(mode.strip() for mode in value.split(",") if mode.strip())
+    unknown = modes - {"json", "otlp"}
+    if unknown:
+        raise ValueError(
+            f"Unsupported POLSTER_TRACE: {', '.join(sorted(unknown))} "
+            "(use json, otlp or both)"
+        )
+    return modes
+
+
+def get_run_id() -> str:
+    """Id of the current run: set_run_id, POLSTER_RUN_ID, or one per process."""
+    global _run_id
+    if _run_id is None:
+        _run_id = (
+            os.getenv("POLSTER_RUN_ID")
+            or time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+            + f"-{secrets.token_hex(4)}"
+        )
+    return _run_id
+
+
+def set_run_id(run_id: str) -> None:
+    """Group the following spans under a run, e.g. the Dagster run id."""
+    global _run_id
+    _run_id = run_id
+
+
+def trace_file(run_id: str | None = None) -> str:
+    """JSON lines file the spans of a run are written to."""
+    configured = os.getenv("POLSTER_TRACE_FILE")
+    if configured:
+        return configured
+    return os.path.join(TRACES_DIR, f"{run_id or get_run_id()}.jsonl")
+
+
+def _trace_id(run_id: str) -> str:
+    """Trace id shared by all spans of a run (a Dagster run id is a UUID)."""
+    if run_id not in _trace_ids:
+        compact = run_id.replace("-", "").lower()
+        if len(compact) == 32 and all(c in "0123456789abcdef" for c in compact):
+            _trace_ids[run_id] = compact
+        else:
+            _trace_ids[run_id] = secrets.token_hex(16)
+    return _trace_ids[run_id]
+
+
+class Span:
+    """One timed operation; ``set`` adds attributes while it runs."""
+
+    def __init__(self, name: str, attributes: dict[str, Any], parent: Span | None):
+        self.name = name
+        self.attributes = attributes
+        self.parent = parent
+        self.span_id = secrets.token_hex(8)
+        self.start_ns = time.time_ns()
+        self.end_ns: int | None = None
+        self.error: str | None = None
+        self._otel = None
+
+    def set(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+        if self._otel is not None and value is not None:
+            self._otel.set_attribute(key, _otel_value(value))
+
+    def set_attributes(self, **attributes: Any) -> None:
+        for key, value in attributes.items():
+            self.set(key, value)
+
+
+class _NoopSpan:
+    """Stands in for a span when tracing is off."""
+
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, **attributes: Any) -> None:
+        pass
+
+
+_NOOP = _NoopSpan()
+
+
+def _otel_value(value: Any):
+    return value if isinstance(value, (bool, int, float, str)) else str(value)
+
+
+def _otel_tracer():
+    """OpenTelemetry tracer exporting to OTLP, set up on first use."""
+    global _tracer
+    with _lock:
+        if _tracer is None:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+                OTLPSpanExporter,
+            )
+            from opentelemetry.sdk.resources import Resource
+            from opentelemetry.sdk.trace import TracerProvider
+            from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+            provider = TracerProvider(
+                resource=Resource.create(
+                    {
+                        "service.name": os.getenv("OTEL_SERVICE_NAME", "polster"),
+                        "polster.run_id": get_run_id(),
+                    }
+                )
+            )
+            provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+            atexit.register(provider.shutdown)
+            _tracer = provider.get_tracer("polster")
+    return _tracer
+
+
+def _export_json(record: Span) -> None:
+    run_id = get_run_id()
+    parent = record.parent
+    line = json.dumps(
+        {
+            "run_id": run_id,
+            "trace_id": _trace_id(run_id),
+            "span_id": record.span_id,
+            "parent_span_id": parent.span_id if parent else None,
+            "name": record.name,
+            "start_time_unix_nano": record.start_ns,
+            "end_time_unix_nano": record.end_ns,
+            "duration_ms": round((record.end_ns - record.start_ns) / 1e6, 3),
+            "status": "error" if record.error else "ok",
+            "error": record.error,
+            "attributes": record.attributes,
+            "pid": os.getpid(),
+        },
+        default=str,
+    )
+    path = trace_file(run_id)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    # One write per line in append mode, so processes can share the file
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(line + "\n")
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span | _NoopSpan]:
+    """Time the block as a span named ``name``, child of the current span.
+
+    Attributes can be passed up front or added with ``set`` as they become
+    known; an exception marks the span as failed and is re-raised.
+    """
+    modes = trace_modes()
+    if not modes:
+        yield _NOOP
+        return
+
+    record = Span(name, dict(attributes), _current.get())
+    token = _current.set(record)
+    otel_cm = None
+    if "otlp" in modes:
+        from opentelemetry import trace
+
+        otel_cm = trace.use_span(
+            _otel_tracer().start_span(
+                name,
+                attributes={
+                    k: _otel_value(v) for k, v in attributes.items() if v is not None
+                },
+            ),
+            end_on_exit=True,
+        )
+        record._otel = otel_cm.__enter__()
+    try:
+        yield record
+    except BaseException as e:
+        record.error = f"{type(e).__name__}: {e}"
+        if otel_cm is not None:
+            otel_cm.__exit__(type(e), e, e.__traceback__)
+            otel_cm = None
+        raise
+    finally:
+        record.end_ns = time.time_ns()
+        _current.reset(token)
+        if otel_cm is not None:
+            otel_cm.__exit__(None, None, None)
+        if "json" in modes:
+            _export_json(record)
+
+
+def traced(name: str | None = None, **attributes: Any) -> Callable:
+    """Decorator running a function inside a span (default ``module.function``)."""
+
+    def decorate(func: Callable) -> Callable:
+        span_name = name or f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(span_name, **attributes):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def load_spans(path: str) -> list[dict]:
+    """All spans in a JSON lines trace file."""
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"No traces at {path}")
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def read_spans(run_id: str | None = None) -> list[dict]:
+    """Spans of a run from the JSON lines traces (the latest run if None)."""
+    path = os.getenv("POLSTER_TRACE_FILE")
+    if path is None and run_id is not None:
+        path = trace_file(run_id)
+    elif path is None:
+        files = [
+            os.path.join(TRACES_DIR, f)
+            for f in (os.listdir(TRACES_DIR) if os.path.isdir(TRACES_DIR) else [])
+            if f.endswith(".jsonl")
+        ]
+        if not files:
+            raise FileNotFoundError(f"No traces in {TRACES_DIR}")
+        path = max(files, key=os.path.getmtime)
+    spans = load_spans(path)
+    if run_id is None and spans:
+        run_id = spans[-1]["run_id"]
+    return [s for s in spans if s["run_id"] == run_id]
+
+
+def _busy_ms(intervals: list[tuple[int, int]]) -> float:
+    """Wall-clock time covered by (start, end) intervals in ns, overlaps once."""
+    total, covered = 0, None
+    for start, end in sorted(intervals):
+        if covered is None or start > covered:
+            total += end - start
+            covered = end
+        elif end > covered:
+            total += end - covered
+            covered = end
+    return total / 1e6
+
+
+def summarize_run(run_id: str | None = None) -> list[dict]:
+    """Time of each asset of a run split into storage I/O and compute.
+
+    Storage time is the wall-clock time covered by the outermost
+    ``storage.*`` spans under the asset (or under a top-level ``core.*`` span
+    when run outside Dagster), so concurrent downloads count once; compute
+    is the rest. Bytes and rows are summed over those spans.
+    """
+    spans = read_spans(run_id)
+    by_id = {s["span_id"]: s for s in spans}
+
+    def root(s: dict) -> dict:
+        while s.get("parent_span_id") in by_id:
+            s = by_id[s["parent_span_id"]]
+        return s
+
+    def under_storage(s: dict) -> bool:
+        parent = by_id.get(s.get("parent_span_id"))
+        while parent is not None:
+            if parent["name"].startswith("storage."):
+                return True
+            parent = by_id.get(parent.get("parent_span_id"))
+        return False
+
+    totals: dict[str, dict] = {}
+    intervals: dict[str, list[tuple[int, int]]] = {}
+    for s in spans:
+        if s.get("parent_span_id") not in by_id:
+            totals[s["span_id"]] = {
+                "name": s["attributes"].get("asset", s["name"]),
+                "total_ms": s["duration_ms"],
+                "storage_ms": 0.0,
+                "bytes": 0,
+                "rows_written": 0,
+                "status": s["status"],
+            }
+    for s in spans:
+        if not s["name"].startswith("storage.") or under_storage(s):
+            continue
+        root_id = root(s)["span_id"]
+        intervals.setdefault(root_id, []).append(
+            (s["start_time_unix_nano"], s["end_time_unix_nano"])
+        )
+        entry = totals[root_id]
+        entry["bytes"] += int(s["attributes"].get("bytes") or 0)
+        if s["name"] in ("storage.upload", "storage.sink"):
+            entry["rows_written"] += int(s["attributes"].get("rows") or 0)
+
+    summary = []
+    for root_id, entry in totals.items():
+        entry["storage_ms"] = round(_busy_ms(intervals.get(root_id, [])), 3)
+        entry["compute_ms"] = round(max(entry["total_ms"] - entry["storage_ms"], 0), 3)
+        summary.append(entry)
+    return sorted(summary, key=lambda e: e["total_ms"], reverse=True)
+
+
+def main() -> int:
+    run_id = sys.argv[1] if len(sys.argv) > 1 else None
+    try:
+        summary = summarize_run(run_id)
+    except FileNotFoundError as e:
+        print(e, file=sys.stderr)
+        return 1
+    print(
+        f"{'span':40} {'total ms':>10} {'storage ms':>11} {'compute ms':>11} {'MB':>8}"
+    )
+    for entry in summary:
+        share = entry["storage_ms"] / entry["total_ms"] if entry["total_ms"] else 0
+        bound = "I/O" if share >= 0.5 else "compute"
+        print(
+            f"{entry['name'][:40]:40} {entry['total_ms']:>10.1f} "
+            f"{entry['storage_ms']:>11.1f} {entry['compute_ms']:>11.1f} "
+            f"{entry['bytes'] / 1e6:>8.2f}  {bound}-bound"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
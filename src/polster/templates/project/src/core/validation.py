@@ -0,0 +1,53 @@
+"""Schema validation for asset outputs.
+
+Assets declare their output columns and types as a ``pl.Schema`` constant
+(``polster add-asset --schema-from sample.parquet`` generates one). Reading
+with that schema skips polars' type inference, and validating each batch
+before it is written stops type drift between snapshots.
+"""
+
+from __future__ import annotations
+
+import polars as pl
+
+
+class SchemaError(ValueError):
+    """Raised when a DataFrame does not match the declared schema."""
+
+    def __init__(self, problems: list[str]):
+        self.problems = problems
+        super().__init__("Schema mismatch: " + "; ".join(problems))
+
+
+def validate_schema(
+    df: pl.DataFrame | pl.LazyFrame,
+    schema: pl.Schema | dict[str, pl.DataType],
+    allow_extra: bool = False,
+) -> pl.DataFrame | pl.LazyFrame:
+    """Check a DataFrame against a schema and return it in schema column order.
+
+    A LazyFrame is checked against its resolved schema without collecting it.
+
+    Args:
+        df: Batch (or lazy query) to check.
+        schema: Expected column names and types.
+        allow_extra: Keep columns that are not in the schema (after the
+            schema columns) instead of failing.
+
+    Raises:
+        SchemaError: On missing columns, wrong types or unexpected columns.
+    """
+    expected = pl.Schema(schema)
+    actual = df.collect_schema()
+    problems = []
+    for name, dtype in expected.items():
+        if name not in actual:
+            problems.append(f"missing column {name!r}")
+        elif actual[name] != dtype:
+            problems.append(f"column {name!r} is {actual[name]}, expected {dtype}")
+    extra = [name for name in actual if name not in expected]
+    if extra and not allow_extra:
+        problems.append(f"unexpected columns {extra}")
+    if problems:
+        raise SchemaError(problems)
+    return df.select([*expected.names(), *extra])
@@ -1,17 +1,18 @@
 """Bronze example asset."""
 
-from dagster import asset
+from dagster import AssetExecutionContext, asset
 
-from src.core.bronze_example import extract
-from src.orchestration.utils import create_output_with_metadata
+from core.bronze_example import extract
+from orchestration.utils import materialize
 
 
 @asset(
     group_name="bronze",
     description="Bronze example asset - data extraction",
     compute_kind="polars",
+    output_required=False,
+    op_tags={"polster/pool": "cpu"},
 )
-def run_bronze_example():
+def run_bronze_example(context: AssetExecutionContext):
     """Run bronze example extraction."""
-    bronze_path = extract()
-    return create_output_with_metadata(bronze_path)
+    yield from materialize(context, extract)
@@ -1,19 +1,20 @@
 """Gold example asset."""
 
-from dagster import AutomationCondition, asset
+from dagster import AssetExecutionContext, AutomationCondition, asset
 
-from src.core.gold_example import aggregate
-from src.orchestration.utils import create_output_with_metadata
+from core.gold_example import aggregate
+from orchestration.utils import materialize
 
 
 @asset(
     group_name="gold",
     description="Gold example asset - data aggregation",
     compute_kind="polars",
+    output_required=False,
+    op_tags={"polster/pool": "cpu"},
     automation_condition=AutomationCondition.eager(),
     deps=["run_silver_example"],
 )
-def run_gold_example():
+def run_gold_example(context: AssetExecutionContext):
     """Run gold example aggregation."""
-    gold_path = aggregate()
-    return create_output_with_metadata(gold_path)
+    yield from materialize(context, aggregate)
@@ -1,19 +1,20 @@
 """Silver example asset."""
 
-from dagster import AutomationCondition, asset
+from dagster import AssetExecutionContext, AutomationCondition, asset
 
-from src.core.silver_example import transform
-from src.orchestration.utils import create_output_with_metadata
+from core.silver_example import transform
+from orchestration.utils import materialize
 
 
 @asset(
     group_name="silver",
     description="Silver example asset - data transformation",
     compute_kind="polars",
+    output_required=False,
+    op_tags={"polster/pool": "cpu"},
     automation_condition=AutomationCondition.eager(),
     deps=["run_bronze_example"],
 )
-def run_silver_example():
+def run_silver_example(context: AssetExecutionContext):
     """Run silver example transformation."""
-    silver_path = transform()
-    return create_output_with_metadata(silver_path)
+    yield from materialize(context, transform)
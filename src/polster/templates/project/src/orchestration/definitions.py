@@ -6,12 +6,23 @@ assets with eager materialization for silver and gold layers.
 
 from dagster import (
     Definitions,
+    EnvVar,
     load_assets_from_modules,
     define_asset_job,
+    multiprocess_executor,
     ScheduleDefinition,
     AssetSelection,
 )
 
+from core.settings import (
+    MAX_CONCURRENT,
+    MYSQL_POOL_SIZE,
+    MYSQL_PORT,
+    POOL_LIMITS,
+    POOL_TAG,
+)
+from orchestration.resources import MySQLPoolResource
+
 # Import asset modules
 from orchestration.assets import bronze, silver, gold
 
@@ -23,6 +34,17 @@ gold_assets = load_assets_from_modules([gold], group_name="gold")
 # Combine all assets
 all_assets = [*bronze_assets, *silver_assets, *gold_assets]
 
+# Limit how many assets of each resource pool run at once (see core/settings.py)
+executor_config = {
+    "tag_concurrency_limits": [
+        {"key": POOL_TAG, "value": pool, "limit": limit}
+        for pool, limit in POOL_LIMITS.items()
+    ]
+}
+if MAX_CONCURRENT is not None:
+    executor_config["max_concurrent"] = MAX_CONCURRENT
+executor = multiprocess_executor.configured(executor_config)
+
 # Define a job for all bronze assets
 bronze_job = define_asset_job("bronze_job", selection=AssetSelection.groups("bronze"))
 
@@ -32,4 +54,24 @@ bronze_schedule = ScheduleDefinition(
     cron_schedule="0 0 * * *",  # Daily at 12:00 AM
 )
 
-defs = Definitions(assets=all_assets, jobs=[bronze_job], schedules=[bronze_schedule])
+# Shared connection pools; assets borrow by declaring a parameter named after
+# the resource key (e.g. `def run_bronze_orders(mysql: MySQLPoolResource)`).
+# Credentials are only read when an asset that uses the resource runs.
+resources = {
+    "mysql": MySQLPoolResource(
+        host=EnvVar("MYSQL_HOST"),
+        user=EnvVar("MYSQL_USER"),
+        password=EnvVar("MYSQL_PASSWORD"),
+        database=EnvVar("MYSQL_DATABASE"),
+        port=MYSQL_PORT,
+        max_size=MYSQL_POOL_SIZE,
+    ),
+}
+
+defs = Definitions(
+    assets=all_assets,
+    jobs=[bronze_job],
+    schedules=[bronze_schedule],
+    executor=executor,
+    resources=resources,
+)
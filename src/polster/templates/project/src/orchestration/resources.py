@@ -0,0 +1,109 @@
+"""Dagster resources for Polster projects.
+
+Database resources hold a bounded connection pool (see ``core/pool.py``) that
+assets borrow from instead of connecting themselves. The pool is not shared
+between assets: the project's multiprocess executor runs each asset step in
+its own process with its own copy of the resource and pool, which the
+step's threads share. The number of connections to a database is therefore
+at most the pool size times the concurrency limit of the asset's resource
+pool (``POLSTER_POOL_LIMITS``, e.g. ``mysql=4``). Assets only share one pool
+when the job runs with Dagster's ``in_process_executor``, which runs them
+one at a time.
+"""
+
+from abc import abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from dagster import ConfigurableResource, InitResourceContext, get_dagster_logger
+from pydantic import PrivateAttr
+
+from core.pool import ConnectionPool, PooledConnection
+
+
+class ConnectionPoolResource(ConfigurableResource):
+    """Base resource lending out pooled connections.
+
+    Abstract: subclasses implement ``create_connection`` for their driver.
+    """
+
+    max_size: int = 4
+    recycle_seconds: float = 3600
+    acquire_timeout: float = 60
+
+    _pool: ConnectionPool | None = PrivateAttr(default=None)
+
+    @abstractmethod
+    def create_connection(self):
+        """Open a new driver connection."""
+
+    def setup_for_execution(self, context: InitResourceContext) -> None:
+        self._pool = ConnectionPool(
+            self.create_connection,
+            max_size=self.max_size,
+            recycle_seconds=self.recycle_seconds,
+            acquire_timeout=self.acquire_timeout,
+        )
+
+    def teardown_after_execution(self, context: InitResourceContext) -> None:
+        if self._pool is None:
+            return
+        stats = self._pool.stats()
+        if stats.acquired:
+            get_dagster_logger().info(
+                f"{type(self).__name__}: {stats.acquired} checkouts, "
+                f"peak {stats.peak_in_use}/{stats.max_size} in use, "
+                f"{stats.waited} waited (max {stats.wait_seconds_max:.3f}s), "
+                f"{stats.created} opened, {stats.recycled} recycled, "
+                f"{stats.discarded} failed health checks"
+            )
+        self._pool.close()
+
+    @property
+    def pool(self) -> ConnectionPool:
+        if self._pool is None:
+            raise RuntimeError("Resource is not initialized; use it inside an asset")
+        return self._pool
+
+    def connect(self) -> PooledConnection:
+        """Borrow a connection; ``close()`` returns it to the pool."""
+        return self.pool.connect()
+
+    @contextmanager
+    def connection(self) -> Iterator[PooledConnection]:
+        """Borrow a connection for the duration of a ``with`` block."""
+        with self.pool.connection() as connection:
+            yield connection
+
+    def metadata(self) -> dict:
+        """Pool statistics to attach to an asset's output metadata."""
+        stats = self.pool.stats()
+        return {
+            "pool_in_use_peak": stats.peak_in_use,
+            "pool_size": stats.max_size,
+            "pool_checkouts": stats.acquired,
+            "pool_wait_max_s": stats.wait_seconds_max,
+            "pool_wait_avg_s": round(stats.wait_seconds_avg, 6),
+            "pool_timeouts": stats.timeouts,
+        }
+
+
+class MySQLPoolResource(ConnectionPoolResource):
+    """Pooled MySQL connections (requires: pip install pymysql)."""
+
+    host: str
+    user: str
+    password: str
+    database: str
+    port: int = 3306
+
+    def create_connection(self):
+        import pymysql
+
+        return pymysql.connect(
+            host=self.host,
+            user=self.user,
+            password=self.password,
+            database=self.database,
+            port=self.port,
+        )
@@ -1,8 +1,13 @@
 """Shared utilities for Dagster orchestration."""
 
-from dagster import Output, MetadataValue
+from collections.abc import Callable, Iterator
+
+from dagster import AssetExecutionContext, AssetObservation, Output, MetadataValue
 import polars as pl
 
+from core.storage import DeltaTablePath, describe_output
+from core.tracing import set_run_id, span
+
 
 def df_to_markdown_table(df: pl.DataFrame) -> str:
     """Convert Polars DataFrame to markdown table format.
@@ -26,24 +31,94 @@ def df_to_markdown_table(df: pl.DataFrame) -> str:
 
 
 def create_output_with_metadata(file_path: str) -> Output:
-    """Create Dagster Output with standard metadata for a parquet file.
+    """Create Dagster Output with standard metadata for an asset's output.
 
     Args:
-        file_path: Path to the parquet file
+        file_path: Path to the parquet file, or the ``DeltaTablePath``
+            returned by ``write_delta``
 
     Returns:
         Output object with metadata including row count, column count,
         column list, and data preview
     """
-    df = pl.read_parquet(file_path)
-
-    return Output(
-        value=file_path,
-        metadata={
-            "row_count": len(df),
-            "column_count": len(df.columns),
-            "columns": MetadataValue.json(df.columns),
-            "preview": MetadataValue.md(df_to_markdown_table(df.head(20))),
-            "file_path": file_path,
-        },
-    )
+    with span("storage.read", file=str(file_path), purpose="metadata") as traced:
+        row_count, columns, preview = describe_output(file_path)
+        traced.set("rows", row_count)
+
+    metadata = {
+        "row_count": row_count,
+        "column_count": len(columns),
+        "columns": MetadataValue.json(columns),
+        "preview": MetadataValue.md(df_to_markdown_table(preview)),
+        "file_path": str(file_path),
+    }
+    if isinstance(file_path, DeltaTablePath):
+        metadata["delta_version"] = file_path.version
+    return Output(value=file_path, metadata=metadata)
+
+
+def snapshot_outputs(
+    context: AssetExecutionContext, file_path: str | None
+) -> Iterator[Output]:
+    """Materialize a written snapshot, or skip it if the content was unchanged.
+
+    Deduplicated writes (``write_parquet(..., dedupe=True)``) return the
+    previous snapshot with ``unchanged`` set when the new output is
+    byte-identical. The asset then yields no Output, so nothing is
+    materialized and eager downstream assets don't fire; an observation
+    records the check instead. Assets using this must be declared with
+    ``output_required=False``.
+
+    Args:
+        context: The asset's execution context
+        file_path: Path returned by the core function, or None when there
+            was no input and nothing was written
+
+    Yields:
+        The Output for a new snapshot, nothing for an unchanged one
+    """
+    if file_path is None:
+        context.log.info("No new input")
+        return
+    if getattr(file_path, "unchanged", False):
+        context.log.info(f"Output unchanged, keeping {file_path}")
+        context.log_event(
+            AssetObservation(
+                asset_key=context.asset_key,
+                metadata={
+                    "status": "unchanged",
+                    "file_path": str(file_path),
+                    "sha256": file_path.sha256,
+                },
+            )
+        )
+        return
+    yield create_output_with_metadata(file_path)
+
+
+def materialize(
+    context: AssetExecutionContext, func: Callable[[], str | None]
+) -> Iterator[Output]:
+    """Run an asset's core function and materialize the snapshot it returns.
+
+    With tracing enabled (POLSTER_TRACE, see ``core/tracing.py``) the asset
+    runs in a span tagged with the asset key and the Dagster run id, the
+    core function in a ``core.<function>`` span inside it, and the storage
+    operations inside that, so each asset's time splits into I/O and compute.
+
+    Args:
+        context: The asset's execution context
+        func: The core ``extract``/``transform``/``aggregate`` function
+
+    Yields:
+        The outputs of ``snapshot_outputs``
+    """
+    set_run_id(context.run_id)
+    asset = context.asset_key.to_user_string()
+    with span(f"asset.{asset}", asset=asset, run_id=context.run_id) as traced:
+        with span(f"core.{func.__name__}", module=func.__module__):
+            file_path = func()
+        if file_path is not None:
+            traced.set("file_path", str(file_path))
+        traced.set("unchanged", bool(getattr(file_path, "unchanged", False)))
+        yield from snapshot_outputs(context, file_path)
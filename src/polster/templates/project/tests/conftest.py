@@ -0,0 +1,43 @@
+"""Shared pytest fixtures for {{PROJECT_NAME}}.
+
+Transforms are tested against the in-memory storage backend, so a test
+never touches the data directory or cloud storage::
+
+    def test_transform_drops_cancelled(memory_storage, seed_snapshot):
+        seed_snapshot("bronze", "bronze_orders_20260101T000000Z.parquet", orders)
+        transform()
+        silver = read_parquet_latest("silver", "silver_orders_")
+        assert silver.filter(pl.col("status") == "cancelled").is_empty()
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+
+import polars as pl
+import pytest
+
+from core import storage
+from core.backends import MemoryBackend, get_backend, reset_backends
+
+
+@pytest.fixture
+def memory_storage(monkeypatch: pytest.MonkeyPatch) -> Iterator[MemoryBackend]:
+    """Route all storage calls to an empty in-memory backend for one test."""
+    monkeypatch.setenv("STORAGE_BACKEND", "memory")
+    reset_backends()
+    backend = get_backend()
+    yield backend
+    reset_backends()
+
+
+@pytest.fixture
+def seed_snapshot(
+    memory_storage: MemoryBackend,
+) -> Callable[[str, str, pl.DataFrame], str]:
+    """Write an input snapshot into the in-memory layers."""
+
+    def seed(layer: str, filename: str, df: pl.DataFrame) -> str:
+        return storage.write_parquet(df, layer, filename)
+
+    return seed
@@ -0,0 +1,51 @@
+"""Shared fixtures for the polster CLI and project template tests."""
+
+from __future__ import annotations
+
+import shutil
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+TEMPLATE_DIR = Path(__file__).parents[1] / "src" / "polster" / "templates"
+
+# Settings read by the template's core modules; tests start from defaults
+_PROJECT_ENV = (
+    "STORAGE_BACKEND",
+    "POLSTER_TRACE",
+    "POLSTER_TRACE_FILE",
+    "POLSTER_RUN_ID",
+    "POLSTER_READ_WORKERS",
+    "POLSTER_READ_MAX_INFLIGHT_MB",
+    "POLSTER_READ_OBJECT_SIZE_MB",
+)
+
+
+def _forget_project_modules() -> None:
+    for name in list(sys.modules):
+        if name in ("core", "orchestration") or name.startswith(
+            ("core.", "orchestration.")
+        ):
+            del sys.modules[name]
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """A copy of the project template whose ``core`` package is importable.
+
+    Local storage writes go to the copy's ``data`` directory.
+    """
+    root = tmp_path / "project"
+    shutil.copytree(
+        TEMPLATE_DIR / "project",
+        root,
+        ignore=shutil.ignore_patterns("__pycache__", "data", ".polster"),
+    )
+    for name in _PROJECT_ENV:
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.syspath_prepend(str(root / "src"))
+    _forget_project_modules()
+    yield root
+    _forget_project_modules()
@@ -0,0 +1,80 @@
+"""Paginated API extraction against an in-process mock of the endpoint."""
+
+from __future__ import annotations
+
+import functools
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+
+def serve_pages(monkeypatch: pytest.MonkeyPatch, pages: dict[int, list]) -> None:
+    """Answer ``?page=N`` with ``{"data": pages[N]}`` (empty past the end)."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        return httpx.Response(200, json={"data": pages.get(page, [])})
+
+    monkeypatch.setattr(
+        httpx,
+        "AsyncClient",
+        functools.partial(httpx.AsyncClient, transport=httpx.MockTransport(handler)),
+    )
+
+
+def test_batches_are_inferred_and_widened(
+    project: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from core.api_extract import Pagination, extract_api_to_parquet
+
+    # value is null on the first page; extra only appears on the second
+    serve_pages(
+        monkeypatch,
+        {
+            1: [{"id": 1, "value": None}, {"id": 2, "value": None}],
+            2: [{"id": 3, "value": 1.5, "extra": "x"}],
+        },
+    )
+    path = extract_api_to_parquet(
+        "https://api.test/items",
+        "bronze",
+        "bronze_items_20260101T000000Z.parquet",
+        pagination=Pagination(page_size=2),
+        batch_rows=2,
+    )
+
+    assert pl.read_parquet(path).to_dicts() == [
+        {"id": 1, "value": None, "extra": None},
+        {"id": 2, "value": None, "extra": None},
+        {"id": 3, "value": 1.5, "extra": "x"},
+    ]
+
+
+def test_partial_last_page_is_read_again(
+    project: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from core.api_extract import STATE_LAYER, Pagination, extract_api_to_parquet
+    from core.storage import read_json
+
+    def run(pages: dict[int, list], filename: str) -> list[int]:
+        serve_pages(monkeypatch, pages)
+        path = extract_api_to_parquet(
+            "https://api.test/items",
+            "bronze",
+            filename,
+            pagination=Pagination(page_size=2),
+            state_key="items",
+        )
+        return pl.read_parquet(path)["id"].to_list()
+
+    first = run({1: [{"id": 1}, {"id": 2}], 2: [{"id": 3}]}, "first.parquet")
+    assert first == [1, 2, 3]
+    assert read_json(STATE_LAYER, "items.json")["position"] == 2
+
+    # Page 2 filled up since, so it is read in full and the run goes on
+    pages = {2: [{"id": 3}, {"id": 4}], 3: [{"id": 5}]}
+    assert run(pages, "second.parquet") == [3, 4, 5]
+    assert read_json(STATE_LAYER, "items.json")["position"] == 3
@@ -0,0 +1,45 @@
+"""The bronze asset template's example, uncommented and run."""
+
+from __future__ import annotations
+
+import importlib
+from pathlib import Path
+
+import polars as pl
+
+from polster.cli import render_asset_files, render_schema
+from polster.sample_schema import dtype_code, sample_schema
+
+
+def uncomment_example(source: str) -> str:
+    """The rendered core module with its commented example enabled."""
+    lines = source.splitlines()
+    start = next(i for i, line in enumerate(lines) if "# TODO: Uncomment" in line)
+    end = next(i for i, line in enumerate(lines) if "# Note: Uncomment" in line)
+    example = [
+        "    " + line.removeprefix("    # ") if line.startswith("    # ") else ""
+        for line in lines[start + 1 : end]
+    ]
+    rest = [line for line in lines[end + 1 :] if "pass  # TODO" not in line]
+    return "\n".join([*lines[:start], *example, *rest])
+
+
+def test_example_writes_with_a_sampled_schema(project: Path, tmp_path: Path) -> None:
+    sample = tmp_path / "orders.csv"
+    sample.write_text("id,name,value,created_at\n1,Alice,10.5,2024-01-01\n")
+    columns = [
+        (name, dtype_code(dtype)) for name, dtype in sample_schema(sample).items()
+    ]
+
+    files = render_asset_files(
+        "bronze", "orders", [], "cpu", project, render_schema(columns)
+    )
+    for path, content in files.items():
+        if path.parent.name == "core":
+            path.write_text(uncomment_example(content), encoding="utf-8")
+    bronze = importlib.import_module("core.bronze_orders")
+
+    df = pl.read_parquet(bronze.extract())
+
+    assert df.columns == ["id", "name", "value", "created_at", "fetched_at"]
+    assert df.height == 3
@@ -0,0 +1,113 @@
+"""The Delta variants of the silver and gold asset templates, uncommented and run."""
+
+from __future__ import annotations
+
+import importlib
+import re
+from datetime import datetime
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from polster.cli import render_asset_files
+
+pytest.importorskip("deltalake")
+
+
+def uncomment_delta_variant(source: str) -> str:
+    """The rendered core module with its example enabled, writing to Delta."""
+    lines = source.splitlines()
+    start = next(i for i, line in enumerate(lines) if "# TODO: Uncomment" in line)
+    end = next(i for i, line in enumerate(lines) if "# Note: Uncomment" in line)
+    example = "\n".join(
+        "    " + line.removeprefix("    # ") if line.startswith("    # ") else ""
+        for line in lines[start + 1 : end]
+    )
+    # Drop the snapshot return so the Delta return after it runs
+    example, dropped = re.subn(
+        r"    return write_parquet\(\n.*?\n    \)\n", "", example, flags=re.S
+    )
+    assert dropped == 1
+    source = "\n".join([*lines[:start], example, *lines[end + 1 :]])
+    source = re.sub(r"\n    pass  # TODO.*\n", "\n", source)
+    return source.replace(
+        "import read_parquet_latest, write_parquet",
+        "import read_parquet_latest, write_delta, write_parquet",
+    )
+
+
+def load_asset(project: Path, layer: str, name: str):
+    files = render_asset_files(layer, name, [], "cpu", project)
+    for path, content in files.items():
+        if path.parent.name == "core":
+            path.write_text(uncomment_delta_variant(content), encoding="utf-8")
+    return importlib.import_module(f"core.{layer}_{name}")
+
+
+def test_silver_delta_variant_merges_and_describes(project: Path) -> None:
+    from core import storage
+
+    silver = load_asset(project, "silver", "orders")
+    bronze = pl.DataFrame(
+        {
+            "id": [1, 2],
+            "created_at": [datetime(2026, 1, 1, 10), datetime(2026, 1, 1, 11)],
+            "value": [10.0, 20.0],
+        }
+    )
+    storage.write_parquet(bronze, "bronze", "bronze_orders_20260101T000000Z.parquet")
+    first = silver.transform()
+
+    changed = pl.DataFrame(
+        {
+            "id": [2, 3],
+            "created_at": [datetime(2026, 1, 2, 10), datetime(2026, 1, 2, 11)],
+            "value": [25.0, 30.0],
+        }
+    )
+    storage.write_parquet(changed, "bronze", "bronze_orders_20260102T000000Z.parquet")
+    second = silver.transform()
+
+    assert isinstance(second, storage.DeltaTablePath)
+    assert (first.version, second.version) == (0, 1)
+    # The table directory can't be read as a parquet file
+    with pytest.raises(pl.exceptions.PolarsError):
+        pl.read_parquet(str(second))
+
+    row_count, columns, preview = storage.describe_output(second)
+    assert row_count == 3
+    assert columns[:3] == ["id", "created_at", "value"]
+    assert preview.sort("id")["value"].to_list() == [10.0, 25.0, 30.0]
+
+    # The version written, not whatever the table holds now
+    assert storage.describe_output(first)[0] == 2
+
+
+def test_gold_delta_variant_describes(project: Path) -> None:
+    from core import storage
+
+    gold = load_asset(project, "gold", "sales")
+    silver = pl.DataFrame({"category": ["a", "a", "b"], "value": [1.0, 2.0, 3.0]})
+    storage.write_parquet(silver, "silver", "silver_sales_20260101T000000Z.parquet")
+
+    path = gold.aggregate()
+
+    row_count, columns, _ = storage.describe_output(path)
+    assert row_count == 2
+    assert {"category", "total_value", "record_count"} <= set(columns)
+
+
+@pytest.mark.parametrize("backend", ["local", "memory"])
+def test_describe_output_reads_snapshots(
+    project: Path, monkeypatch: pytest.MonkeyPatch, backend: str
+) -> None:
+    # Polars can't scan memory:// paths, so those are read through the backend
+    monkeypatch.setenv("STORAGE_BACKEND", backend)
+    from core import storage
+
+    df = pl.DataFrame({"a": range(50)})
+    path = storage.write_parquet(df, "silver", "silver_x_20260101T000000Z.parquet")
+
+    row_count, columns, preview = storage.describe_output(path)
+    assert (row_count, columns, preview.height) == (50, ["a"], 20)
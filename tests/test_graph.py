@@ -0,0 +1,86 @@
+"""Asset dependency graph: levels, critical path and impact analysis."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from polster.cli import app
+from polster.graph import AssetGraph, CycleError
+from polster.index import AssetInfo
+
+
+def asset(function: str, *deps: str) -> AssetInfo:
+    layer = function.split("_", 1)[0]
+    return AssetInfo(
+        function=function,
+        layer=layer,
+        name=function.split("_", 1)[1],
+        description="",
+        file=f"src/orchestration/assets/{layer}/{function}.py",
+        deps=list(deps),
+    )
+
+
+@pytest.fixture
+def graph() -> AssetGraph:
+    return AssetGraph(
+        [
+            asset("bronze_orders", "raw_feed"),
+            asset("bronze_users"),
+            asset("silver_orders", "bronze_orders"),
+            asset("silver_users", "bronze_users"),
+            asset("gold_sales", "silver_orders", "silver_users"),
+        ]
+    )
+
+
+def test_levels_place_each_asset_below_its_deepest_dependency(
+    graph: AssetGraph,
+) -> None:
+    assert graph.topological_levels() == [
+        ["bronze_users", "raw_feed"],
+        ["bronze_orders", "silver_users"],
+        ["silver_orders"],
+        ["gold_sales"],
+    ]
+    assert graph.external == ["raw_feed"]
+    assert graph.critical_path() == [
+        "raw_feed",
+        "bronze_orders",
+        "silver_orders",
+        "gold_sales",
+    ]
+
+
+def test_closures_and_subgraph(graph: AssetGraph) -> None:
+    assert graph.upstream_of("silver_orders") == ["bronze_orders", "raw_feed"]
+    assert graph.downstream_of("bronze_users") == ["silver_users", "gold_sales"]
+
+    sub = graph.subgraph({"silver_users", *graph.upstream_of("silver_users")})
+    assert sub.topological_levels() == [["bronze_users"], ["silver_users"]]
+    with pytest.raises(KeyError):
+        graph.upstream_of("missing")
+
+
+def test_cycles_are_reported() -> None:
+    cyclic = AssetGraph([asset("silver_a", "silver_b"), asset("silver_b", "silver_a")])
+
+    with pytest.raises(CycleError) as info:
+        cyclic.topological_levels()
+    assert info.value.nodes == ["silver_a", "silver_b"]
+
+
+def test_graph_command_rejects_both_directions(
+    project: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(project)
+
+    result = CliRunner().invoke(
+        app, ["graph", "--upstream", "gold_sales", "--downstream", "bronze_users"]
+    )
+
+    assert result.exit_code == 1
+    assert "not both" in result.output
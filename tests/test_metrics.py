@@ -0,0 +1,107 @@
+"""Prometheus metrics built from the spans of traced runs."""
+
+from __future__ import annotations
+
+import json
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+
+def span(span_id: str, name: str, ms: float, parent=None, error=False, **attrs):
+    return {
+        "span_id": span_id,
+        "parent_span_id": parent,
+        "name": name,
+        "duration_ms": ms,
+        "status": "error" if error else "ok",
+        "attributes": attrs,
+    }
+
+
+SPANS = [
+    span("a", "asset.bronze_orders", 2000, asset="bronze_orders"),
+    span("c", "core.extract", 1900, "a"),
+    span("u", "storage.upload", 30, "c", backend="local", bytes=100, rows=10),
+    # The manifest written inside the upload is not counted twice
+    span("m", "storage.upload", 2, "u", backend="local", bytes=50, rows=0),
+    span("s", "sftp.download", 5, "c", status="downloaded", bytes=7),
+    span("k", "sftp.download", 1, "c", status="cached"),
+    span("b", "asset.silver_orders", 700, error=True, asset="silver_orders"),
+    span("d", "storage.upload", 3, "b", backend="local", unchanged=True, bytes=9),
+]
+
+
+@pytest.fixture
+def metrics(project: Path):
+    from core import metrics
+
+    return metrics
+
+
+def test_run_is_folded_into_counters_and_histograms(metrics) -> None:
+    state = metrics.record_run({}, SPANS, False, 2.5, finished_at=100.0)
+    text = metrics.render(state)
+
+    assert "# TYPE polster_asset_duration_seconds histogram" in text
+    assert 'polster_runs_total{result="failure"} 1' in text
+    assert 'polster_asset_runs_total{asset="silver_orders",status="error"} 1' in text
+    assert 'polster_asset_failures_total{asset="silver_orders"} 1' in text
+    assert 'polster_asset_rows_written_total{asset="bronze_orders"} 10' in text
+    assert 'polster_asset_bytes_written_total{asset="bronze_orders"} 100' in text
+    assert 'polster_asset_bytes_read_total{asset="bronze_orders"} 7' in text
+    assert 'polster_cache_requests_total{cache="sftp",result="hit"} 1' in text
+    assert 'polster_cache_requests_total{cache="sftp",result="miss"} 1' in text
+    dedupe = 'polster_cache_requests_total{cache="snapshot_dedupe",result="hit"} 1'
+    assert dedupe in text
+    assert "polster_last_run_timestamp_seconds 100" in text
+    assert "polster_last_run_duration_seconds 2.5" in text
+    assert "polster_last_run_success 0" in text
+    assert text.endswith("\n")
+
+
+def test_histogram_buckets_are_cumulative(metrics) -> None:
+    state = metrics.record_run({}, SPANS, True, 1.0)
+    lines = metrics.render(state).splitlines()
+
+    prefix = 'polster_asset_duration_seconds_bucket{asset="bronze_orders",'
+    buckets = [line for line in lines if line.startswith(prefix)]
+    assert f'{prefix}le="1"}} 0' in buckets
+    assert f'{prefix}le="2.5"}} 1' in buckets
+    assert buckets[-1] == f'{prefix}le="+Inf"}} 1'
+    assert 'polster_asset_duration_seconds_sum{asset="bronze_orders"} 2' in lines
+    assert 'polster_asset_duration_seconds_count{asset="bronze_orders"} 1' in lines
+
+
+def test_label_values_are_escaped(metrics) -> None:
+    state = metrics.record_run(
+        {}, [span("a", "asset.x", 1, asset='we"ird\\name')], True, 1.0
+    )
+
+    assert 'asset="we\\"ird\\\\name"' in metrics.render(state)
+
+
+def test_collect_run_accumulates_and_serves(metrics, tmp_path: Path) -> None:
+    trace = tmp_path / "run.jsonl"
+    trace.write_text("".join(json.dumps({**s, "run_id": "r"}) + "\n" for s in SPANS))
+    state_file = str(tmp_path / "state.json")
+    prom = tmp_path / "polster.prom"
+
+    metrics.collect_run(str(trace), True, 1.0, state_file=state_file)
+    text = metrics.collect_run(
+        str(tmp_path / "missing.jsonl"), False, 1.0, str(prom), state_file
+    )
+
+    assert prom.read_text() == text
+    assert 'polster_runs_total{result="success"} 1' in text
+    assert 'polster_runs_total{result="failure"} 1' in text
+
+    server = metrics.serve_metrics(0, state_file=state_file)
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        with urllib.request.urlopen(url) as response:
+            assert response.read().decode() == text
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,44 @@
+"""Command line handling of the project's run_polster.py."""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def run_polster(project: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    spec = importlib.util.spec_from_file_location(
+        "run_polster", project / "run_polster.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_pool_limits_override_the_defaults(run_polster, project: Path) -> None:
+    from core.settings import parse_pool_limits
+
+    env: dict[str, str] = {}
+    run_polster.apply_concurrency_limits(project, env, ["mysql=2"], None)
+
+    assert parse_pool_limits(env["POLSTER_POOL_LIMITS"]) == {
+        "adls": 8,
+        "mysql": 2,
+        "api": 4,
+        "sftp": 4,
+    }
+
+
+def test_pool_limits_override_the_env_file(run_polster, project: Path) -> None:
+    from core.settings import parse_pool_limits
+
+    env = {"POLSTER_POOL_LIMITS": "adls=2,mysql=1"}
+    run_polster.apply_concurrency_limits(project, env, ["mysql=3"], 5)
+
+    assert parse_pool_limits(env["POLSTER_POOL_LIMITS"]) == {"adls": 2, "mysql": 3}
+    assert env["POLSTER_MAX_CONCURRENT"] == "5"
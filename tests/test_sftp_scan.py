@@ -0,0 +1,105 @@
+"""Scanning downloaded SFTP files into one frame."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+
+import polars as pl
+
+SCHEMA = pl.Schema(
+    {"id": pl.Int64, "amount": pl.Float64, "created_at": pl.Datetime("us")}
+)
+
+
+def test_csv_files_are_parsed_with_the_schema(project: Path, tmp_path: Path) -> None:
+    from core.sftp_extract import scan_files
+
+    first = tmp_path / "a.csv"
+    first.write_text("created_at,id,amount\n2026-01-01T10:00:00,1,5\n")
+    # Columns out of order, one missing and one not in the schema
+    second = tmp_path / "b.csv"
+    second.write_text("id,note,amount\n2,x,2.5\n")
+
+    df = scan_files([str(first), str(second)], "csv", SCHEMA).collect()
+
+    assert df.schema == SCHEMA
+    assert df.to_dicts() == [
+        {"id": 1, "amount": 5.0, "created_at": datetime(2026, 1, 1, 10)},
+        {"id": 2, "amount": 2.5, "created_at": None},
+    ]
+
+
+def test_ndjson_files_are_parsed_with_the_schema(project: Path, tmp_path: Path) -> None:
+    from core.sftp_extract import scan_files
+
+    path = tmp_path / "a.ndjson"
+    path.write_text(
+        '{"id": 1, "amount": 5, "created_at": "2026-01-01T10:00:00"}\n'
+        '{"id": 2, "amount": 2.5, "extra": true}\n'
+    )
+
+    df = scan_files([str(path)], "ndjson", SCHEMA).collect()
+
+    assert df.schema == SCHEMA
+    assert df["created_at"].to_list() == [datetime(2026, 1, 1, 10), None]
+    assert df["amount"].to_list() == [5.0, 2.5]
+
+
+def test_files_are_unioned_without_a_schema(project: Path, tmp_path: Path) -> None:
+    from core.sftp_extract import scan_files
+
+    (tmp_path / "a.csv").write_text("id,amount\n1,5\n")
+    (tmp_path / "b.csv").write_text("id,amount,note\n2,2.5,x\n")
+
+    df = scan_files([str(tmp_path / "a.csv"), str(tmp_path / "b.csv")]).collect()
+
+    assert df.schema == pl.Schema(
+        {"id": pl.Int64, "amount": pl.Float64, "note": pl.String}
+    )
+
+
+def test_unchanged_files_return_the_previous_snapshot(
+    project: Path, tmp_path: Path, monkeypatch
+) -> None:
+    from contextlib import nullcontext
+
+    from core import sftp_extract
+    from core.sftp_extract import DownloadResult, RemoteFile, extract_sftp_to_parquet
+
+    local = tmp_path / "a.csv"
+    local.write_text("id,amount\n1,5\n")
+    remote = RemoteFile("a.csv", "/in/a.csv", size=12, mtime=1)
+    listed: list[RemoteFile] = []
+    monkeypatch.setattr(sftp_extract, "sftp_session", lambda *a, **k: nullcontext())
+    monkeypatch.setattr(sftp_extract, "list_remote_files", lambda *a: listed)
+    monkeypatch.setattr(
+        sftp_extract,
+        "download_files",
+        lambda connect, todo, *a: [
+            DownloadResult(file, str(local), "downloaded", file.size) for file in todo
+        ],
+    )
+
+    def extract(filename: str):
+        return extract_sftp_to_parquet(
+            "host",
+            "user",
+            "/in",
+            "bronze",
+            filename,
+            str(tmp_path),
+            manifest_key="orders",
+        )
+
+    # Nothing on the server yet, so there is no snapshot to point at
+    assert extract("bronze_orders_1.parquet") is None
+
+    listed.append(remote)
+    first = extract("bronze_orders_2.parquet")
+    assert not getattr(first, "unchanged", False)
+
+    second = extract("bronze_orders_3.parquet")
+    assert second == first
+    assert second.unchanged
+    assert pl.read_parquet(second).to_dicts() == [{"id": 1, "amount": 5}]
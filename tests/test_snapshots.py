@@ -0,0 +1,112 @@
+"""Snapshot resolution by name and deduplicated snapshot writes."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+
+@pytest.fixture
+def storage(project: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("STORAGE_BACKEND", "memory")
+    from core import storage
+
+    return storage
+
+
+def write(storage, df: pl.DataFrame, day: int, dedupe: bool = True) -> str:
+    filename = f"bronze_orders_202601{day:02d}T000000Z.parquet"
+    return storage.write_parquet(df, "bronze", filename, dedupe=dedupe)
+
+
+X = pl.DataFrame({"id": [1, 2]})
+Y = pl.DataFrame({"id": [3]})
+
+
+def test_list_snapshots_orders_and_filters(storage) -> None:
+    for name in (
+        "bronze_orders_20260103T000000Z.parquet",
+        "bronze_orders_20260101T000000Z.parquet",
+        "bronze_orders_2026-01-02.parquet",
+        "bronze_orders_daily_20260104T000000Z.parquet",
+    ):
+        storage.write_parquet(X, "bronze", name)
+
+    names = [name for name, _ in storage.list_snapshots("bronze", "bronze_orders_")]
+    # Oldest first, and another table sharing the prefix is left out
+    assert names == [
+        "bronze_orders_20260101T000000Z.parquet",
+        "bronze_orders_2026-01-02.parquet",
+        "bronze_orders_20260103T000000Z.parquet",
+    ]
+    ranged = storage.list_snapshots(
+        "bronze", "bronze_orders_", since="20260102", until="2026-01-03"
+    )
+    assert [timestamp for _, timestamp in ranged] == [
+        datetime(2026, 1, 2, tzinfo=UTC),
+        datetime(2026, 1, 3, tzinfo=UTC),
+    ]
+    assert storage.list_snapshots("bronze", "bronze_orders_", last_n=1) == ranged[-1:]
+    assert storage.list_snapshots("bronze", "bronze_orders_", last_n=0) == []
+
+
+def test_scan_parquet_range_tags_snapshots(storage) -> None:
+    write(storage, X, 1, dedupe=False)
+    write(storage, Y, 2, dedupe=False)
+
+    df = (
+        storage.scan_parquet_range(
+            "bronze", "bronze_orders_", since="20260102", include_snapshot_ts=True
+        )
+        .collect()
+        .to_dicts()
+    )
+    assert df == [{"id": 3, "_snapshot_ts": datetime(2026, 1, 2, tzinfo=UTC)}]
+    with pytest.raises(FileNotFoundError):
+        storage.scan_parquet_range("bronze", "bronze_orders_", since="20270101")
+
+
+def test_unchanged_snapshot_is_not_written_again(storage) -> None:
+    first = write(storage, X, 1)
+    second = write(storage, X, 2)
+
+    assert not first.unchanged
+    assert second.unchanged
+    assert second == first
+    assert second.sha256 == first.sha256
+    assert storage.list_parquet("bronze") == ["bronze_orders_20260101T000000Z.parquet"]
+
+
+def test_dedupe_compares_with_the_newest_snapshot(storage) -> None:
+    write(storage, X, 1)
+    write(storage, Y, 2, dedupe=False)
+
+    # Same content as the last deduplicated write, but Y is the latest now
+    third = write(storage, X, 3)
+
+    assert not third.unchanged
+    assert storage.read_parquet_latest("bronze", "bronze_orders_").equals(X)
+
+
+def test_dedupe_rewrites_a_deleted_snapshot(storage) -> None:
+    write(storage, X, 1)
+    storage.get_backend().delete("bronze", "bronze_orders_20260101T000000Z.parquet")
+
+    assert not write(storage, X, 2).unchanged
+    assert storage.list_parquet("bronze") == ["bronze_orders_20260102T000000Z.parquet"]
+
+
+def test_streamed_writes_dedupe_too(storage) -> None:
+    def stream(day: int) -> str:
+        return storage.write_parquet_batches(
+            iter([X, X]),
+            "bronze",
+            f"bronze_orders_202601{day:02d}T000000Z.parquet",
+            dedupe=True,
+        )
+
+    assert not stream(1).unchanged
+    assert stream(2).unchanged
@@ -0,0 +1,93 @@
+"""Streaming SQL extraction when the types change from batch to batch."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import polars as pl
+
+
+def make_connection(
+    rows: list[tuple], database: str | Path = ":memory:"
+) -> sqlite3.Connection:
+    connection = sqlite3.connect(database)
+    connection.execute("CREATE TABLE t (id INTEGER, note TEXT, amount)")
+    connection.executemany("INSERT INTO t VALUES (?, ?, ?)", rows)
+    connection.commit()
+    return connection
+
+
+def test_later_batches_widen_the_snapshot(project: Path) -> None:
+    from core.sql_extract import extract_query_to_parquet
+
+    # note is NULL in the first batch, amount turns from int to float
+    rows = [(1, None, 10), (2, None, 20), (3, "late", 2.5), (4, None, 7)]
+    path = extract_query_to_parquet(
+        make_connection(rows),
+        "SELECT id, note, amount FROM t ORDER BY id",
+        "bronze",
+        "bronze_t_20260101T000000Z.parquet",
+        batch_size=2,
+    )
+
+    df = pl.read_parquet(path)
+    assert df.schema == pl.Schema(
+        {"id": pl.Int64, "note": pl.String, "amount": pl.Float64}
+    )
+    assert df["note"].to_list() == [None, None, "late", None]
+    assert df["amount"].to_list() == [10.0, 20.0, 2.5, 7.0]
+
+
+def test_columns_only_in_later_batches_are_kept(project: Path) -> None:
+    from core.storage import write_parquet_batches
+
+    batches = [pl.DataFrame({"a": [1]}), pl.DataFrame({"a": [2.5], "b": ["x"]})]
+    path = write_parquet_batches(
+        iter(batches), "bronze", "bronze_x_20260101T000000Z.parquet"
+    )
+
+    assert pl.read_parquet(path).to_dicts() == [
+        {"a": 1.0, "b": None},
+        {"a": 2.5, "b": "x"},
+    ]
+
+
+def dict_rows(cursor: sqlite3.Cursor, row: tuple) -> dict:
+    """Rows as dicts, like pymysql's DictCursor."""
+    return {
+        column[0]: value for column, value in zip(cursor.description, row, strict=True)
+    }
+
+
+def test_parallel_extraction_with_dict_rows(project: Path, tmp_path: Path) -> None:
+    from core.sql_extract import extract_table_to_parquet, key_ranges
+
+    database = tmp_path / "source.db"
+    make_connection([(i, f"n{i}", i * 1.5) for i in range(1, 101)], database).close()
+
+    def connect() -> sqlite3.Connection:
+        # Each worker thread opens its own connection
+        connection = sqlite3.connect(database, check_same_thread=False)
+        connection.row_factory = dict_rows
+        return connection
+
+    assert key_ranges(connect(), "t", "id", 4) == [
+        (1, 26),
+        (26, 51),
+        (51, 76),
+        (76, 101),
+    ]
+    path = extract_table_to_parquet(
+        connect,
+        "t",
+        "bronze",
+        "bronze_t_20260101T000000Z.parquet",
+        key="id",
+        workers=2,
+        batch_size=10,
+    )
+
+    df = pl.read_parquet(path).sort("id")
+    assert df["id"].to_list() == list(range(1, 101))
+    assert df["amount"][-1] == 150.0
@@ -0,0 +1,135 @@
+"""Snapshot lookup and parquet footer row counts for ``polster status``."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from polster.index import AssetInfo
+from polster.status import (
+    FOOTER_READ_SIZE,
+    LocalSnapshotStore,
+    UnsupportedStoreError,
+    collect_status,
+    read_num_rows,
+    snapshot_store,
+)
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def write(path: Path, table, **options) -> bytes:
+    pq.write_table(table, path, **options)
+    return path.read_bytes()
+
+
+def num_rows(data: bytes) -> tuple[int, int]:
+    """Row count and the number of ranged reads it took."""
+    reads = []
+
+    def read_range(offset: int, length: int) -> bytes:
+        reads.append((offset, length))
+        return data[offset : offset + length]
+
+    return read_num_rows(len(data), read_range), len(reads)
+
+
+@pytest.mark.parametrize(
+    ("table", "options"),
+    [
+        (pa.table({"a": list(range(1000))}), {}),
+        # Several row groups, nested and string columns, statistics
+        (
+            pa.table(
+                {
+                    "id": list(range(5000)),
+                    "tags": [["x", "y"]] * 5000,
+                    "point": [{"x": 1.0, "y": None}] * 5000,
+                    "name": ["n"] * 5000,
+                }
+            ),
+            {"row_group_size": 700},
+        ),
+        # Schema metadata and compression are skipped over
+        (
+            pa.table({"a": [1, 2, 3]}).replace_schema_metadata({"k": "v" * 100}),
+            {"compression": "zstd"},
+        ),
+        (pa.table({"a": pa.array([], pa.int64())}), {}),
+    ],
+)
+def test_num_rows_match_pyarrow(tmp_path: Path, table, options) -> None:
+    data = write(tmp_path / "t.parquet", table, **options)
+
+    assert num_rows(data) == (table.num_rows, 1)
+
+
+def test_large_footer_is_fetched_with_a_second_read(tmp_path: Path) -> None:
+    table = pa.table({f"column_{i:04d}": [i, i + 1] for i in range(2000)})
+    data = write(tmp_path / "wide.parquet", table)
+    assert pq.ParquetFile(tmp_path / "wide.parquet").metadata.serialized_size > (
+        FOOTER_READ_SIZE
+    )
+
+    assert num_rows(data) == (2, 2)
+
+
+def test_other_files_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        num_rows(b"not a parquet file at all")
+
+
+class FakeIndex:
+    """The parts of ProjectIndex that collect_status uses."""
+
+    def __init__(self, assets: list[AssetInfo]):
+        self._assets = assets
+
+    def assets(self) -> list[AssetInfo]:
+        return self._assets
+
+    def outputs(self, asset: AssetInfo) -> list[tuple[str, str]]:
+        return [(asset.layer, f"{asset.layer}_{asset.name}_")]
+
+
+def test_latest_snapshot_ignores_assets_sharing_the_prefix(tmp_path: Path) -> None:
+    bronze = tmp_path / "data" / "bronze"
+    bronze.mkdir(parents=True)
+    write(bronze / "bronze_orders_20260101T000000Z.parquet", pa.table({"a": [1]}))
+    write(bronze / "bronze_orders_2026-01-02.parquet", pa.table({"a": [1, 2]}))
+    # Another asset whose name starts with orders_, written later
+    write(bronze / "bronze_orders_items_20260105T000000Z.parquet", pa.table({"a": [1]}))
+    orders = AssetInfo("bronze_orders", "bronze", "orders", "", "orders.py")
+
+    [status] = collect_status(FakeIndex([orders]), LocalSnapshotStore(tmp_path))
+
+    assert status.snapshot.name == "bronze_orders_2026-01-02.parquet"
+    assert status.snapshot.rows == 2
+
+
+@pytest.mark.parametrize(
+    ("env", "expected"),
+    [
+        ({}, "local"),
+        # Unconfigured remote backends fall back to local, as in the project
+        ({"STORAGE_BACKEND": "s3"}, "local"),
+        ({"STORAGE_BACKEND": "s3", "S3_BUCKET": "lake"}, UnsupportedStoreError),
+        ({"STORAGE_BACKEND": "fsspec", "FSSPEC_URL": "gcs://b"}, UnsupportedStoreError),
+        ({"STORAGE_BACKEND": "memory"}, UnsupportedStoreError),
+    ],
+)
+def test_snapshot_store_rejects_backends_it_cannot_read(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, env: dict, expected
+) -> None:
+    for name in ("STORAGE_BACKEND", "S3_BUCKET", "FSSPEC_URL"):
+        monkeypatch.delenv(name, raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+
+    if expected == "local":
+        assert snapshot_store(tmp_path).backend == "local"
+    else:
+        with pytest.raises(expected):
+            snapshot_store(tmp_path)
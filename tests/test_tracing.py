@@ -0,0 +1,68 @@
+"""Spans written by core/tracing.py and the per-asset run summary."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+MS = 1_000_000
+
+
+def record(span_id: str, name: str, start: int, end: int, parent=None, **attrs):
+    return {
+        "run_id": "run-1",
+        "span_id": span_id,
+        "parent_span_id": parent,
+        "name": name,
+        "start_time_unix_nano": start * MS,
+        "end_time_unix_nano": end * MS,
+        "duration_ms": float(end - start),
+        "status": "ok",
+        "attributes": attrs,
+    }
+
+
+def test_summary_counts_concurrent_storage_time_once(
+    project: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    trace = tmp_path / "trace.jsonl"
+    spans = [
+        record("a", "asset.silver_orders", 0, 1000, asset="silver_orders"),
+        # Two downloads in parallel, then one more after a gap
+        record("d1", "storage.download", 100, 400, "a", bytes=10),
+        record("d2", "storage.download", 200, 500, "a", bytes=20),
+        record("d3", "storage.upload", 700, 800, "a", bytes=5, rows=3),
+        # Nested inside the upload: already covered by it
+        record("n", "storage.upload", 710, 790, "d3", bytes=5, rows=3),
+    ]
+    trace.write_text("".join(json.dumps(s) + "\n" for s in spans))
+    monkeypatch.setenv("POLSTER_TRACE_FILE", str(trace))
+    from core.tracing import summarize_run
+
+    [entry] = summarize_run()
+
+    assert entry["name"] == "silver_orders"
+    assert entry["storage_ms"] == 500.0
+    assert entry["compute_ms"] == 500.0
+    assert (entry["bytes"], entry["rows_written"]) == (35, 3)
+
+
+def test_spans_nest_and_are_written_as_json_lines(
+    project: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    trace = tmp_path / "trace.jsonl"
+    monkeypatch.setenv("POLSTER_TRACE", "json")
+    monkeypatch.setenv("POLSTER_TRACE_FILE", str(trace))
+    from core.tracing import load_spans, span
+
+    with span("core.transform") as outer:
+        with span("storage.read", rows=1) as inner:
+            inner.set("bytes", 42)
+        outer.set("done", True)
+
+    inner_span, outer_span = load_spans(str(trace))
+    assert inner_span["parent_span_id"] == outer_span["span_id"]
+    assert inner_span["attributes"] == {"rows": 1, "bytes": 42}
+    assert outer_span["attributes"] == {"done": True}